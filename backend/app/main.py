@@ -1,4 +1,5 @@
 # Standard Library
+import hmac
 import asyncio
 from contextlib import asynccontextmanager
 
@@ -7,7 +8,7 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # FastAPI
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.requests import Request
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -26,18 +27,50 @@ from app.shared.core.database import (
     init_db,
     close_db,
     get_db,
+    get_pool_stats,
     db_healthcheck
 )
 from app.shared.core.redis import (
     init_redis,
-    close_redis
+    close_redis,
+    get_redis_pool_stats
 )
 from app.shared.core.async_mail_client import AsyncEmailClient
+from app.shared.core.query_stats import QueryStatsMiddleware
+from app.shared.tools.security_tools import access_token_cache
 
 # Services
-from app.service.auth.core.security import JWTSecretService
+from app.service.auth.core.security import (
+    JWTSecretService,
+    RedisKeyStore,
+    SharedMemoryKeyStore
+)
 from app.service.auth import router as auth_router
+from app.service.auth import service as auth_service
+from app.service.auth.app.refresh_token_store import (
+    init_refresh_token_store,
+    close_refresh_token_store
+)
+from app.service.auth.app.revocation_list import (
+    init_revocation_list,
+    close_revocation_list
+)
+from app.service.auth.app.retention import init_token_retention
+from app.service.auth.app.rate_limit import (
+    rate_limiter,
+    init_rate_limiter,
+    close_rate_limiter
+)
+from app.service.auth.app.email_verification import (
+    init_email_verification,
+    close_email_verification
+)
 from app.service.accounts import router as accounts_router
+from app.service.accounts.app.cache import (
+    account_cache,
+    init_account_cache,
+    close_account_cache
+)
 
 
 auth_settings = get_auth_settings()
@@ -51,19 +84,53 @@ smtp_runtime = get_smtp_runtime()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # JWT Key Manager
+    # DB
+    await init_db(app, database_runtime)
+
+    # Redis
+    await init_redis(app, redis_runtime)
+
+    # bcrypt 라운드 보정 (호스트 벤치마크, 처음 측정한 값을 Redis로 모든 워커가 공유)
+    if auth_settings.BCRYPT_CALIBRATE:
+        rounds = await auth_service.calibrate_password_hasher(app)
+        logger.info(f"bcrypt rounds: {rounds} (target {auth_settings.BCRYPT_TARGET_VERIFY_MS}ms)")
+
+    # JWT Key Manager (shm: 호스트 내 워커 공유, redis: 여러 노드 공유)
+    key_store = None
+    if auth_settings.SECRET_KEY_STORE == "redis":
+        key_store = RedisKeyStore(
+            app.state.redis_client,
+            auth_settings.secret_key_store_encryption_keys_list
+        )
+    elif auth_settings.SECRET_KEY_STORE == "shm":
+        key_store = SharedMemoryKeyStore(auth_settings.SECRET_KEY_PATH)
     manager = JWTSecretService(
         auth_settings.SECRET_KEY_PATH,
-        auth_settings.SECRET_KEY_ROTATION_DAYS
+        auth_settings.SECRET_KEY_ROTATION_DAYS,
+        algorithm=auth_settings.JWT_ALGORITHM,
+        store=key_store
     )
     await manager.init()
     app.state.jwt_manager = manager
+    logger.info(f"JWT key store: {auth_settings.SECRET_KEY_STORE}")
 
-    # DB
-    await init_db(app, database_runtime)
+    # Refresh Token Store
+    await init_refresh_token_store(app)
 
-    # Redis
-    await init_redis(app, redis_runtime)
+    # Access Token Revocation List
+    await init_revocation_list(app)
+
+    # 로그인 / 인증 메일 요청 제한
+    await init_rate_limiter(app)
+
+    # 이메일 인증 (Redis 저장 + DB 비동기 기록)
+    await init_email_verification(app)
+
+    # /accounts/me 캐시
+    await init_account_cache(app)
+
+    # 만료 토큰 / 인증 코드 정리 작업
+    await init_token_retention(app)
 
     # SMTP
     app.state.smtp = AsyncEmailClient(smtp_runtime)
@@ -75,9 +142,16 @@ async def lifespan(app: FastAPI):
         # Shutdown: 전역 리소스 정리 (순서 및 예외 안전성 강화)
         cleanup_tasks = [
             ("SMTP", app.state.smtp.disconnect),
+            ("RefreshTokenStore", lambda: close_refresh_token_store(app)),
+            ("RevocationList", lambda: close_revocation_list(app)),
+            ("EmailVerification", lambda: close_email_verification(app)),
+            ("RateLimiter", lambda: close_rate_limiter(app)),
+            ("AccountCache", lambda: close_account_cache(app)),
+            ("JWTKeyStore", manager.close),
             ("Redis", lambda: close_redis(app)),
             ("DB", lambda: close_db(app)),
             ("Scheduler", lambda: asyncio.to_thread(manager.scheduler.shutdown, wait=True)),
+            ("PasswordHasher", lambda: asyncio.to_thread(auth_service.password_hasher.shutdown, wait=True)),
         ]
         for name, task in cleanup_tasks:
             try:
@@ -98,6 +172,13 @@ app = FastAPI(
 app.include_router(auth_router)
 app.include_router(accounts_router)
 
+# 요청 단위 SQL 집계 (X-DB-* 헤더, 로그 필드)
+app.add_middleware(
+    QueryStatsMiddleware,
+    headers=database_runtime.query_stats_headers,
+    warn_statements=database_runtime.query_warn_statements,
+)
+
 # CORS 설정 - HTTP 테스트 가능하도록 설정
 app.add_middleware(
     CORSMiddleware,
@@ -115,10 +196,61 @@ async def read_root(
 ):
     """헬스체크 엔드포인트"""
     db_health = await db_healthcheck(db)
-    react_health = request.app.state.redis.ping()
+    try:
+        redis_health = await request.app.state.redis_client.ping()
+    except Exception:
+        redis_health = False
 
     return {
         "status": "ok",
         "database": "ok" if db_health else "error",
-        "redis": "ok" if react_health else "error"
+        "redis": "ok" if redis_health else "error"
     }
+
+
+def verify_metrics_token(request: Request) -> None:
+    """METRICS_TOKEN이 설정되어 있으면 Bearer 토큰 확인"""
+    if not app_settings.METRICS_TOKEN:
+        return
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), app_settings.METRICS_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+
+# 풀 / 캐시 / rate limit 등 내부 상태이므로 설정으로 켠 경우에만 등록
+if app_settings.METRICS_ENABLED:
+    @app.get(
+        "/metrics",
+        description="Runtime Metrics",
+        dependencies=[Depends(verify_metrics_token)],
+        include_in_schema=False
+    )
+    async def read_metrics():
+        """워커 프로세스 단위 런타임 지표"""
+        pool_stats = get_pool_stats(app)
+        replica_pool_stats = get_pool_stats(app, replica=True)
+        redis_pool_stats = get_redis_pool_stats(app)
+        redis_client_cache = getattr(app.state, "redis_client_cache", None)
+        return {
+            "db_pool": pool_stats.model_dump() if pool_stats else None,
+            "db_replica_pool": replica_pool_stats.model_dump() if replica_pool_stats else None,
+            "redis_pool": redis_pool_stats.model_dump() if redis_pool_stats else None,
+            "redis_client_cache": redis_client_cache.stats().model_dump() if redis_client_cache else None,
+            "access_token_cache": access_token_cache.stats().model_dump(),
+            "account_cache": account_cache.stats().model_dump(),
+            "password_hasher": auth_service.password_hasher.stats().model_dump(),
+            "token_retention": (
+                app.state.token_retention.stats().model_dump()
+                if getattr(app.state, "token_retention", None) else None
+            ),
+            "rate_limiter": rate_limiter.stats().model_dump(),
+            "email_verification_drainer": (
+                app.state.email_verification_drainer.stats().model_dump()
+                if getattr(app.state, "email_verification_drainer", None) else None
+            ),
+            "revocation_list": (
+                app.state.revocation_list.stats().model_dump()
+                if getattr(app.state, "revocation_list", None) else None
+            ),
+        }
@@ -0,0 +1,284 @@
+# service/accounts/app/cache.py
+"""
+계정 조회 캐시 (/accounts/me)
+
+직렬화한 AccountResponse를 user_uuid 기준으로 Redis에 TTL과 함께 저장하는 read-through 캐시.
+    - 캐시 미스가 동시에 몰려도 DB 조회는 1회
+        워커 안: user_uuid별 Future 공유 (singleflight)
+        워커 간: SET NX 잠금을 잡은 워커만 조회, 나머지는 잠시 캐시를 기다림
+    - 계정 변경 시 commit 이후 무효화 (after_commit)
+    - 무효화마다 세대(gen) 키를 올리고, 채우기는 세대가 그대로일 때만 기록하여
+      무효화 직전에 읽은 이전 값이 다시 캐시에 들어가지 않도록 함
+      (세대는 복제 지연을 막지 못하므로 loader는 primary에서 읽어야 함)
+    - Redis 오류 시 캐시 없이 DB 조회 (캐시가 조회를 막지 않도록)
+      캐시에 기록하지 않는 조회(캐시 비활성 / Redis 오류)는 read_loader로 replica 사용 가능
+    - Redis 로컬 캐시(ClientSideCache)가 켜져 있으면 적중 시 Redis 왕복도 생략
+    - 값 형식은 codec으로 선택 (기본 JSON: 이 값 크기에서는 msgpack보다 decode가 빠름)
+      읽을 수 없는 형식(codec 변경 직후 등)의 값은 미스로 처리
+"""
+
+# Standard library imports
+import random
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+# Third-party imports
+from fastapi import FastAPI
+from loguru import logger
+from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+from redis.client import NEVER_DECODE
+
+# App imports
+from .schemas import AccountResponse
+
+# Shared imports
+from app.shared.core.redis import ClientSideCache
+from app.shared.core.redis_codec import RedisCodec, JsonCodec, make_codec
+from app.shared.core.settings import get_account_settings
+
+account_settings = get_account_settings()
+
+
+# 세대가 읽었을 때와 같을 때만 기록 (없으면 "0")
+_FILL_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3])
+return 1
+"""
+
+
+class AccountCache:
+    """
+    user_uuid -> codec으로 직렬화한 AccountResponse
+
+    키: accounts:me:<uuid>        캐시 값
+        accounts:me:<uuid>:gen    무효화 세대
+        accounts:me:<uuid>:lock   DB 조회 잠금
+    """
+    KEY_PREFIX = "accounts:me:"
+
+    class Stats(BaseModel):
+        enabled: bool = Field(..., description="캐시 사용 여부")
+        hits: int = Field(..., description="캐시 적중 수")
+        misses: int = Field(..., description="캐시 미스 수")
+        loads: int = Field(..., description="DB 조회 수")
+        coalesced: int = Field(..., description="같은 워커의 진행 중인 조회를 공유한 요청 수")
+        lock_waits: int = Field(..., description="다른 워커의 조회 결과를 기다린 횟수")
+        stale_fills: int = Field(..., description="조회 도중 무효화되어 기록하지 않은 횟수")
+        invalidations: int = Field(..., description="무효화 횟수")
+        errors: int = Field(..., description="Redis 오류 횟수")
+
+    def __init__(
+            self,
+            ttl_seconds: int = 300,
+            lock_ms: int = 2000,
+            lock_wait_ms: int = 200,
+            codec: Optional[RedisCodec] = None
+        ):
+        self.client: Optional[Redis] = None
+        self.codec = codec or JsonCodec(AccountResponse)
+        self.local: Optional[ClientSideCache] = None
+        self.__TTL_MS = ttl_seconds * 1000
+        self.__LOCK_MS = lock_ms
+        self.__LOCK_WAIT_MS = lock_wait_ms
+        self.__inflight: dict[str, asyncio.Future] = {}
+        self.__fill = None
+
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.coalesced = 0
+        self.lock_waits = 0
+        self.stale_fills = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    def bind(self, client: Optional[Redis], local: Optional[ClientSideCache] = None) -> None:
+        """Redis 클라이언트 연결 (None이면 캐시 비활성)"""
+        self.client = client
+        self.local = local if client is not None else None
+        self.__fill = client.register_script(_FILL_SCRIPT) if client is not None else None
+
+    def _key(self, user_uuid: str) -> str:
+        return f"{self.KEY_PREFIX}{user_uuid}"
+
+    def _ttl_ms(self) -> int:
+        """만료 시각이 한꺼번에 몰리지 않도록 TTL에 ±10% 지터"""
+        return int(self.__TTL_MS * random.uniform(0.9, 1.1))
+
+    # ------------------------- 조회 -------------------------
+
+    async def get_or_load(
+            self,
+            user_uuid: str,
+            loader: Callable[[], Awaitable[Optional[AccountResponse]]],
+            read_loader: Optional[Callable[[], Awaitable[Optional[AccountResponse]]]] = None
+        ) -> Optional[AccountResponse]:
+        """
+        캐시 조회, 미스면 loader로 DB 조회 후 저장 (없는 계정은 캐시하지 않음)
+
+        loader: 캐시에 기록할 조회 (primary)
+        read_loader: 캐시에 기록하지 않는 경로에서 쓸 조회 (replica 허용), 없으면 loader
+        """
+        user_uuid = str(user_uuid)
+        read_loader = read_loader or loader
+        if self.client is None:
+            return await read_loader()
+
+        key = self._key(user_uuid)
+        if self.local is not None and (cached := self.local.get(key)) is not None:
+            if (account := self._decode(cached)) is not None:
+                self.hits += 1
+                return account
+
+        epoch = self.local.epoch() if self.local is not None else 0
+        try:
+            cached, generation = await self.client.execute_command(
+                "MGET", key, f"{key}:gen", **{NEVER_DECODE: True}
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Account cache read failed: {e}")
+            return await read_loader()
+
+        if cached is not None and (account := self._decode(cached)) is not None:
+            self.hits += 1
+            if self.local is not None:
+                self.local.set(key, cached, epoch)
+            return account
+        self.misses += 1
+
+        inflight = self.__inflight.get(user_uuid)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self.__inflight[user_uuid] = future
+        try:
+            account = await self._load(key, generation or b"0", loader)
+            future.set_result(account)
+            return account
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 요청이 없어도 경고가 남지 않도록 소비
+            raise
+        finally:
+            self.__inflight.pop(user_uuid, None)
+
+    async def _load(self, key: str, generation: bytes, loader) -> Optional[AccountResponse]:
+        """워커 간 잠금을 잡고 DB 조회, 잠금을 못 잡으면 잠시 캐시를 기다림"""
+        lock_key = f"{key}:lock"
+        try:
+            locked = await self.client.set(lock_key, 1, px=self.__LOCK_MS, nx=True)
+            if not locked:
+                self.lock_waits += 1
+                cached = await self._wait_for_fill(key)
+                if cached is not None and (account := self._decode(cached)) is not None:
+                    return account
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Account cache lock failed: {e}")
+            locked = False
+
+        self.loads += 1
+        try:
+            account = await loader()
+            if account is not None:
+                await self._store(key, generation, account)
+            return account
+        finally:
+            if locked:
+                try:
+                    await self.client.delete(lock_key)
+                except Exception:
+                    pass  # 잠금은 lock_ms 후 자동 만료
+
+    async def _wait_for_fill(self, key: str) -> Optional[bytes]:
+        """다른 워커가 채울 때까지 최대 lock_wait_ms 동안 캐시 확인"""
+        deadline = asyncio.get_running_loop().time() + self.__LOCK_WAIT_MS / 1000
+        delay = 0.01
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(delay)
+            cached = await self.client.execute_command("GET", key, **{NEVER_DECODE: True})
+            if cached is not None:
+                return cached
+            delay = min(delay * 2, 0.05)
+        return None
+
+    def _decode(self, raw: bytes) -> Optional[AccountResponse]:
+        try:
+            return self.codec.decode(raw)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Account cache value could not be decoded ({self.codec.name}): {e}")
+            return None
+
+    async def _store(self, key: str, generation: bytes, account: AccountResponse) -> None:
+        try:
+            stored = await self.__fill(
+                keys=[key, f"{key}:gen"],
+                args=[generation, self.codec.encode(account), self._ttl_ms()],
+            )
+            if not stored:
+                self.stale_fills += 1
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Account cache write failed: {e}")
+
+    # ------------------------- 무효화 -------------------------
+
+    async def invalidate(self, user_uuid: str) -> None:
+        """캐시 삭제 + 세대 증가 (진행 중인 조회가 이전 값을 기록하지 못하게 함)"""
+        if self.client is None:
+            return
+        key = self._key(str(user_uuid))
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.incr(f"{key}:gen")
+                pipe.pexpire(f"{key}:gen", self.__TTL_MS * 2)
+                pipe.delete(key)
+                await pipe.execute()
+            self.invalidations += 1
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Account cache invalidation failed for {user_uuid}: {e}")
+
+    def stats(self) -> Stats:
+        return AccountCache.Stats(
+            enabled=self.client is not None,
+            hits=self.hits,
+            misses=self.misses,
+            loads=self.loads,
+            coalesced=self.coalesced,
+            lock_waits=self.lock_waits,
+            stale_fills=self.stale_fills,
+            invalidations=self.invalidations,
+            errors=self.errors,
+        )
+
+
+account_cache = AccountCache(
+    ttl_seconds=account_settings.CACHE_TTL_SECONDS,
+    lock_ms=account_settings.CACHE_LOCK_MS,
+    lock_wait_ms=account_settings.CACHE_LOCK_WAIT_MS,
+    codec=make_codec(account_settings.CACHE_CODEC, AccountResponse),
+)
+
+
+# -------------------------------- Lifespan --------------------------------
+
+async def init_account_cache(app: FastAPI) -> None:
+    """Lifespan에서 호출: Redis 클라이언트 연결"""
+    if account_settings.CACHE_ENABLED:
+        account_cache.bind(app.state.redis_client, getattr(app.state, "redis_client_cache", None))
+        logger.info(
+            f"Account cache enabled (ttl {account_settings.CACHE_TTL_SECONDS}s, codec {account_cache.codec.name})"
+        )
+
+
+async def close_account_cache(app: FastAPI) -> None:
+    account_cache.bind(None)
@@ -2,12 +2,20 @@
 
 """계정 CRUD 서비스"""
 
+# Standard library imports
+from uuid import UUID
+
 # Third Party imports
+from sqlalchemy import update, case, cast, func, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.types import String
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Shared imports
+from app.shared.core.database import commit_or_flush, after_commit, replica_safe
 from .models import Account
+from .cache import account_cache
 
 async def create_account(
         db: AsyncSession,
@@ -22,43 +30,30 @@ async def create_account(
         user_name=user_name,
         email=email,
         phone_number=phone_number,
+        linked_providers=[],
     )
     db.add(new_account)
-    await db.commit()
-    await db.refresh(new_account)
+    await commit_or_flush(db)
+    await after_commit(db, account_cache.invalidate, user_uuid)
     return new_account
 
 
+@replica_safe
 async def get_account_by_uuid(
         db: AsyncSession,
         user_uuid: str,
     ) -> Account | None:
-    """user_uuid로 계정 조회"""
-    result = await db.execute(
-        select(Account).where(Account.user_uuid == user_uuid)
-    )
-    account = result.scalars().first()
-    return account
-
-
-async def update_account_provider(
-        db: AsyncSession,
-        user_uuid: str,
-        provider: str,
-    ) -> Account | None:
     """
-    계정을 소셜 프로바이더 정보로 업데이트
-    
-    추가시, 기존 것을 같이 보내줘야될 소요 필요함.
+    user_uuid로 계정 조회
+
+    get_read_db 세션이면 replica에서 읽음. /accounts/me 캐시를 채울 때는
+    primary_session으로 호출해야 함 (무효화 직후 지연된 replica 행을 읽으면
+    세대 확인을 통과해 TTL 동안 캐시에 남음)
     """
     result = await db.execute(
-        select(Account).where(Account.user_uuid == user_uuid)
+        select(Account).where(Account.user_uuid == UUID(str(user_uuid)))
     )
     account = result.scalars().first()
-    if account:
-        account.provider = provider
-        await db.commit()
-        await db.refresh(account)
     return account
 
 
@@ -74,29 +69,48 @@ async def update_account_profile_image(
     account = result.scalars().first()
     if account:
         account.profile_image_url = profile_image_url
-        await db.commit()
-        await db.refresh(account)
+        await commit_or_flush(db)
+        await after_commit(db, account_cache.invalidate, user_uuid)
     return account
 
 
+def _append_if_absent(dialect: str, provider: str):
+    """linked_providers에 provider가 없을 때만 추가하는 SQL 식"""
+    if dialect == "sqlite":
+        # 개발용 sqlite: JSON 배열
+        each = func.json_each(Account.linked_providers).table_valued("value")
+        present = select(each.c.value).where(each.c.value == provider).exists()
+        appended = func.json_insert(Account.linked_providers, "$[#]", provider)
+    else:
+        present = Account.linked_providers.any(provider)
+        appended = func.array_append(
+            Account.linked_providers,
+            cast(literal(provider), String),  # asyncpg 파라미터 타입 추론용
+            type_=ARRAY(String)
+        )
+    return case((present, Account.linked_providers), else_=appended)
+
+
 async def append_linked_provider(
         db: AsyncSession,
         user_uuid: str,
         provider: str,
-    ) -> Account | None:
-    """계정에 소셜 프로바이더를 추가로 연결"""
+    ) -> list[str] | None:
+    """
+    계정에 소셜 프로바이더를 추가로 연결하고 연결된 전체 목록 반환
+
+    UPDATE ... SET linked_providers = CASE 포함 여부 ... RETURNING 1회로 처리하므로
+    동시에 연결해도 유실되지 않으며, 이미 연결된 경우에도 그대로 목록을 반환 (멱등).
+    계정이 없으면 None
+    """
     result = await db.execute(
-        select(Account).where(Account.user_uuid == user_uuid)
+        update(Account)
+        .where(Account.user_uuid == UUID(str(user_uuid)))
+        .values(linked_providers=_append_if_absent(db.bind.dialect.name, provider))
+        .returning(Account.linked_providers)
     )
-    account = result.scalars().first()
-    if account:
-        if account.linked_providers:
-            providers = account.linked_providers.split(",")
-            if provider not in providers:
-                providers.append(provider)
-                account.linked_providers = ",".join(providers)
-        else:
-            account.linked_providers = provider
-        await db.commit()
-        await db.refresh(account)
-    return account
\ No newline at end of file
+    providers = result.scalar_one_or_none()
+    await commit_or_flush(db)
+    if providers is not None:
+        await after_commit(db, account_cache.invalidate, user_uuid)
+    return providers
\ No newline at end of file
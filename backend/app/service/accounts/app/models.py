@@ -1,8 +1,8 @@
 # service/accounts/app/models.py
 
 # Third Party imports
-from sqlalchemy import Column, Boolean, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Boolean, String, JSON
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
 
 # Shared imports
 from app.shared.core.database import Base
@@ -17,7 +17,7 @@ class Account(Base):
         user_name: String, 사용자 이름
         phone_number: String, 사용자 전화번호
         email: String, 사용자 이메일 주소
-        link_provider: String, 사용자 소셜 로그인 제공자
+        linked_providers: ARRAY(String), 연결된 소셜 로그인 제공자 목록 (sqlite에서는 JSON)
         is_admin: Boolean, 사용자의 관리자 권한 여부
         is_active: Boolean, 사용자의 활성화 상태
 
@@ -34,5 +34,10 @@ class Account(Base):
     phone_number = Column(String, nullable=True)
     email = Column(String, nullable=False, index=True)
     is_admin = Column(Boolean, default=False)
-    link_provider = Column(String, nullable=True)
+    linked_providers = Column(
+        ARRAY(String).with_variant(JSON(), "sqlite"),
+        nullable=False,
+        default=list,
+        server_default="{}",
+    )
     is_active = Column(Boolean, default=True)
\ No newline at end of file
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from . import schemas, service, exceptions
 
 # Shared imports
-from app.shared.core.database import get_db
+from app.shared.core.database import get_db, get_read_db
 from app.shared.tools.security_tools import get_token, AccessTokenPayload
 
 router = APIRouter(prefix="/accounts")
@@ -29,12 +29,13 @@ async def create_account(
     return {"status": "Account created successfully", "account": new_account}
 
 
-@router.get("/me", description="Get current user's account information")
+@router.get("/me", description="Get current user's account information", response_model=schemas.AccountResponse)
 async def get_current_user_account(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
     token_payload: AccessTokenPayload = Depends(get_token)
 ):
-    user = await service.get_current_user(db, token_payload)
+    user = await service.get_current_user(request, db, token_payload)
     if not user:
         raise exceptions.AccountNotFoundException()
     return user
@@ -48,5 +49,5 @@ async def link_provider(
     token_payload: AccessTokenPayload = Depends(get_token)
 ):
     """구글 OAuth2 계정 연결 처리"""
-    result = await service.link_provider(request, db, form.code, "google", token_payload)
+    result = await service.link_provider(db, form.code, form.provider, token_payload)
     return result
\ No newline at end of file
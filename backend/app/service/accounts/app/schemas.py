@@ -1,5 +1,6 @@
-from pydantic import BaseModel, model_validator, EmailStr
+from pydantic import BaseModel, ConfigDict, model_validator, EmailStr
 from typing import Optional
+from uuid import UUID
 
 PASSWORD_REGEX = r"^(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*])[A-Za-z\d!@#$%^&*]{8,16}$"
 
@@ -37,4 +38,17 @@ class LinkProviderRequest(BaseModel):
         allowed_providers = ["google"]
         if cls.provider not in allowed_providers:
             raise ValueError(f"Provider must be one of {allowed_providers}.")
-        return cls
\ No newline at end of file
+        return cls
+
+
+class AccountResponse(BaseModel):
+    """계정 조회 응답 (/accounts/me 캐시 직렬화 형식)"""
+    model_config = ConfigDict(from_attributes=True)
+
+    user_uuid: UUID
+    user_name: str
+    phone_number: Optional[str] = None
+    email: str
+    linked_providers: list[str] = []
+    is_admin: Optional[bool] = False
+    is_active: Optional[bool] = True
@@ -6,10 +6,16 @@ from datetime import datetime, timezone
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# FastAPI imports
+from fastapi.requests import Request
+
 # App imports
 from . import crud
+from .cache import account_cache
+from .schemas import AccountResponse
 
 # Shared imports
+from app.shared.core.database import unit_of_work, primary_session
 from app.shared.tools.security_tools import AccessTokenPayload
 
 # Auth Service imports (차후 gRPC로 분리 예정)
@@ -32,39 +38,51 @@ async def create_account(
     """
     계정 생성 서비스
 
-    프로필 생성 -> 인증생성
+    인증 사용자 생성 -> 프로필 생성을 한 트랜잭션으로 처리 (중간에 실패하면 전체 rollback)
     """
     logger.info(f"Creating account for user_id: {user_id}")
-    auth_user = await create_auth_user(
-        db=db,
-        user_id=user_id,
-        password=password,
-        email=email,
-        email_token=email_token,
-    )
-
-    user_uuid = auth_user.user_uuid
-
-    new_account = await crud.create_account(
-        db=db,
-        user_name=user_name,
-        email=email,
-        user_uuid=user_uuid,
-        phone_number=phone_number
-    )
+    async with unit_of_work(db):
+        auth_user = await create_auth_user(
+            db=db,
+            user_id=user_id,
+            password=password,
+            email=email,
+            email_token=email_token,
+        )
+
+        new_account = await crud.create_account(
+            db=db,
+            user_name=user_name,
+            email=email,
+            user_uuid=auth_user.user_uuid,
+            phone_number=phone_number
+        )
     logger.info(f"Account created successfully for user_id: {user_id}")
     return new_account
 
 
 async def get_current_user(
+        request: Request,
         db: AsyncSession,
         token_payload: AccessTokenPayload
-    ):
-    result = await crud.get_account_by_uuid(
-        db=db,
-        user_uuid=token_payload.sub
-    )
-    return result
+    ) -> AccountResponse | None:
+    """
+    현재 사용자 계정 조회 (Redis read-through 캐시)
+
+    캐시를 채우는 조회는 primary, 캐시를 거치지 않는 조회는 db 세션(get_read_db면 replica)
+    """
+    async def read(session: AsyncSession) -> AccountResponse | None:
+        account = await crud.get_account_by_uuid(
+            db=session,
+            user_uuid=token_payload.sub
+        )
+        return AccountResponse.model_validate(account) if account else None
+
+    async def load() -> AccountResponse | None:
+        async with primary_session(request, db) as session:
+            return await read(session)
+
+    return await account_cache.get_or_load(token_payload.sub, load, read_loader=lambda: read(db))
 
 
 async def link_provider(
@@ -91,19 +109,22 @@ async def link_provider(
         
     user_uuid = token_payload.sub
 
-    await link_oauth_account(
-        db=db,
-        user_uuid=user_uuid,
-        provider=provider,
-        provider_id=provider_id
-    )
-
-    await crud.append_linked_provider(
-        db=db,
-        user_uuid=user_uuid,
-        provider=provider
-    )
+    # OAuth 계정 연결과 계정의 제공자 목록 갱신을 한 트랜잭션으로 처리
+    async with unit_of_work(db):
+        await link_oauth_account(
+            db=db,
+            user_uuid=user_uuid,
+            provider=provider,
+            provider_id=provider_id
+        )
+
+        linked_providers = await crud.append_linked_provider(
+            db=db,
+            user_uuid=user_uuid,
+            provider=provider
+        )
 
     return {
-        'status': True
+        'status': True,
+        'linked_providers': linked_providers
     }
\ No newline at end of file
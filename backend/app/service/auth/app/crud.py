@@ -1,8 +1,14 @@
 from datetime import datetime, timezone
 
+from uuid import UUID
+from sqlalchemy import update, insert, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.shared.core.database import commit_or_flush
+
 from .models import (
     AuthUser,
     AuthOAuthAccount, 
@@ -37,7 +43,7 @@ async def existing_user_id(db: AsyncSession, user_id: str):
     return user is not None
 
 async def get_user_by_user_id(db: AsyncSession, user_id: str):
-    """사용자 아이디로 사용자 조회"""
+    """사용자 아이디로 사용자 조회 (로그인 / 비밀번호 확인용이므로 항상 primary)"""
     result = await db.execute(
         select(AuthUser).where(
             AuthUser.user_id == user_id
@@ -46,15 +52,26 @@ async def get_user_by_user_id(db: AsyncSession, user_id: str):
     user = result.scalars().first()
     return user
 
+async def update_user_password(db: AsyncSession, user_uuid: str, hashed_password: str) -> None:
+    """사용자 비밀번호 해시 갱신"""
+    await db.execute(
+        update(AuthUser)
+        .where(AuthUser.user_uuid == user_uuid)
+        .values(password=hashed_password)
+    )
+    await db.commit()
+
 async def deactivate_refresh_token(
         db: AsyncSession, 
         refresh_token: str | None = None,
         rotate: bool = False
         ) -> None:
     """리프래시 토큰 비활성화"""
+    if not refresh_token:
+        return None
     result = await db.execute(
         select(AuthRefreshToken).where(
-            AuthRefreshToken.refresh_token == refresh_token,
+            AuthRefreshToken.refresh_token == RefreshTokenService.digest(refresh_token),
             AuthRefreshToken.is_active == True
         )
     )
@@ -65,6 +82,7 @@ async def deactivate_refresh_token(
         return None
 
     db_token.is_active = False
+    db_token.deactivated_at = datetime.now(timezone.utc)
     db.add(db_token)
     await db.commit()
 
@@ -83,7 +101,7 @@ async def issue_refresh_token(
     """
     # 새로운 리프래시 토큰 생성
     db_refresh_token = AuthRefreshToken(
-        refresh_token=token.token,
+        refresh_token=token.digest,
         user_uuid=user_uuid,
         expires_at=ts_to_dt(token.expires_at),
         created_at=ts_to_dt(token.created_at),
@@ -94,14 +112,68 @@ async def issue_refresh_token(
     await db.commit()
     await db.refresh(db_refresh_token)
 
+async def rotate_refresh_token(
+        db: AsyncSession,
+        old_refresh_token: str | None,
+        user_uuid: str,
+        token: RefreshTokenService.TokenResponse,
+        ip_address: str = None,
+        user_agent: str = None
+    ) -> bool:
+    """
+    리프래시 토큰 회전
+
+    UPDATE ... RETURNING 으로 활성/미만료/소유자 일치 토큰을 소비하고,
+    같은 트랜잭션에서 새 토큰을 INSERT 후 1회 커밋.
+    소비할 토큰이 없으면 롤백 후 False 반환 (동시 재사용 시 한 요청만 성공)
+    """
+    if not old_refresh_token:
+        return False
+    try:
+        owner_uuid = UUID(str(user_uuid))
+    except ValueError:
+        return False
+
+    now = datetime.now(timezone.utc)
+    result = await db.execute(
+        update(AuthRefreshToken)
+        .where(
+            AuthRefreshToken.refresh_token == RefreshTokenService.digest(old_refresh_token),
+            AuthRefreshToken.user_uuid == owner_uuid,
+            AuthRefreshToken.is_active == True,
+            AuthRefreshToken.expires_at > now
+        )
+        .values(is_active=False, deactivated_at=now)
+        .returning(AuthRefreshToken.refresh_token)
+    )
+    if result.first() is None:
+        await db.rollback()
+        return False
+
+    await db.execute(
+        insert(AuthRefreshToken).values(
+            refresh_token=token.digest,
+            user_uuid=owner_uuid,
+            expires_at=ts_to_dt(token.expires_at),
+            created_at=ts_to_dt(token.created_at),
+            ip_address=ip_address,
+            user_agent=user_agent,
+            is_active=True
+        )
+    )
+    await db.commit()
+    return True
+
 async def get_refresh_token(
         db: AsyncSession,
         refresh_token: str
     ) -> AuthRefreshToken | None:
     """리프래시 토큰 조회"""
+    if not refresh_token:
+        return None
     result = await db.execute(
         select(AuthRefreshToken).where(
-            AuthRefreshToken.refresh_token == refresh_token,
+            AuthRefreshToken.refresh_token == RefreshTokenService.digest(refresh_token),
             AuthRefreshToken.is_active == True
         )
     )
@@ -143,56 +215,24 @@ async def is_email_verified(db: AsyncSession, token: str) -> str | None:
     return None
 
 
-async def save_email_verification_code(
-        db: AsyncSession,
-        email: str,
-        token: str,
-        code: str,
-        expires_at: int
-    ) -> None:
-    """이메일 인증 코드 저장"""
-    db_code = AuthEmailVerification(
-        token=token,
-        code=code,
-        email=email,
-        expires_at=ts_to_dt(expires_at)
-    )
-    db.add(db_code)
-    await db.commit()
-
+async def upsert_email_verifications(db: AsyncSession, rows: list[dict]) -> None:
+    """
+    이메일 인증 감사 기록 일괄 저장 (EmailVerificationDrainer)
 
-async def update_email_verification_code_as_verified(db: AsyncSession, token: str) -> None:
-    """이메일 인증 코드 검증 처리"""
-    result = await db.execute(
-        select(AuthEmailVerification).where(
-            AuthEmailVerification.token == token,
-            AuthEmailVerification.is_used == False,
-            AuthEmailVerification.is_verified == False
-        )
-    )
-    db_code = result.scalars().first()
-    if not db_code:
+    같은 토큰이 이미 있으면 is_verified / is_used를 OR로 합침 (이벤트 순서와 무관하게 같은 결과)
+    """
+    if not rows:
         return
-
-    db_code.is_verified = True
-    db.add(db_code)
-    await db.commit()
-
-
-async def update_email_verification_code_as_used(db: AsyncSession, token: str) -> None:
-    """이메일 인증 코드 사용 처리"""
-    result = await db.execute(
-        select(AuthEmailVerification).where(
-            AuthEmailVerification.token == token,
-        )
+    dialect_insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    stmt = dialect_insert(AuthEmailVerification).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AuthEmailVerification.token],
+        set_={
+            "is_verified": or_(AuthEmailVerification.is_verified, stmt.excluded.is_verified),
+            "is_used": or_(AuthEmailVerification.is_used, stmt.excluded.is_used),
+        }
     )
-    db_code = result.scalars().first()
-    if not db_code:
-        return
-
-    db_code.is_used = True
-    db.add(db_code)
-    await db.commit()
+    await db.execute(stmt)
 
 
 # OAuth CRUD Functions
@@ -245,8 +285,7 @@ async def link_oauth_account(
         provider_id=provider_id
     )
     db.add(db_oauth_account)
-    await db.commit()
-    await db.refresh(db_oauth_account)
+    await commit_or_flush(db)
     return db_oauth_account
 
 async def get_user_by_provider_id(
@@ -257,21 +296,16 @@ async def get_user_by_provider_id(
     """
     로그인용 CRUD
     
-    provider_id -> DB 조회 후 연결된 User 정보 반환
+    provider_id -> DB 조회 후 연결된 User 정보 반환 (JOIN 1회)
     """
     result = await db.execute(
-        select(AuthOAuthAccount).where(
+        select(AuthUser)
+        .join(AuthOAuthAccount, AuthOAuthAccount.user_uuid == AuthUser.user_uuid)
+        .where(
             AuthOAuthAccount.provider == provider,
             AuthOAuthAccount.provider_id == provider_id
         )
     )
-    user_uuid = result.scalars().first()
-    
-    result = await db.execute(
-        select(AuthUser).where(
-            AuthUser.user_uuid == user_uuid.user_uuid
-        )
-    )
     user = result.scalars().first()
 
     return user
\ No newline at end of file
@@ -0,0 +1,396 @@
+# auth/app/email_verification.py
+"""
+이메일 인증 저장소
+
+진행 중인 인증(발급 -> 인증 -> 가입에 사용)의 기준 저장소는 Redis.
+auth_email_verification 테이블은 감사 기록용으로, 상태가 바뀔 때마다 Redis Stream에
+이벤트를 남기고 백그라운드 작업(EmailVerificationDrainer)이 모아서 DB에 기록 (write-behind).
+    - 발급 / 인증 요청 경로에서 DB commit 제거
+    - 상태 변경과 이벤트 기록은 Lua 스크립트 / MULTI로 원자적으로 처리
+    - 이벤트는 ACK 전까지 Redis에 남으므로 워커가 종료되어도 유실되지 않음 (at-least-once)
+"""
+
+# Standard library imports
+import os
+import time
+import socket
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+# Third-party imports
+from fastapi import FastAPI
+from loguru import logger
+from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+# App imports
+from . import crud
+from ..core.security.email_token import EmailTokenManager
+
+# Shared imports
+from app.shared.core.settings import get_email_verify_settings
+
+email_verify_settings = get_email_verify_settings()
+
+
+# KEYS[1]=인증 키, KEYS[2]=이벤트 스트림, ARGV[1]=스트림 최대 길이, ARGV[2]=토큰
+_EMIT = """
+local function emit(state)
+    local f = redis.call('HMGET', KEYS[1], 'email', 'code', 'expires_at', 'created_at')
+    redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[1], '*',
+        'token', ARGV[2], 'email', f[1], 'code', f[2],
+        'expires_at', f[3], 'created_at', f[4], 'state', state)
+end
+"""
+
+# ARGV[3]=인증 완료 후 TTL(초), ARGV[4]=입력 코드, ARGV[5]=실패 허용 횟수
+# 1: 인증 완료, 0: 없음 / 이미 처리됨, -1: 코드 불일치, -2: 실패 횟수 초과로 폐기
+_VERIFY_SCRIPT = _EMIT + """
+if redis.call('HGET', KEYS[1], 'state') ~= 'pending' then
+    return 0
+end
+if redis.call('HGET', KEYS[1], 'code') ~= ARGV[4] then
+    if redis.call('HINCRBY', KEYS[1], 'attempts', 1) >= tonumber(ARGV[5]) then
+        redis.call('DEL', KEYS[1])
+        return -2
+    end
+    return -1
+end
+redis.call('HSET', KEYS[1], 'state', 'verified')
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+emit('verified')
+return 1
+"""
+
+# ARGV[1]=claim id
+_CLAIM_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'state') ~= 'verified' then
+    return false
+end
+redis.call('HSET', KEYS[1], 'state', 'claimed', 'claim', ARGV[1])
+return redis.call('HGET', KEYS[1], 'email')
+"""
+
+# ARGV[3]=claim id
+_COMPLETE_SCRIPT = _EMIT + """
+if redis.call('HGET', KEYS[1], 'claim') ~= ARGV[3] then
+    return 0
+end
+emit('used')
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+# ARGV[1]=claim id
+_RELEASE_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'claim') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'state', 'verified')
+redis.call('HDEL', KEYS[1], 'claim')
+return 1
+"""
+
+
+class EmailVerificationStore:
+    """
+    Redis 이메일 인증 상태
+
+    키: auth:email:<token> (hash: email, code, expires_at, created_at, state[, attempts, claim])
+    상태: pending -> verified -> claimed(가입 트랜잭션 진행 중) -> 삭제(used 이벤트)
+          pending에서 코드를 max_attempts번 틀리면 삭제
+    스트림: auth:email:events (DB 기록 대기 이벤트)
+    """
+    KEY_PREFIX = "auth:email:"
+    STREAM = "auth:email:events"
+
+    VERIFIED = "verified"
+    NOT_FOUND = "not_found"
+    CODE_MISMATCH = "code_mismatch"
+    TOO_MANY_ATTEMPTS = "too_many_attempts"
+
+    def __init__(
+            self,
+            verified_ttl_seconds: int = 3600,
+            stream_maxlen: int = 100000,
+            max_attempts: int = 5
+        ):
+        self.client: Optional[Redis] = None
+        self.__VERIFIED_TTL = verified_ttl_seconds
+        self.__STREAM_MAXLEN = stream_maxlen
+        self.__MAX_ATTEMPTS = max_attempts
+
+    def bind(self, client: Optional[Redis]) -> None:
+        self.client = client
+        if client is not None:
+            self.__verify = client.register_script(_VERIFY_SCRIPT)
+            self.__claim = client.register_script(_CLAIM_SCRIPT)
+            self.__complete = client.register_script(_COMPLETE_SCRIPT)
+            self.__release = client.register_script(_RELEASE_SCRIPT)
+
+    def _key(self, token: str) -> str:
+        return f"{self.KEY_PREFIX}{token}"
+
+    async def create(self, verify: EmailTokenManager.EmailVerifyResponse) -> None:
+        """새 인증 저장 + pending 이벤트"""
+        fields = {
+            "email": verify.email,
+            "code": verify.code,
+            "expires_at": verify.expires_at,
+            "created_at": verify.created_at,
+        }
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(verify.token), mapping={**fields, "state": "pending"})
+            pipe.expire(self._key(verify.token), verify.expires_in)
+            pipe.xadd(
+                self.STREAM,
+                {"token": verify.token, **fields, "state": "pending"},
+                maxlen=self.__STREAM_MAXLEN,
+                approximate=True,
+            )
+            await pipe.execute()
+
+    async def verify(self, token: str, code: str) -> str:
+        """
+        코드 비교 / 실패 횟수 기록 / verified 전환을 스크립트 1회(왕복 1회)로 처리
+
+        동시에 여러 번 제출해도 pending에서 전환되는 요청은 하나뿐.
+        VERIFIED / NOT_FOUND / CODE_MISMATCH / TOO_MANY_ATTEMPTS 반환
+        """
+        result = await self.__verify(
+            keys=[self._key(token), self.STREAM],
+            args=[self.__STREAM_MAXLEN, token, self.__VERIFIED_TTL, code, self.__MAX_ATTEMPTS],
+        )
+        return {
+            1: self.VERIFIED,
+            -1: self.CODE_MISMATCH,
+            -2: self.TOO_MANY_ATTEMPTS,
+        }.get(int(result), self.NOT_FOUND)
+
+    async def claim(self, token: str, claim_id: str) -> Optional[str]:
+        """
+        인증 완료된 토큰을 가입에 사용하도록 점유하고 이메일 반환
+
+        가입 트랜잭션이 commit 되면 complete, rollback 되면 release 호출
+        """
+        return await self.__claim(keys=[self._key(token)], args=[claim_id])
+
+    async def complete(self, token: str, claim_id: str) -> None:
+        """점유한 토큰을 사용 완료 처리 (used 이벤트 기록 후 삭제)"""
+        await self.__complete(
+            keys=[self._key(token), self.STREAM],
+            args=[self.__STREAM_MAXLEN, token, claim_id],
+        )
+
+    async def release(self, token: str, claim_id: str) -> None:
+        """점유 취소 (가입 실패 시 같은 토큰으로 다시 가입 가능)"""
+        await self.__release(keys=[self._key(token)], args=[claim_id])
+
+
+email_verification_store = EmailVerificationStore(
+    verified_ttl_seconds=email_verify_settings.VERIFIED_TOKEN_EXPIRE_MINUTES * 60,
+    stream_maxlen=email_verify_settings.STREAM_MAXLEN,
+    max_attempts=email_verify_settings.VERIFY_MAX_ATTEMPTS,
+)
+
+
+# -------------------------------- Drainer --------------------------------
+
+class EmailVerificationDrainer:
+    """
+    auth:email:events 스트림을 consumer group으로 읽어 auth_email_verification에 배치 기록
+
+    워커마다 consumer 하나. 같은 토큰의 이벤트가 여러 워커에 나뉘어 순서가 바뀌어도
+    upsert에서 is_verified / is_used를 OR로 합치므로 결과는 같음.
+    DB 기록이 성공한 이벤트만 ACK 하고, 종료된 워커가 ACK 하지 못한 이벤트는
+    claim_idle_seconds 이후 다른 워커가 가져와 기록.
+    """
+    GROUP = "auth-email-drainer"
+    IDLE_SLEEP_SECONDS = 0.05
+
+    class Stats(BaseModel):
+        events: int = Field(..., description="기록한 이벤트 수")
+        rows_written: int = Field(..., description="upsert 한 행 수")
+        batches: int = Field(..., description="배치 수")
+        reclaimed: int = Field(..., description="다른 consumer에게서 가져온 이벤트 수")
+        failures: int = Field(..., description="실패 횟수")
+        last_batch_at: Optional[int] = Field(None, description="마지막 배치 시각 (timestamp)")
+
+    def __init__(
+            self,
+            client: Redis,
+            session_maker,
+            batch_size: int = 500,
+            block_ms: int = 1000,
+            claim_idle_seconds: int = 60
+        ):
+        self.client = client
+        self.__session_maker = session_maker
+        self.__BATCH_SIZE = batch_size
+        self.__BLOCK_MS = max(block_ms, 1)  # 0은 무한 대기
+        self.__CLAIM_IDLE_MS = claim_idle_seconds * 1000
+        self.__consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self.__task: Optional[asyncio.Task] = None
+
+        self.events = 0
+        self.rows_written = 0
+        self.batches = 0
+        self.reclaimed = 0
+        self.failures = 0
+        self.last_batch_at: Optional[int] = None
+
+    async def _ensure_group(self) -> None:
+        try:
+            await self.client.xgroup_create(
+                EmailVerificationStore.STREAM, self.GROUP, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _read(self, stream_id: str, block: Optional[int] = None) -> list:
+        response = await self.client.xreadgroup(
+            self.GROUP,
+            self.__consumer,
+            {EmailVerificationStore.STREAM: stream_id},
+            count=self.__BATCH_SIZE,
+            block=block,
+        )
+        return response[0][1] if response else []
+
+    async def _reclaim(self) -> list:
+        """오래 ACK 되지 않은 다른 consumer의 이벤트 가져오기"""
+        _, entries, _ = await self.client.xautoclaim(
+            EmailVerificationStore.STREAM,
+            self.GROUP,
+            self.__consumer,
+            min_idle_time=self.__CLAIM_IDLE_MS,
+            start_id="0-0",
+            count=self.__BATCH_SIZE,
+        )
+        self.reclaimed += len(entries)
+        return entries
+
+    @staticmethod
+    def _to_rows(entries: list) -> list[dict]:
+        """이벤트를 토큰별 행 하나로 합침 (한 INSERT 안에서 같은 키를 두 번 갱신할 수 없음)"""
+        rows: dict[str, dict] = {}
+        for _, fields in entries:
+            if not fields or not fields.get("token") or not fields.get("email"):
+                continue
+            state = fields.get("state")
+            row = rows.setdefault(fields["token"], {
+                "token": fields["token"],
+                "email": fields["email"],
+                "code": fields["code"],
+                "expires_at": datetime.fromtimestamp(int(fields["expires_at"]), tz=timezone.utc),
+                "created_at": datetime.fromtimestamp(int(fields["created_at"]), tz=timezone.utc),
+                "is_verified": False,
+                "is_used": False,
+            })
+            row["is_verified"] = row["is_verified"] or state in ("verified", "used")
+            row["is_used"] = row["is_used"] or state == "used"
+        return list(rows.values())
+
+    async def _flush(self, entries: list) -> None:
+        rows = self._to_rows(entries)
+        if rows:
+            async with self.__session_maker() as session:
+                await crud.upsert_email_verifications(session, rows)
+                await session.commit()
+
+        ids = [entry_id for entry_id, _ in entries]
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.xack(EmailVerificationStore.STREAM, self.GROUP, *ids)
+            pipe.xdel(EmailVerificationStore.STREAM, *ids)
+            await pipe.execute()
+
+        self.events += len(entries)
+        self.rows_written += len(rows)
+        self.batches += 1
+        self.last_batch_at = int(time.time())
+
+    async def _run(self) -> None:
+        group_ready = False
+        read_pending = True  # 시작 / 실패 후에는 자신의 미처리(ACK 전) 이벤트부터
+        next_reclaim = 0.0
+        while True:
+            try:
+                if not group_ready:
+                    await self._ensure_group()
+                    group_ready = True
+
+                if time.monotonic() >= next_reclaim:
+                    next_reclaim = time.monotonic() + self.__CLAIM_IDLE_MS / 2000
+                    if await self._reclaim():
+                        read_pending = True
+
+                if read_pending:
+                    entries = await self._read("0")
+                    read_pending = bool(entries)
+                else:
+                    entries = await self._read(">", block=self.__BLOCK_MS)
+
+                if entries:
+                    await self._flush(entries)
+                elif not read_pending:
+                    # BLOCK 없이 즉시 빈 응답이 오는 환경(프록시 등)에서 busy loop 방지
+                    await asyncio.sleep(self.IDLE_SLEEP_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                group_ready = "NOGROUP" not in str(e) and group_ready
+                read_pending = True
+                logger.error(f"Email verification drain failed, retrying: {e}")
+                await asyncio.sleep(1)
+
+    def start(self) -> None:
+        if self.__task is None:
+            self.__task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """중단 (ACK 전 이벤트는 Redis에 남아 다음 실행 또는 다른 워커가 기록)"""
+        if self.__task is None:
+            return
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+    def stats(self) -> Stats:
+        return EmailVerificationDrainer.Stats(
+            events=self.events,
+            rows_written=self.rows_written,
+            batches=self.batches,
+            reclaimed=self.reclaimed,
+            failures=self.failures,
+            last_batch_at=self.last_batch_at,
+        )
+
+
+# -------------------------------- Lifespan --------------------------------
+
+async def init_email_verification(app: FastAPI) -> None:
+    """Lifespan에서 호출: 저장소에 Redis 연결 후 DB 기록 작업 시작"""
+    email_verification_store.bind(app.state.redis_client)
+    drainer = EmailVerificationDrainer(
+        app.state.redis_client,
+        app.state.async_session_maker,
+        batch_size=email_verify_settings.DRAIN_BATCH_SIZE,
+        block_ms=email_verify_settings.DRAIN_BLOCK_MS,
+        claim_idle_seconds=email_verify_settings.DRAIN_CLAIM_IDLE_SECONDS,
+    )
+    drainer.start()
+    app.state.email_verification_drainer = drainer
+
+
+async def close_email_verification(app: FastAPI) -> None:
+    drainer: Optional[EmailVerificationDrainer] = getattr(app.state, "email_verification_drainer", None)
+    if drainer is not None:
+        await drainer.stop()
+    email_verification_store.bind(None)
@@ -1 +1,33 @@
-from fastapi import HTTPException, status
\ No newline at end of file
+# Http Exceptions for auth module
+
+from fastapi import HTTPException, status
+from enum import Enum
+
+
+class ErrorCode(str, Enum):
+    # 요청 제한 관련
+    # 허용 횟수 초과
+    TooManyRequests = "TOO_MANY_REQUESTS"
+
+
+class BaseHTTPException(HTTPException):
+    """모든 커스텀 예외의 공통 부모"""
+    def __init__(self, code: ErrorCode, message: str, status_code: int, headers: dict | None = None):
+        super().__init__(
+            status_code=status_code,
+            detail={
+                "code": code.value,
+                "message": message
+            },
+            headers=headers
+        )
+
+
+class RateLimitExceededException(BaseHTTPException):
+    def __init__(self, retry_after: int, message: str = "Too many requests. Please try again later."):
+        super().__init__(
+            code=ErrorCode.TooManyRequests,
+            message=message,
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(retry_after)}
+        )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Boolean, String, DateTime, UniqueConstraint
+from sqlalchemy import Column, Boolean, String, DateTime, LargeBinary, UniqueConstraint, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from uuid import uuid4
@@ -37,24 +37,31 @@ class AuthRefreshToken(Base):
     리프래시 토큰 로깅 및 검증용 모델
 
     Columns:
-        refresh_token: String, 기본 키로 사용되는 리프래시 토큰
+        refresh_token: LargeBinary(32), 기본 키로 사용되는 리프래시 토큰의 SHA-256 digest
+                       (클라이언트 토큰 <-> digest 변환은 RefreshTokenService.digest)
         user_uuid: UUID, 토큰이 발급된 사용자 식별자
         expires_at: DateTime, 토큰 만료 시간
         created_at: DateTime, 토큰 생성 시간
         user_agent: String, 토큰이 발급된 클라이언트의 사용자 에이전트
         ip_address: String, 토큰이 발급된 클라이언트의 IP 주소
         is_active: Boolean, 토큰 활성화 여부
+        deactivated_at: DateTime, 회전 / 폐기로 비활성화된 시간 (보존 정리 기준)
     """
 
     __tablename__ = 'auth_refresh_token'
 
-    refresh_token = Column(String, nullable=False, primary_key=True, unique=True)
+    refresh_token = Column(LargeBinary(32), nullable=False, primary_key=True)
     user_uuid = Column(UUID(as_uuid=True), nullable=False, index=True)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # 보존 정리용
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     user_agent = Column(String)
     ip_address = Column(String)
-    is_active = Column(Boolean, default=True)  # 토큰 활성화 여부 
+    is_active = Column(Boolean, default=True)  # 토큰 활성화 여부
+    deactivated_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
+    __table_args__ = (
+        CheckConstraint("length(refresh_token) = 32", name="ck_auth_refresh_token_digest_size"),
+    )
 
 
 class AuthOAuthAccount(Base):
@@ -108,7 +115,7 @@ class AuthEmailVerification(Base):
     token = Column(String, nullable=False, primary_key=True)
     code = Column(String, nullable=False, index=True)
     email = Column(String, nullable=False, index=True)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # 보존 정리용
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     is_verified = Column(Boolean, default=False)
     is_used = Column(Boolean, default=False)
@@ -0,0 +1,194 @@
+# auth/app/rate_limit.py
+"""
+요청 제한 (sliding window)
+
+bcrypt 검증(/auth/token)과 SMTP 발송(/auth/email)처럼 비싼 요청을
+클라이언트 IP / 사용자 아이디 / 이메일 주소별로 제한.
+    - Redis ZSET sliding log, 여러 키 확인과 기록을 Lua 스크립트 1회로 원자적으로 처리
+    - 라우터에서 DB 조회 / 해시 / 메일 발송 전에 확인하고, 초과 시 429 + Retry-After
+    - 거절된 요청은 기록하지 않음 (계속 요청해도 윈도가 늘어나지 않음)
+    - Redis 오류 시 제한 없이 통과 (fail-open)
+"""
+
+# Standard library imports
+import math
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
+from uuid import uuid4
+
+# Third-party imports
+from fastapi import FastAPI
+from fastapi.requests import Request
+from loguru import logger
+from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+
+# App imports
+from .exceptions import RateLimitExceededException
+from .service import _get_client_ip
+
+# Shared imports
+from app.shared.core.settings import get_auth_settings
+
+auth_settings = get_auth_settings()
+
+
+# KEYS[i]=제한 키, ARGV[1]=이번 요청 식별자, ARGV[2i]=허용 횟수, ARGV[2i+1]=윈도(ms)
+# 모두 허용되면 모든 키에 기록 후 {0, 0},
+# 하나라도 초과면 기록 없이 {재시도까지 남은 ms, 가장 오래 기다려야 하는 키 번호} 반환
+_SLIDING_WINDOW_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local retry = 0
+local blocked = 0
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[2 * i])
+    local window = tonumber(ARGV[2 * i + 1])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        local wait = tonumber(oldest[2]) + window - now
+        if wait > retry then
+            retry = wait
+            blocked = i
+        end
+    end
+end
+if retry > 0 then
+    return {retry, blocked}
+end
+for i, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now, ARGV[1])
+    redis.call('PEXPIRE', key, ARGV[2 * i + 1])
+end
+return {0, 0}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """이름별 허용 횟수 / 윈도"""
+    name: str
+    limit: int
+    window_seconds: int
+
+    @classmethod
+    def parse(cls, name: str, value: str) -> "RateLimitRule":
+        """'20/60' -> 60초에 20회"""
+        limit, window = value.split("/")
+        return cls(name, int(limit), int(window))
+
+
+class SlidingWindowRateLimiter:
+    """
+    Redis 기반 sliding window 요청 제한
+
+    키: auth:ratelimit:<rule>:<식별자 SHA-256 앞 32자> (원본 IP / 아이디 / 이메일은 키에 남기지 않음)
+    """
+    KEY_PREFIX = "auth:ratelimit:"
+
+    class Stats(BaseModel):
+        enabled: bool = Field(..., description="요청 제한 사용 여부")
+        allowed: int = Field(..., description="허용한 요청 수")
+        rejected: dict[str, int] = Field(..., description="규칙별 거절 수 (가장 오래 기다려야 하는 규칙 기준)")
+        errors: int = Field(..., description="Redis 오류로 확인 없이 통과한 수")
+
+    def __init__(self):
+        self.client: Optional[Redis] = None
+        self.__script = None
+
+        self.allowed = 0
+        self.rejected: dict[str, int] = {}
+        self.errors = 0
+
+    def bind(self, client: Optional[Redis]) -> None:
+        """Redis 클라이언트 연결 (None이면 제한 없음)"""
+        self.client = client
+        self.__script = client.register_script(_SLIDING_WINDOW_SCRIPT) if client is not None else None
+
+    def _key(self, rule: RateLimitRule, identity: str) -> str:
+        digest = hashlib.sha256(identity.encode()).hexdigest()[:32]
+        return f"{self.KEY_PREFIX}{rule.name}:{digest}"
+
+    async def hit(self, *checks: tuple[RateLimitRule, Optional[str]]) -> None:
+        """
+        (규칙, 식별자) 목록을 한 번에 확인하고 모두 허용되면 기록
+
+        식별자가 비어 있는 규칙은 건너뜀. 초과 시 RateLimitExceededException(429)
+        """
+        checks = [(rule, identity) for rule, identity in checks if identity]
+        if self.client is None or not checks:
+            return
+
+        args: list = [uuid4().hex]
+        for rule, _ in checks:
+            args.extend([rule.limit, rule.window_seconds * 1000])
+        try:
+            retry_ms, blocked = await self.__script(
+                keys=[self._key(rule, identity) for rule, identity in checks],
+                args=args,
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Rate limit check failed, allowing request: {e}")
+            return
+
+        if not retry_ms:
+            self.allowed += 1
+            return
+
+        rule = checks[int(blocked) - 1][0]
+        self.rejected[rule.name] = self.rejected.get(rule.name, 0) + 1
+        raise RateLimitExceededException(retry_after=max(math.ceil(int(retry_ms) / 1000), 1))
+
+    def stats(self) -> Stats:
+        return SlidingWindowRateLimiter.Stats(
+            enabled=self.client is not None,
+            allowed=self.allowed,
+            rejected=dict(self.rejected),
+            errors=self.errors,
+        )
+
+
+rate_limiter = SlidingWindowRateLimiter()
+
+LOGIN_PER_IP = RateLimitRule.parse("login-ip", auth_settings.RATE_LIMIT_LOGIN_PER_IP)
+LOGIN_PER_USERNAME = RateLimitRule.parse("login-user", auth_settings.RATE_LIMIT_LOGIN_PER_USERNAME)
+EMAIL_PER_IP = RateLimitRule.parse("email-ip", auth_settings.RATE_LIMIT_EMAIL_PER_IP)
+EMAIL_PER_ADDRESS = RateLimitRule.parse("email-address", auth_settings.RATE_LIMIT_EMAIL_PER_ADDRESS)
+
+
+async def limit_login(request: Request, username: str) -> None:
+    """로그인 시도 제한 (IP, 아이디)"""
+    await rate_limiter.hit(
+        (LOGIN_PER_IP, _get_client_ip(request)),
+        (LOGIN_PER_USERNAME, username.strip().lower()),
+    )
+
+
+async def limit_email(request: Request, email: str) -> None:
+    """인증 메일 발송 제한 (IP, 이메일 주소)"""
+    await rate_limiter.hit(
+        (EMAIL_PER_IP, _get_client_ip(request)),
+        (EMAIL_PER_ADDRESS, email.strip().lower()),
+    )
+
+
+# -------------------------------- Lifespan --------------------------------
+
+async def init_rate_limiter(app: FastAPI) -> None:
+    """Lifespan에서 호출: Redis 클라이언트 연결"""
+    if auth_settings.RATE_LIMIT_ENABLED:
+        rate_limiter.bind(app.state.redis_client)
+        logger.info(
+            "Rate limits: "
+            + ", ".join(
+                f"{rule.name}={rule.limit}/{rule.window_seconds}s"
+                for rule in (LOGIN_PER_IP, LOGIN_PER_USERNAME, EMAIL_PER_IP, EMAIL_PER_ADDRESS)
+            )
+        )
+
+
+async def close_rate_limiter(app: FastAPI) -> None:
+    rate_limiter.bind(None)
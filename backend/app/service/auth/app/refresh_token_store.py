@@ -0,0 +1,291 @@
+# auth/app/refresh_token_store.py
+"""
+리프래시 토큰 저장소
+
+RefreshTokenService가 만든 토큰을 어디에 저장/회전/폐기할지 추상화.
+    - DatabaseRefreshTokenStore: auth_refresh_token 테이블 (기본값)
+    - RedisRefreshTokenStore: Redis 키 + 네이티브 TTL, 만료 토큰은 Redis가 자동 삭제
+      auth_refresh_token 테이블은 선택적인 비동기 감사(audit) 기록용으로만 사용
+"""
+
+# Standard library imports
+import asyncio
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+# Third-party imports
+from fastapi import FastAPI
+from loguru import logger
+from redis.asyncio import Redis
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# App imports
+from . import crud
+from .models import AuthRefreshToken
+from ..core.security.refresh_token import RefreshTokenService
+
+# Shared imports
+from app.shared.core.settings import get_auth_settings
+
+auth_settings = get_auth_settings()
+
+
+class RefreshTokenStore(ABC):
+    """리프래시 토큰 저장소 인터페이스"""
+
+    @abstractmethod
+    async def issue(
+        self,
+        token: RefreshTokenService.TokenResponse,
+        ip_address: str = None,
+        user_agent: str = None
+    ) -> None:
+        """새 토큰 저장"""
+
+    @abstractmethod
+    async def rotate(
+        self,
+        old_refresh_token: str | None,
+        user_uuid: str,
+        token: RefreshTokenService.TokenResponse,
+        ip_address: str = None,
+        user_agent: str = None
+    ) -> bool:
+        """기존 토큰을 소비하고 새 토큰 저장, 소비할 토큰이 없으면 False"""
+
+    @abstractmethod
+    async def get_owner(self, refresh_token: str | None) -> Optional[str]:
+        """활성 토큰의 소유자 UUID 조회"""
+
+    @abstractmethod
+    async def revoke(self, refresh_token: str) -> None:
+        """토큰 폐기"""
+
+
+# -------------------------------- Database Store --------------------------------
+
+class DatabaseRefreshTokenStore(RefreshTokenStore):
+    """auth_refresh_token 테이블 기반 저장소 (요청 세션 사용)"""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def issue(self, token, ip_address=None, user_agent=None) -> None:
+        await crud.issue_refresh_token(
+            self.db,
+            user_uuid=UUID(token.user_uuid),
+            token=token,
+            ip_address=ip_address,
+            user_agent=user_agent
+        )
+
+    async def rotate(self, old_refresh_token, user_uuid, token, ip_address=None, user_agent=None) -> bool:
+        return await crud.rotate_refresh_token(
+            self.db,
+            old_refresh_token=old_refresh_token,
+            user_uuid=user_uuid,
+            token=token,
+            ip_address=ip_address,
+            user_agent=user_agent
+        )
+
+    async def get_owner(self, refresh_token) -> Optional[str]:
+        db_token = await crud.get_refresh_token(self.db, refresh_token)
+        return str(db_token.user_uuid) if db_token else None
+
+    async def revoke(self, refresh_token) -> None:
+        await crud.deactivate_refresh_token(self.db, refresh_token)
+
+
+# -------------------------------- Audit Sink --------------------------------
+
+class RefreshTokenAuditSink:
+    """
+    Redis 저장소의 발급/회전/폐기 이력을 auth_refresh_token 테이블에 비동기로 기록
+
+    요청 경로에서는 큐에 넣기만 하고, 백그라운드 작업이 모아서 한 트랜잭션으로 기록.
+    큐가 가득 차면 이력을 버리고 경고만 남김 (감사 기록이 요청을 막지 않도록)
+    """
+    def __init__(self, session_maker, batch_size: int = 500, queue_size: int = 10000):
+        self.__session_maker = session_maker
+        self.__BATCH_SIZE = batch_size
+        self.__queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.__task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    def record_issue(self, token: RefreshTokenService.TokenResponse, ip_address=None, user_agent=None) -> None:
+        self._put(("issue", token, ip_address, user_agent))
+
+    def record_revoke(self, refresh_token: str) -> None:
+        self._put(("revoke", refresh_token, None, None))
+
+    def _put(self, event: tuple) -> None:
+        try:
+            self.__queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Refresh token audit queue is full; dropping event")
+
+    def start(self) -> None:
+        if self.__task is None:
+            self.__task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """남은 이력을 기록한 뒤 종료"""
+        if self.__task is None:
+            return
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+        await self._flush(self._drain())
+
+    def _drain(self) -> list[tuple]:
+        events = []
+        while len(events) < self.__BATCH_SIZE and not self.__queue.empty():
+            events.append(self.__queue.get_nowait())
+        return events
+
+    async def _run(self) -> None:
+        while True:
+            events = [await self.__queue.get()]
+            events.extend(self._drain())
+            try:
+                await self._flush(events)
+            except Exception as e:
+                logger.error(f"Failed to write refresh token audit batch ({len(events)} events): {e}")
+
+    async def _flush(self, events: list[tuple]) -> None:
+        if not events:
+            return
+        rows = []
+        revoked = []
+        for kind, token, ip_address, user_agent in events:
+            if kind == "issue":
+                rows.append({
+                    "refresh_token": token.digest,
+                    "user_uuid": UUID(token.user_uuid),
+                    "expires_at": crud.ts_to_dt(token.expires_at),
+                    "created_at": crud.ts_to_dt(token.created_at),
+                    "ip_address": ip_address,
+                    "user_agent": user_agent,
+                    "is_active": True,
+                })
+            else:
+                revoked.append(RefreshTokenService.digest(token))
+
+        async with self.__session_maker() as session:
+            if rows:
+                await session.execute(insert(AuthRefreshToken), rows)
+            if revoked:
+                await session.execute(
+                    update(AuthRefreshToken)
+                    .where(AuthRefreshToken.refresh_token.in_(revoked))
+                    .values(is_active=False, deactivated_at=datetime.now(timezone.utc))
+                )
+            await session.commit()
+
+
+# -------------------------------- Redis Store --------------------------------
+
+# KEYS[1]=기존 토큰 키, KEYS[2]=새 토큰 키, ARGV[1]=소유자 UUID, ARGV[2]=새 토큰 TTL(초)
+_ROTATE_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+
+class RedisRefreshTokenStore(RefreshTokenStore):
+    """
+    Redis 기반 저장소
+
+    키: auth:refresh:<token digest 32바이트>, 값: 소유자 UUID, TTL: 토큰 만료까지 남은 시간
+    회전은 Lua 스크립트 1회 호출로 소유자 확인 + 기존 토큰 삭제 + 새 토큰 저장을 원자적으로 처리
+    """
+    KEY_PREFIX = b"auth:refresh:"
+
+    def __init__(self, client: Redis, audit_sink: Optional[RefreshTokenAuditSink] = None):
+        self.client = client
+        self.audit_sink = audit_sink
+        self.__rotate = client.register_script(_ROTATE_SCRIPT)
+
+    def _key(self, digest: bytes) -> bytes:
+        return self.KEY_PREFIX + digest
+
+    @staticmethod
+    def _ttl(token: RefreshTokenService.TokenResponse) -> int:
+        now = int(datetime.now(timezone.utc).timestamp())
+        return max(token.expires_at - now, 1)
+
+    async def issue(self, token, ip_address=None, user_agent=None) -> None:
+        await self.client.set(self._key(token.digest), token.user_uuid, ex=self._ttl(token))
+        if self.audit_sink:
+            self.audit_sink.record_issue(token, ip_address, user_agent)
+
+    async def rotate(self, old_refresh_token, user_uuid, token, ip_address=None, user_agent=None) -> bool:
+        if not old_refresh_token:
+            return False
+        rotated = await self.__rotate(
+            keys=[self._key(RefreshTokenService.digest(old_refresh_token)), self._key(token.digest)],
+            args=[str(user_uuid), self._ttl(token)]
+        )
+        if not rotated:
+            return False
+        if self.audit_sink:
+            self.audit_sink.record_revoke(old_refresh_token)
+            self.audit_sink.record_issue(token, ip_address, user_agent)
+        return True
+
+    async def get_owner(self, refresh_token) -> Optional[str]:
+        if not refresh_token:
+            return None
+        return await self.client.get(self._key(RefreshTokenService.digest(refresh_token)))
+
+    async def revoke(self, refresh_token) -> None:
+        await self.client.delete(self._key(RefreshTokenService.digest(refresh_token)))
+        if self.audit_sink:
+            self.audit_sink.record_revoke(refresh_token)
+
+
+# -------------------------------- Lifespan / Depends --------------------------------
+
+async def init_refresh_token_store(app: FastAPI) -> None:
+    """
+    Lifespan에서 호출: 설정에 따라 앱 전역 저장소 준비
+
+    database 모드는 요청 세션을 써야 하므로 전역 저장소를 두지 않음
+    """
+    app.state.refresh_token_store = None
+    if auth_settings.REFRESH_TOKEN_STORE != "redis":
+        return
+
+    audit_sink = None
+    if auth_settings.REFRESH_TOKEN_AUDIT:
+        audit_sink = RefreshTokenAuditSink(app.state.async_session_maker)
+        audit_sink.start()
+
+    app.state.refresh_token_store = RedisRefreshTokenStore(app.state.redis_client, audit_sink)
+    logger.info(f"Refresh token store: redis (audit={'on' if audit_sink else 'off'})")
+
+
+async def close_refresh_token_store(app: FastAPI) -> None:
+    """Lifespan 종료 시 호출: 남은 감사 이력 기록"""
+    store = getattr(app.state, "refresh_token_store", None)
+    if isinstance(store, RedisRefreshTokenStore) and store.audit_sink:
+        await store.audit_sink.stop()
+
+
+def get_refresh_token_store(app: FastAPI, db: AsyncSession) -> RefreshTokenStore:
+    """요청에서 사용할 저장소 반환"""
+    store = getattr(app.state, "refresh_token_store", None)
+    if store is not None:
+        return store
+    return DatabaseRefreshTokenStore(db)
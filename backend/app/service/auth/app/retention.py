@@ -0,0 +1,196 @@
+# auth/app/retention.py
+"""
+토큰 / 이메일 인증 테이블 보존 정리
+
+auth_refresh_token은 로그인/회전마다, auth_email_verification은 메일 발송마다 행이 늘어나므로
+만료되었거나 비활성화된 행을 주기적으로 삭제하여 테이블과 인덱스 크기를 일정하게 유지.
+
+    - JWTSecretService의 APScheduler에 interval 작업으로 등록
+    - 배치 단위 삭제 (배치마다 commit, 긴 잠금 / 큰 트랜잭션 방지)
+    - PostgreSQL에서는 advisory lock으로 여러 워커 중 하나만 실행
+      (세션 단위 잠금이므로 잠금 / 삭제 / 해제를 커넥션 하나에서 수행)
+"""
+
+# Standard library imports
+import time
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+# Third-party imports
+from fastapi import FastAPI
+from loguru import logger
+from pydantic import BaseModel, Field
+from sqlalchemy import delete, select, text, or_
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+# App imports
+from .models import AuthRefreshToken, AuthEmailVerification
+
+# Shared imports
+from app.shared.core.settings import get_auth_settings
+
+auth_settings = get_auth_settings()
+
+
+class TokenRetention:
+    """
+    만료 / 비활성 행 배치 삭제
+
+    삭제 대상:
+        auth_refresh_token: 만료된 행, 또는 비활성화(deactivated_at) 후 inactive_retention이 지난 행
+                            (deactivated_at이 없는 비활성 행은 만료 시 삭제)
+        auth_email_verification: 만료 후 email_retention이 지난 행
+                                 (인증 후 가입 전 토큰이 바로 사라지지 않도록 유예)
+    """
+    JOB_ID = "token_retention"
+    LOCK_KEY = 0x72657465  # pg_advisory_lock 키 ("rete")
+
+    class TableStats(BaseModel):
+        rows_removed: int = Field(0, description="누적 삭제 행 수")
+        last_rows_removed: int = Field(0, description="마지막 실행에서 삭제한 행 수")
+
+    class Stats(BaseModel):
+        runs: int = Field(..., description="실행 횟수")
+        skipped: int = Field(..., description="다른 워커가 실행 중이라 건너뛴 횟수")
+        failures: int = Field(..., description="실패 횟수")
+        last_run_at: Optional[int] = Field(None, description="마지막 실행 시각 (timestamp)")
+        last_duration_ms: float = Field(0.0, description="마지막 실행 소요 시간(ms)")
+        tables: dict[str, "TokenRetention.TableStats"] = Field(..., description="테이블별 삭제 지표")
+
+    def __init__(
+            self,
+            engine: AsyncEngine,
+            batch_size: int = 1000,
+            max_batches: int = 100,
+            inactive_retention: timedelta = timedelta(hours=24),
+            email_retention: timedelta = timedelta(hours=24)
+        ):
+        self.__engine = engine
+        self.__BATCH_SIZE = batch_size
+        self.__MAX_BATCHES = max_batches
+        self.__INACTIVE_RETENTION = inactive_retention
+        self.__EMAIL_RETENTION = email_retention
+
+        self.runs = 0
+        self.skipped = 0
+        self.failures = 0
+        self.last_run_at: Optional[int] = None
+        self.last_duration = 0.0
+        self.tables = {
+            AuthRefreshToken.__tablename__: TokenRetention.TableStats(),
+            AuthEmailVerification.__tablename__: TokenRetention.TableStats(),
+        }
+
+    def _targets(self, now: datetime) -> list[tuple]:
+        """(모델, 기본 키 컬럼, 삭제 조건)"""
+        return [
+            (
+                AuthRefreshToken,
+                AuthRefreshToken.refresh_token,
+                or_(
+                    AuthRefreshToken.expires_at < now,
+                    (AuthRefreshToken.is_active == False)
+                    & (AuthRefreshToken.deactivated_at < now - self.__INACTIVE_RETENTION),
+                ),
+            ),
+            (
+                AuthEmailVerification,
+                AuthEmailVerification.token,
+                AuthEmailVerification.expires_at < now - self.__EMAIL_RETENTION,
+            ),
+        ]
+
+    async def _purge(self, conn: AsyncConnection, model, pk, condition) -> int:
+        """조건에 맞는 행을 batch_size씩 삭제, 삭제한 행 수 반환"""
+        removed = 0
+        for _ in range(self.__MAX_BATCHES):
+            batch = select(pk).where(condition).limit(self.__BATCH_SIZE).scalar_subquery()
+            result = await conn.execute(delete(model).where(pk.in_(batch)))
+            await conn.commit()
+            removed += result.rowcount
+            if result.rowcount < self.__BATCH_SIZE:
+                break
+            await asyncio.sleep(0)  # 배치 사이에 다른 요청 처리 기회 제공
+        return removed
+
+    async def run(self) -> None:
+        """1회 정리 (스케줄러에서 호출)"""
+        started = time.perf_counter()
+        try:
+            # 커넥션을 풀에 돌려주지 않고 끝까지 사용 (다른 커넥션에서는 잠금 해제 불가)
+            async with self.__engine.connect() as conn:
+                is_postgres = conn.dialect.name == "postgresql"
+                if is_postgres:
+                    locked = (await conn.execute(
+                        text("SELECT pg_try_advisory_lock(:key)"), {"key": self.LOCK_KEY}
+                    )).scalar()
+                    await conn.commit()
+                    if not locked:
+                        self.skipped += 1
+                        return
+                try:
+                    now = datetime.now(timezone.utc)
+                    for model, pk, condition in self._targets(now):
+                        removed = await self._purge(conn, model, pk, condition)
+                        stats = self.tables[model.__tablename__]
+                        stats.rows_removed += removed
+                        stats.last_rows_removed = removed
+                finally:
+                    if is_postgres:
+                        await conn.rollback()  # 실패한 배치의 트랜잭션이 남아 있으면 정리
+                        await conn.execute(
+                            text("SELECT pg_advisory_unlock(:key)"), {"key": self.LOCK_KEY}
+                        )
+                        await conn.commit()
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"Token retention failed: {e}")
+            return
+
+        self.runs += 1
+        self.last_run_at = int(time.time())
+        self.last_duration = time.perf_counter() - started
+        logger.info(
+            "Token retention removed "
+            + ", ".join(f"{name}={stats.last_rows_removed}" for name, stats in self.tables.items())
+            + f" in {self.last_duration * 1000:.1f}ms"
+        )
+
+    def stats(self) -> Stats:
+        return TokenRetention.Stats(
+            runs=self.runs,
+            skipped=self.skipped,
+            failures=self.failures,
+            last_run_at=self.last_run_at,
+            last_duration_ms=round(self.last_duration * 1000, 3),
+            tables={name: stats.model_copy() for name, stats in self.tables.items()},
+        )
+
+
+# -------------------------------- Lifespan --------------------------------
+
+async def init_token_retention(app: FastAPI) -> None:
+    """Lifespan에서 호출: JWT 키 관리자의 스케줄러에 정리 작업 등록"""
+    app.state.token_retention = None
+    if not auth_settings.RETENTION_ENABLED:
+        return
+
+    retention = TokenRetention(
+        app.state.db_engine,
+        batch_size=auth_settings.RETENTION_BATCH_SIZE,
+        max_batches=auth_settings.RETENTION_MAX_BATCHES,
+        inactive_retention=timedelta(hours=auth_settings.REFRESH_TOKEN_INACTIVE_RETENTION_HOURS),
+        email_retention=timedelta(hours=auth_settings.EMAIL_VERIFICATION_RETENTION_HOURS),
+    )
+    app.state.jwt_manager.scheduler.add_job(
+        retention.run,
+        "interval",
+        seconds=auth_settings.RETENTION_INTERVAL_SECONDS,
+        id=TokenRetention.JOB_ID,
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    app.state.token_retention = retention
+    logger.info(f"Token retention scheduled every {auth_settings.RETENTION_INTERVAL_SECONDS}s")
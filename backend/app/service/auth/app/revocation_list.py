@@ -0,0 +1,189 @@
+# auth/app/revocation_list.py
+"""
+액세스 토큰 폐기 목록
+
+폐기된 토큰의 jti를 Redis에 토큰 만료 시각까지 저장하고,
+워커마다 Bloom filter로 미러링하여 pub/sub으로 동기화.
+    - 대부분을 차지하는 "폐기되지 않음" 판정은 메모리에서 끝남
+    - Bloom filter 양성(폐기 또는 거짓 양성)일 때만 Redis에 확인
+"""
+
+# Standard library imports
+import time
+import asyncio
+from typing import Optional
+
+# Third-party imports
+from fastapi import FastAPI
+from loguru import logger
+from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+
+# Shared imports
+from app.shared.core.settings import get_auth_settings
+from app.shared.tools.bloom_filter import BloomFilter
+
+auth_settings = get_auth_settings()
+
+
+class RevocationList:
+    """
+    Redis 폐기 목록 + 워커별 Bloom filter
+
+    키: auth:revoked:<jti>, TTL: 토큰 만료까지 남은 시간
+    채널: auth:revoked (폐기된 jti 전파)
+
+    Bloom filter는 삭제를 지원하지 않으므로 rebuild_seconds마다
+    Redis에 남아 있는(아직 만료되지 않은) jti로 새로 만들어 교체.
+    """
+    KEY_PREFIX = "auth:revoked:"
+    CHANNEL = "auth:revoked"
+
+    class Stats(BaseModel):
+        entries: int = Field(..., description="Bloom filter에 들어간 jti 수")
+        bit_size: int = Field(..., description="Bloom filter 비트 수")
+        memory_negatives: int = Field(..., description="메모리에서 끝난 판정 수")
+        redis_lookups: int = Field(..., description="Redis 확인 횟수")
+        false_positives: int = Field(..., description="Redis 확인 결과 폐기되지 않은 횟수")
+        rebuilds: int = Field(..., description="Bloom filter 재구성 횟수")
+
+    def __init__(
+            self,
+            client: Redis,
+            capacity: int = 100000,
+            error_rate: float = 0.001,
+            rebuild_seconds: int = 600
+        ):
+        self.client = client
+        self.__CAPACITY = capacity
+        self.__ERROR_RATE = error_rate
+        self.__REBUILD_SECONDS = rebuild_seconds
+        self.__filter = BloomFilter(capacity, error_rate)
+        self.__pending: Optional[list[str]] = None
+        self.__task: Optional[asyncio.Task] = None
+        self.__ready = asyncio.Event()
+
+        self.memory_negatives = 0
+        self.redis_lookups = 0
+        self.false_positives = 0
+        self.rebuilds = 0
+
+    def _key(self, jti: str) -> str:
+        return f"{self.KEY_PREFIX}{jti}"
+
+    def _remember(self, jti: str) -> None:
+        self.__filter.add(jti)
+        if self.__pending is not None:
+            self.__pending.append(jti)
+
+    # ------------------------- 조회 / 폐기 -------------------------
+
+    async def is_revoked(self, jti: Optional[str]) -> bool:
+        """jti 폐기 여부 (jti가 없는 이전 토큰은 폐기 불가로 간주)"""
+        if not jti:
+            return False
+        if jti not in self.__filter:
+            self.memory_negatives += 1
+            return False
+
+        self.redis_lookups += 1
+        revoked = await self.client.exists(self._key(jti)) > 0
+        if not revoked:
+            self.false_positives += 1
+        return revoked
+
+    async def revoke(self, jti: Optional[str], expires_at: int) -> None:
+        """토큰 만료 시각까지 jti 폐기 기록 후 다른 워커에 전파"""
+        ttl = expires_at - int(time.time())
+        if not jti or ttl <= 0:
+            return
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(jti), 1, ex=ttl)
+            pipe.publish(self.CHANNEL, jti)
+            await pipe.execute()
+        self._remember(jti)
+
+    # ------------------------- 동기화 -------------------------
+
+    async def _rebuild(self) -> None:
+        """Redis에 남아 있는 jti로 Bloom filter 재구성 후 교체"""
+        self.__pending = []
+        try:
+            bloom = BloomFilter(self.__CAPACITY, self.__ERROR_RATE)
+            async for key in self.client.scan_iter(match=f"{self.KEY_PREFIX}*", count=1000):
+                bloom.add(key[len(self.KEY_PREFIX):])
+            # 스캔 도중 pub/sub으로 들어온 jti 반영
+            for jti in self.__pending:
+                bloom.add(jti)
+            self.__filter = bloom
+            self.rebuilds += 1
+            self.__ready.set()
+        finally:
+            self.__pending = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.client.pubsub() as pubsub:
+                    # 구독 후 재구성해야 그 사이 폐기된 jti를 놓치지 않음
+                    await pubsub.subscribe(self.CHANNEL)
+                    await self._rebuild()
+                    next_rebuild = time.monotonic() + self.__REBUILD_SECONDS
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if message and message.get("type") == "message":
+                            self._remember(message["data"])
+                        if time.monotonic() >= next_rebuild:
+                            await self._rebuild()
+                            next_rebuild = time.monotonic() + self.__REBUILD_SECONDS
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Revocation list sync failed, retrying: {e}")
+                await asyncio.sleep(1)
+
+    async def start(self) -> None:
+        """동기화 시작, 첫 재구성이 끝날 때까지 대기"""
+        self.__task = asyncio.create_task(self._listen())
+        await self.__ready.wait()
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+
+    def stats(self) -> Stats:
+        return RevocationList.Stats(
+            entries=self.__filter.count,
+            bit_size=self.__filter.bit_size,
+            memory_negatives=self.memory_negatives,
+            redis_lookups=self.redis_lookups,
+            false_positives=self.false_positives,
+            rebuilds=self.rebuilds,
+        )
+
+
+# -------------------------------- Lifespan --------------------------------
+
+async def init_revocation_list(app: FastAPI) -> None:
+    """Lifespan에서 호출: 폐기 목록 로드 및 pub/sub 동기화 시작"""
+    revocation_list = RevocationList(
+        app.state.redis_client,
+        capacity=auth_settings.REVOCATION_BLOOM_CAPACITY,
+        error_rate=auth_settings.REVOCATION_BLOOM_ERROR_RATE,
+        rebuild_seconds=auth_settings.REVOCATION_REBUILD_SECONDS,
+    )
+    await revocation_list.start()
+    app.state.revocation_list = revocation_list
+    logger.info(f"Revocation list loaded: {revocation_list.stats().entries} revoked tokens")
+
+
+async def close_revocation_list(app: FastAPI) -> None:
+    """Lifespan 종료 시 호출"""
+    revocation_list: Optional[RevocationList] = getattr(app.state, "revocation_list", None)
+    if revocation_list is not None:
+        await revocation_list.stop()
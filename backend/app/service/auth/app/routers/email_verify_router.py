@@ -5,17 +5,15 @@ from fastapi.requests import Request
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.responses import JSONResponse
 
-# SQLAlchemy & Third Party imports
+# Third Party imports
 from loguru import logger
-from sqlalchemy.ext.asyncio import AsyncSession
 
 # App imports
 from .. import service, schemas
+from ..rate_limit import limit_email
 
 # Shared imports
-from app.shared.core.redis import Redis, get_redis
 from app.shared.core.async_mail_client import get_smtp_client, AsyncEmailClient
-from app.shared.core.database import get_db
 
 # ------------------------- Email Router -------------------------
 
@@ -23,24 +21,22 @@ email_verify_router = APIRouter(prefix="/email")
 
 @email_verify_router.post("")
 async def send_email_verification(
+    request: Request,
     form: schemas.SendEmailRequest,
-    db: AsyncSession = Depends(get_db),
-    redis: Redis = Depends(get_redis),
     smtp: AsyncEmailClient = Depends(get_smtp_client)
 ):
-    """이메일 인증 토큰 및 코드 발급"""
-    result = await service.send_email_verification(db, redis, smtp, form.email)
+    """이메일 인증 토큰 및 코드 발급 (IP, 이메일 주소별 요청 제한)"""
+    await limit_email(request, form.email)
+    result = await service.send_email_verification(smtp, form.email)
     logger.info(f"Email verification sent to '{form.email}'.")
     return result
 
 
 @email_verify_router.post("/verify")
 async def verify_email_code(
-    form: schemas.VerifyEmailRequest,
-    db: AsyncSession = Depends(get_db),
-    redis: Redis = Depends(get_redis)
+    form: schemas.VerifyEmailRequest
 ):
     """이메일 인증 코드 검증"""
-    result = await service.verify_email_token(db, redis, form.token, form.code)
+    result = await service.verify_email_token(form.token, form.code)
     logger.info(f"Email verification token checked for token '{form.token}'.")
     return result
\ No newline at end of file
@@ -0,0 +1,41 @@
+# auth/routers/jwks_router.py
+# FastAPI imports
+from fastapi import APIRouter
+from fastapi.requests import Request
+from fastapi.responses import Response
+
+# Shared imports
+from app.shared.core.settings import get_auth_settings
+
+# ------------------------- Settings Initialization -------------------------
+
+auth_settings = get_auth_settings()
+
+# ------------------------- JWKS Router -------------------------
+
+jwks_router = APIRouter(prefix="/.well-known")
+
+@jwks_router.get("/jwks.json", description="토큰 검증용 공개키 목록 (JWKS)")
+async def get_jwks(request: Request) -> Response:
+    """
+    비대칭 서명 모드의 공개키 게시
+
+    다운스트림 서비스는 이 문서를 캐시해 두고 kid로 키를 골라 로컬에서 토큰을 검증.
+    next 키가 활성화 전에 미리 포함되므로 max-age 동안 캐시해도 회전에 안전함.
+    """
+    manager = request.app.state.jwt_manager
+    headers = {
+        "Cache-Control": (
+            f"public, max-age={auth_settings.JWKS_MAX_AGE_SECONDS}, "
+            f"stale-while-revalidate={auth_settings.JWKS_MAX_AGE_SECONDS}"
+        ),
+        "ETag": manager.jwks_etag,
+    }
+    if request.headers.get("if-none-match") == manager.jwks_etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=manager.jwks_json,
+        media_type="application/jwk-set+json",
+        headers=headers
+    )
@@ -12,6 +12,7 @@ from loguru import logger
 
 # App imports
 from .. import service, schemas
+from ..rate_limit import limit_login
 
 # Shared imports
 from app.shared.core.database import get_db
@@ -43,7 +44,10 @@ async def issue_token(
 ) -> JSONResponse:
     """
     로그인 하여 액세스 토큰 및 리프래시 토큰 발급
+
+    요청 제한(IP, 아이디)을 먼저 확인하여 초과 시 DB 조회 / bcrypt 없이 429
     """
+    await limit_login(request, form_data.username)
     tokens: service.IssueTokenResponse = await service.issue_token_by_login_form(request, db, form_data)
     logger.info(f"User '{form_data.username}' logged in and tokens issued.")
     
@@ -1,12 +1,11 @@
 # Standard library imports
-import json
-from datetime import datetime, timezone
+import asyncio
+from uuid import uuid4
 
 # Third-party imports
 import ipaddress
 from loguru import logger
 from pydantic import BaseModel
-from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # FastAPI imports
@@ -16,6 +15,8 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 # App imports
 from . import crud
+from .refresh_token_store import get_refresh_token_store
+from .email_verification import email_verification_store
 from ..core.security.password_hasher import PasswordHasher
 from ..core.security.access_token import AccessTokenService
 from ..core.security.refresh_token import RefreshTokenService
@@ -26,6 +27,7 @@ from ..core.form.verify_email_form import verify_email_form
 
 # Shared Core imports
 from app.shared.core.async_mail_client import AsyncEmailClient
+from app.shared.core.database import commit_or_flush, after_commit, after_rollback
 from app.shared.core.settings import (
     get_auth_settings, 
     get_email_verify_settings, 
@@ -38,20 +40,42 @@ google_oauth_settings = get_google_oauth_settings()
 
 # ------------------------------ Functional Business Logic -------------------------
 
+_trusted_proxies = [ipaddress.ip_network(proxy, strict=False) for proxy in auth_settings.trusted_proxies_list]
+
+
+def _is_trusted_proxy(ip: str) -> bool:
+    try:
+        addr = ipaddress.ip_address(ip)
+    except ValueError:
+        return False
+    return any(addr in network for network in _trusted_proxies)
+
+
 def _get_client_ip(request: Request) -> str:
     """
     클라이언트 IP 주소 추출
 
-    x-forwarded-for, x-real-ip 헤더 우선, 없으면 request.client.host 사용
+    접속 주소(request.client.host)가 AUTH_TRUSTED_PROXIES에 속할 때만 프록시 헤더 사용.
+    x-forwarded-for는 클라이언트가 임의로 앞에 값을 붙일 수 있으므로
+    오른쪽부터 신뢰 프록시를 건너뛰고 처음 만나는 주소를 사용 (rate limit 우회 방지)
     """
+    peer = request.client.host if request.client else ""
+    if not peer or not _is_trusted_proxy(peer):
+        return peer
+
     xff = request.headers.get("x-forwarded-for")
     if xff:
-        ip = xff.split(",")[0].strip()
-        try:
-            ipaddress.ip_address(ip)
-            return ip
-        except ValueError:
-            pass  # 유효하지 않은 IP는 무시
+        client = peer
+        for hop in reversed([hop.strip() for hop in xff.split(",")]):
+            try:
+                ipaddress.ip_address(hop)
+            except ValueError:
+                break  # 유효하지 않은 값 이후는 신뢰하지 않음
+            client = hop
+            if not _is_trusted_proxy(hop):
+                break
+        return client
+
     xrip = request.headers.get("x-real-ip")
     if xrip:
         try:
@@ -59,17 +83,19 @@ def _get_client_ip(request: Request) -> str:
             return xrip
         except ValueError:
             pass
-    if request.client:
-        return request.client.host or ""
-    return ""
+    return peer
 
 # -------------------------------- Token Business Logic ---------------------------
 
-password_hasher = PasswordHasher(auth_settings.BCRYPT_ROUNDS)
-access_token_service = AccessTokenService("HS256", auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+password_hasher = PasswordHasher(
+    bcrypt_rounds=auth_settings.BCRYPT_ROUNDS,
+    executor_mode=auth_settings.BCRYPT_EXECUTOR,
+    max_workers=auth_settings.BCRYPT_MAX_WORKERS,
+    max_pending=auth_settings.BCRYPT_MAX_PENDING
+)
+access_token_service = AccessTokenService(auth_settings.JWT_ALGORITHM, auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 refresh_token_service = RefreshTokenService(
     expire_days=auth_settings.REFRESH_TOKEN_EXPIRE_DAYS,
-    store_hashed=auth_settings.REFRESH_TOKEN_STORE_HASHED,
     byte_length=auth_settings.REFRESH_TOKEN_BYTE_LENGTH
 )
 
@@ -113,6 +139,38 @@ def get_secret_key(app) -> str:
     return app.state.jwt_manager.current_secret.secret_key
 
 
+def decode_access_token(app, token: str, verify_exp: bool = True) -> dict:
+    """
+    토큰 헤더의 kid에 해당하는 키와 알고리즘으로 액세스 토큰 검증
+
+    토큰이 없거나 헤더가 깨졌거나 kid를 모르면 InvalidTokenError로 래핑
+    """
+    try:
+        material = app.state.jwt_manager.verification_material(token)
+    except Exception as e:
+        raise AccessTokenService.InvalidTokenError("토큰 검증에 실패하였습니다.") from e
+    options = None if verify_exp else {"verify_exp": False}
+    return access_token_service.decode_token(
+        token,
+        material.verification_key,
+        options,
+        algorithm=material.algorithm
+    )
+
+
+def issue_access_token(app, user_uuid: str) -> AccessTokenService.TokenResponse:
+    """
+    키링의 active 키로 액세스 토큰 발급 (헤더에 kid 기록)
+    """
+    material = app.state.jwt_manager.signing_material()
+    return access_token_service.issue_token(
+        user_uuid,
+        material.signing_key,
+        kid=material.kid,
+        algorithm=material.algorithm
+    )
+
+
 async def create_auth_user(
     db: AsyncSession,
     user_id: str,
@@ -127,38 +185,30 @@ async def create_auth_user(
         가입 순서:
             Email 인증 완료 -> 사용자 생성
         비밀번호는 해시저장
-    """
-    existing_email_token = await crud.existing_email_token(
-        db,
-        token=email_token
-    )
-    if not existing_email_token:
-        raise InvalidEmailTokenException("이메일 인증 토큰이 유효하지 않습니다.")
 
-    verify_email = await crud.is_email_verified(
-        db,
-        token=email_token
-    )
-
-    if not verify_email:
-        raise InvalidEmailTokenException("이메일 인증이 완료되지 않았습니다.")
-    
-    await crud.update_email_verification_code_as_used(
-        db,
-        token=email_token
+        이메일 토큰 점유(Redis)와 비밀번호 해시(bcrypt)는 서로 독립적이므로 동시에 실행.
+        unit_of_work 안에서 호출되면 commit 하지 않고 flush만 함.
+        토큰은 commit 이후 사용 완료, rollback 되면 점유를 풀어 다시 가입할 수 있게 함.
+    """
+    claim_id = uuid4().hex
+    await after_rollback(db, email_verification_store.release, email_token, claim_id)
+    verified_email, hashed_password = await asyncio.gather(
+        email_verification_store.claim(email_token, claim_id),
+        password_hasher.hash_password_async(password)
     )
-
-    hashed_password = password_hasher.hash_password(password)
+    if not verified_email:
+        raise InvalidEmailTokenException("이메일 인증 토큰이 유효하지 않거나 인증이 완료되지 않았습니다.")
 
     new_user = crud.AuthUser(
+        user_uuid=uuid4(),
         user_id=user_id,
         password=hashed_password,
         email=email,
         is_active=True
     )
     db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
+    await commit_or_flush(db)
+    await after_commit(db, email_verification_store.complete, email_token, claim_id)
     return new_user
 
 
@@ -173,14 +223,11 @@ async def _issue_token(
     Description:
         내부 함수로, 토큰 발급 로직을 캡슐화
     """
-    access_token = access_token_service.issue_token(user_uuid, get_secret_key(request.app))
+    access_token = issue_access_token(request.app, user_uuid)
 
-    await crud.deactivate_refresh_token(db)
     refresh_token = refresh_token_service.create_token(user_uuid=str(user_uuid))
-    await crud.issue_refresh_token(
-        db,
-        user_uuid=user_uuid,
-        token=refresh_token,
+    await get_refresh_token_store(request.app, db).issue(
+        refresh_token,
         ip_address=_get_client_ip(request),
         user_agent=request.headers.get("user-agent")
     )  
@@ -191,6 +238,64 @@ async def _issue_token(
     )
 
 
+BCRYPT_ROUNDS_KEY = "auth:bcrypt:rounds"
+
+# 응답 이후 실행되는 재해싱 작업 (GC로 취소되지 않도록 참조 유지)
+_rehash_tasks: set[asyncio.Task] = set()
+
+
+async def calibrate_password_hasher(app) -> int:
+    """
+    bcrypt 라운드 보정을 클러스터에서 한 번만 수행하고 Redis로 공유
+
+    Description:
+        먼저 저장한 워커의 값을 모든 워커 / 호스트가 사용 (SET NX).
+        다시 보정하려면 auth:bcrypt:rounds 키를 삭제하고 재시작.
+    """
+    redis_client = app.state.redis_client
+    stored = await redis_client.get(BCRYPT_ROUNDS_KEY)
+    if stored is None:
+        rounds = await password_hasher.calibrate_async(
+            target_ms=auth_settings.BCRYPT_TARGET_VERIFY_MS,
+            min_rounds=auth_settings.BCRYPT_MIN_ROUNDS,
+            max_rounds=auth_settings.BCRYPT_MAX_ROUNDS,
+        )
+        if await redis_client.set(BCRYPT_ROUNDS_KEY, rounds, nx=True):
+            return rounds
+        stored = await redis_client.get(BCRYPT_ROUNDS_KEY)
+    password_hasher.set_rounds(int(stored))
+    return int(stored)
+
+
+async def _rehash_password(
+    session_maker,
+    user_uuid: str,
+    plain_password: str
+) -> None:
+    """
+    현재 bcrypt 라운드 수로 비밀번호 재해싱 후 저장
+
+    Description:
+        검증이 끝난 평문 비밀번호로만 호출할 것.
+        응답 이후 별도 세션에서 실행하며, 실패해도 다음 로그인에서 재시도
+    """
+    try:
+        hashed_password = await password_hasher.hash_password_async(plain_password)
+        async with session_maker() as db:
+            await crud.update_user_password(db, user_uuid, hashed_password)
+    except Exception as e:
+        logger.warning(f"Failed to rehash password for user '{user_uuid}': {e}")
+
+
+def _schedule_rehash(app, user_uuid: str, plain_password: str) -> None:
+    """로그인 응답을 기다리게 하지 않도록 재해싱을 백그라운드로 실행"""
+    task = asyncio.create_task(
+        _rehash_password(app.state.async_session_maker, user_uuid, plain_password)
+    )
+    _rehash_tasks.add(task)
+    task.add_done_callback(_rehash_tasks.discard)
+
+
 async def issue_token_by_login_form(
     request: Request,
     db: AsyncSession,
@@ -209,10 +314,14 @@ async def issue_token_by_login_form(
     if not user:
         raise UserNotFoundException()
     
-    password_hasher.verify_password(form_data.password, user.password)
+    await password_hasher.verify_password_async(form_data.password, user.password)
 
     user_uuid = user.user_uuid
 
+    # 저장된 해시의 cost가 현재 목표보다 낮으면 재해싱 (응답 경로 밖에서)
+    if password_hasher.needs_rehash(user.password):
+        _schedule_rehash(request.app, user_uuid, form_data.password)
+
     tokens =  await _issue_token(
         request,
         db,
@@ -232,9 +341,8 @@ async def verify_access_token(
     Description:
         - 액세스 토큰의 유효성을 검사하고, 필요한 경우 사용자 정보를 반환
     """
-    secret_key = get_secret_key(request.app)
     try:
-        payload = access_token_service.decode_token(access_token, secret_key)
+        payload = decode_access_token(request.app, access_token)
         user_uuid = payload.get("sub")
         return user_uuid
     except Exception as e:
@@ -247,40 +355,29 @@ async def rotate_tokens(request: Request, db: AsyncSession) -> IssueTokenRespons
     리프래시 토큰으로 액세스 토큰 재발급
 
     description:
-        발급 예외처리 과정
-        1. 토큰이 DB에 존재하지 않음 -> RefreshTokenNotFound 예외 발생
-        2. 토큰이 만료됨 -> InvalidTokenException 예외 발생, 비활성화 처리
-        3. 토큰 소유자 불일치 -> InvalidTokenException 예외 발생
+        기존 토큰 소비(비활성화)와 새 토큰 저장을 한 트랜잭션에서 처리 (커밋 1회)
+        토큰이 없음 / 이미 사용됨 / 만료됨 / 소유자 불일치
+            -> InvalidRefreshTokenException 예외 발생
+        같은 토큰의 동시 재사용은 하나만 성공하고 나머지는 위 예외로 실패
     """
-    secret_key = get_secret_key(request.app)
-
     old_access_token = request.cookies.get("access_token")
-    decode_access_token = access_token_service.decode_token_without_expiration(old_access_token, secret_key)
-    user_uuid = decode_access_token.get("sub")
+    old_access_payload = decode_access_token(request.app, old_access_token, verify_exp=False)
+    user_uuid = old_access_payload.get("sub")
     old_refresh_token = request.cookies.get("refresh_token")
 
-    old_refresh_token_data = await crud.get_refresh_token(db, old_refresh_token)
-    if not old_refresh_token_data:
-        raise RefreshTokenNotFound("리프래시 토큰이 유효하지 않습니다.")
-    
-    now_utc = datetime.now(timezone.utc).timestamp()
-    if old_refresh_token_data.expires_at.timestamp() < now_utc:
-        await crud.deactivate_refresh_token(db, old_refresh_token)
-        raise InvalidRefreshTokenException("리프래시 토큰이 만료되었습니다.")
-
-    if str(old_refresh_token_data.user_uuid) != str(user_uuid):
-        logger.warning("리프래시 토큰의 소유자 정보가 일치하지 않습니다.")
-        raise InvalidRefreshTokenException("리프래시 토큰의 소유자 정보가 일치하지 않습니다.")
-
     refresh_token = refresh_token_service.create_token(user_uuid=str(user_uuid))
-    await crud.issue_refresh_token(
-        db,
+    rotated = await get_refresh_token_store(request.app, db).rotate(
+        old_refresh_token=old_refresh_token,
         user_uuid=user_uuid,
         token=refresh_token,
         ip_address=_get_client_ip(request),
         user_agent=request.headers.get("user-agent")
     )
-    access_token = access_token_service.issue_token(user_uuid, secret_key)
+    if not rotated:
+        logger.warning("리프래시 토큰 회전 실패: 없거나, 이미 사용되었거나, 만료되었거나, 소유자가 다릅니다.")
+        raise InvalidRefreshTokenException("리프래시 토큰이 유효하지 않습니다.")
+
+    access_token = issue_access_token(request.app, user_uuid)
 
     return IssueTokenResponse(
         access_token=access_token,
@@ -298,15 +395,26 @@ async def revoke_token(
     access_token = request.cookies.get("access_token")
     refresh_token = request.cookies.get("refresh_token")
 
-    access_token_user_uuid = access_token_service.decode_token_without_validation(access_token).get("sub")
-    refresh_token = await crud.get_refresh_token(db, refresh_token)
-    refresh_token_user_uuid = refresh_token.user_uuid
+    access_token_payload = access_token_service.decode_token_without_validation(access_token)
+    access_token_user_uuid = access_token_payload.get("sub")
+    store = get_refresh_token_store(request.app, db)
+    refresh_token_user_uuid = await store.get_owner(refresh_token)
+    if refresh_token_user_uuid is None:
+        raise RefreshTokenNotFound("리프래시 토큰이 유효하지 않습니다.")
 
     if str(access_token_user_uuid) != str(refresh_token_user_uuid):
         logger.warning("액세스 토큰과 리프래시 토큰의 소유자 정보가 일치하지 않습니다.")
         raise InvalidRefreshTokenException("토큰의 소유자 정보가 일치하지 않습니다.")
 
-    await crud.deactivate_refresh_token(db, refresh_token.refresh_token)
+    await store.revoke(refresh_token)
+
+    # 액세스 토큰도 만료 전까지 사용할 수 없도록 폐기 목록에 등록
+    revocation_list = getattr(request.app.state, "revocation_list", None)
+    if revocation_list is not None:
+        await revocation_list.revoke(
+            access_token_payload.get("jti"),
+            access_token_payload.get("exp", 0)
+        )
 
 # -------------------------- Email Verification Business Logic --------------------
 
@@ -324,13 +432,13 @@ class InvalidEmailTokenException(Exception):
 # ------------------------------------------------------------------------
 
 async def send_email_verification(
-    db: AsyncSession,
-    redis: Redis,
     smtp: AsyncEmailClient,
     email: str
 ):
     """
     이메일 인증 토큰 및 코드 발급
+
+    인증 상태는 Redis에만 저장하고, DB 감사 기록은 EmailVerificationDrainer가 비동기로 기록
     """
     verify: EmailTokenManager.EmailVerifyResponse = email_token_manager.create_token(email)
 
@@ -339,6 +447,8 @@ async def send_email_verification(
         expiry=verify.expires_in // 60
     )
 
+    await email_verification_store.create(verify)
+
     await smtp.send_email(
         to=email,
         subject="이메일 인증 안내 — Hilighting",
@@ -346,27 +456,6 @@ async def send_email_verification(
         subtype="html"
     )
 
-    redis_value = {
-            "email": email,
-            "code": verify.code,
-            "expires_at": verify.expires_at,
-            "created_at": verify.created_at
-        }
-
-    await redis.set(
-        verify.token, 
-        json.dumps(redis_value), 
-        ex=verify.expires_in
-        )
-
-    await crud.save_email_verification_code(
-        db=db,
-        email=email,
-        token=verify.token,
-        code=verify.code,
-        expires_at=verify.expires_at
-    )
-
     response_data = {
         "email": email,
         "token": verify.token,
@@ -378,26 +467,19 @@ async def send_email_verification(
 
 
 async def verify_email_token(
-    db: AsyncSession,
-    redis: Redis,
     token: str,
     code: str,
 ) -> JSONResponse:
     """
     이메일 인증 토큰 및 코드 검증
     """
-    redis_data = await redis.get(token)
-    if not redis_data:
+    result = await email_verification_store.verify(token, code)
+    if result == email_verification_store.NOT_FOUND:
         raise InvalidEmailTokenException("이메일 인증 토큰이 유효하지 않거나 만료되었습니다.")
-
-    data = json.loads(redis_data)
-
-    if data.get("code") != code:
+    if result == email_verification_store.CODE_MISMATCH:
         raise InvalidEmailTokenException("이메일 인증 코드가 일치하지 않습니다.")
-
-    # 검증 성공 시, Redis에서 해당 토큰 삭제
-    await redis.delete(token)
-    await crud.update_email_verification_code_as_verified(db, token)
+    if result == email_verification_store.TOO_MANY_ATTEMPTS:
+        raise InvalidEmailTokenException("인증 코드 입력 횟수를 초과했습니다. 인증 메일을 다시 요청해 주세요.")
 
     return JSONResponse({"message": "이메일 인증이 완료되었습니다."})
 
@@ -482,7 +564,7 @@ async def link_oauth_account(
         access token이 유효한 상태여야함.
     """
     # 연동 가능한 계정인지 파악
-    if not crud.validate_provider_id(
+    if not await crud.validate_provider_id(
         db,
         user_uuid=user_uuid,
         provider=provider,
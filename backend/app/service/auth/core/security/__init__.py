@@ -1,6 +1,7 @@
 # backend/auth/core/security/__init__.py
 from .access_token import AccessTokenService
 from .jwt_secret_service import JWTSecretService
+from .jwt_key_store import JWTKeyStore, FileKeyStore, RedisKeyStore, SharedMemoryKeyStore
 from .refresh_token import RefreshTokenService
 from .password_hasher import PasswordHasher
 from .email_token import EmailTokenManager
@@ -9,6 +10,10 @@ from .google_oauth2 import GoogleOAuth2Client
 __all__ = [
     "AccessTokenService",
     "JWTSecretService",
+    "JWTKeyStore",
+    "FileKeyStore",
+    "RedisKeyStore",
+    "SharedMemoryKeyStore",
     "RefreshTokenService",
     "PasswordHasher",
     "EmailTokenManager",
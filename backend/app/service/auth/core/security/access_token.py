@@ -1,15 +1,16 @@
 # core/security/access_token.py
+import secrets
 from datetime import datetime, timezone
+from typing import Any
 import jwt
 from pydantic import BaseModel, Field
 
 class AccessTokenService:
     """JWT 생성 및 검증 유틸리티
 
-    - HS256 알고리즘 사용
+    - HS256 / EdDSA / ES256 / RS256 알고리즘 지원
     - 토큰 만료 시간 설정 가능
-
-    @TODO: 알고리즘 선택 기능 구현
+    - 키링 사용 시 키별 알고리즘을 호출마다 지정 가능 (algorithm 인자)
 
     사용 예시:
     jwt_manager = JWTManager(algorithm=algorithm, access_token_expire_minutes=expire_minutes)
@@ -20,7 +21,7 @@ class AccessTokenService:
     알고리즘은, 초기 셋팅 때만 건들 수 있게 설계 필요.
     """
     def __init__(self, algorithm: str = "HS256", access_token_expire_minutes: int = 15):
-        allow_algorithms = ["HS256"]
+        allow_algorithms = ["HS256", "EdDSA", "ES256", "RS256"]
         if algorithm not in allow_algorithms:
             raise AccessTokenService.NotSupportedAlgorithmError(f"지원하지 않는 알고리즘입니다. 지원 알고리즘: {allow_algorithms}")
 
@@ -53,12 +54,22 @@ class AccessTokenService:
     # 내부 함수 정의
     @staticmethod
     def now() -> int:
-        return round(datetime.now(timezone.utc).timestamp())
+        # 반올림하면 iat가 최대 0.5초 미래가 되어 PyJWT의 iat 검증에 걸리므로 내림
+        return int(datetime.now(timezone.utc).timestamp())
 
     # JWT 토큰 생성
-    def issue_token(self, user_uuid: str, secret_key: str) -> TokenResponse:
+    def issue_token(
+            self,
+            user_uuid: str,
+            secret_key: Any,
+            kid: str | None = None,
+            algorithm: str | None = None
+        ) -> TokenResponse:
         """
         JWT 토큰 생성
+
+        kid가 주어지면 헤더에 기록하여, 검증 시 키링에서 키를 바로 찾을 수 있게 함
+        secret_key는 비밀 키 문자열, PEM 개인키 또는 파싱된 키 객체
         
         @TODO: payload에 추가 클레임 삽입 기능 구현 
         1. permissions: 사용자 권한
@@ -74,10 +85,12 @@ class AccessTokenService:
         payload = {
             "sub": sub,
             "iat": iat,
-            "exp": exp
+            "exp": exp,
+            "jti": secrets.token_urlsafe(16)  # 토큰 단위 폐기용 식별자
         }
 
-        encoded_jwt = jwt.encode(payload, secret_key, algorithm=self.__ALGORITHM)
+        headers = {"kid": kid} if kid else None
+        encoded_jwt = jwt.encode(payload, secret_key, algorithm=algorithm or self.__ALGORITHM, headers=headers)
         if isinstance(encoded_jwt, bytes):
             encoded_jwt = encoded_jwt.decode("utf-8")
         return AccessTokenService.TokenResponse(
@@ -87,7 +100,13 @@ class AccessTokenService:
         )
 
     # 각동 디코딩 로직
-    def decode_token(self, token: str, secret_key: str | None = None, options: dict = None) -> dict:
+    def decode_token(
+            self,
+            token: str,
+            secret_key: Any = None,
+            options: dict = None,
+            algorithm: str | None = None
+        ) -> dict:
         """
         JWT 디코딩. options에 verify_signature=False 가 명시되면 secret_key는 필수가 아님.
         """
@@ -100,7 +119,7 @@ class AccessTokenService:
             payload = jwt.decode(
                 token,
                 key=(secret_key if verify_signature else None),
-                algorithms=[self.__ALGORITHM],
+                algorithms=[algorithm or self.__ALGORITHM],
                 options=opts
             )
             return payload
@@ -115,12 +134,12 @@ class AccessTokenService:
             raise AccessTokenService.InvalidTokenError("토큰 검증에 실패하였습니다.") from e
 
 
-    def decode_token_without_expiration(self, token: str, secret_key: str) -> dict:
+    def decode_token_without_expiration(self, token: str, secret_key: Any, algorithm: str | None = None) -> dict:
         """만료 검증 없이 JWT 토큰 디코딩 및 payload 반환"""
         option = {
             "verify_exp": False
         }
-        return self.decode_token(token, secret_key, option)
+        return self.decode_token(token, secret_key, option, algorithm)
         
     def decode_token_without_validation(self, token: str) -> dict:
         """검증 없이 JWT 토큰 디코딩 및 payload 반환"""
@@ -0,0 +1,382 @@
+# backend/auth/core/security/jwt_key_store.py
+"""
+JWT 키링 저장소
+
+JWTSecretService가 키링을 어디에 저장하고 다른 워커 / 노드와 어떻게 공유할지 추상화.
+    - FileKeyStore: 로컬 JSON 파일 (기본값, 단일 노드)
+        같은 호스트의 워커끼리는 flock으로 생성 / 회전을 직렬화
+    - RedisKeyStore: Redis 키 1개 + pub/sub 변경 알림 (여러 노드)
+        생성 / 회전은 SET NX 잠금으로 한 곳에서만 수행하고,
+        변경되면 채널로 알려 모든 워커가 재시작 없이 메모리 키링을 다시 읽음
+        키링(HS 비밀 / 개인키)은 Fernet으로 암호화해 저장
+    - SharedMemoryKeyStore: 한 호스트의 워커끼리 mmap 파일로 공유 (외부 서비스 없음)
+        flock으로 뽑힌 한 프로세스만 생성 / 회전하고 seqlock으로 게시,
+        나머지 워커는 순번만 확인하다 바뀌면 다시 읽음
+"""
+
+# Standard library imports
+import os
+import json
+import mmap
+import fcntl
+import struct
+import asyncio
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional
+from uuid import uuid4
+
+# Third-party imports
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+from loguru import logger
+from redis.asyncio import Redis
+
+
+class JWTKeyStore(ABC):
+    """키링 저장소 인터페이스 (키링은 JWTKeyring.model_dump() dict)"""
+
+    @abstractmethod
+    async def load(self) -> Optional[dict]:
+        """저장된 키링, 없으면 None"""
+
+    @abstractmethod
+    async def save(self, data: dict) -> None:
+        """키링 저장 (다른 워커에 변경 알림)"""
+
+    @abstractmethod
+    def lock(self) -> AbstractAsyncContextManager[None]:
+        """생성 / 회전 구간 잠금 (async context manager)"""
+
+    def claim_writer(self) -> bool:
+        """이 프로세스가 키링을 생성 / 회전할 수 있는지 (SharedMemoryKeyStore는 호스트당 한 프로세스)"""
+        return True
+
+    async def watch(self, on_change: Callable[[], Awaitable[None]]) -> None:
+        """다른 워커의 변경 알림 구독 (지원하지 않는 저장소는 무시)"""
+
+    async def close(self) -> None:
+        """구독 종료"""
+
+
+class FileKeyStore(JWTKeyStore):
+    """
+    로컬 JSON 파일 키링
+
+    임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않도록 함.
+    잠금: <path>.lock 파일 flock (같은 호스트의 워커 프로세스 간)
+    """
+    def __init__(self, key_path: str):
+        if not key_path.startswith('/'):
+            key_path = os.path.join(os.getcwd(), key_path)
+        self.path = key_path
+
+    def _read(self) -> Optional[dict]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as f:
+            return json.load(f)
+
+    def _write(self, data: dict) -> None:
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".jwt_keyring.")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    async def load(self) -> Optional[dict]:
+        return await asyncio.to_thread(self._read)
+
+    async def save(self, data: dict) -> None:
+        await asyncio.to_thread(self._write, data)
+
+    @asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            await asyncio.to_thread(fcntl.flock, fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+# 잠금 소유자일 때만 해제
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisKeyStore(JWTKeyStore):
+    """
+    Redis 공유 키링
+
+    키: auth:jwt:keyring        키링 JSON
+        auth:jwt:keyring:lock   생성 / 회전 잠금 (SET NX PX)
+    채널: auth:jwt:keyring      변경 알림 (키링 세대)
+
+    알림은 내용 없이 "다시 읽어라"만 전달하고, 구독 직후에도 한 번 다시 읽어
+    연결이 끊긴 동안 놓친 변경을 따라잡음.
+
+    키링에는 서명 비밀이 들어 있으므로 encryption_keys(Fernet 키, 첫 번째로 암호화)로
+    암호화해 저장. 키 교체 시 새 키를 맨 앞에 추가하고 다음 회전 후 옛 키를 제거.
+    암호화와 별개로 ACL로 접근을 제한한 전용 Redis 사용 권장.
+    """
+    KEY = "auth:jwt:keyring"
+    LOCK_KEY = "auth:jwt:keyring:lock"
+    CHANNEL = "auth:jwt:keyring"
+
+    class LockTimeoutError(Exception):
+        """잠금 대기 시간 초과"""
+        pass
+
+    class DecryptionError(Exception):
+        """저장된 키링 복호화 실패 (암호화 키 불일치)"""
+        pass
+
+    def __init__(
+            self,
+            client: Redis,
+            encryption_keys: list[str],
+            lock_ms: int = 30000,
+            lock_wait_ms: int = 10000
+        ):
+        if not encryption_keys:
+            raise ValueError("RedisKeyStore requires at least one encryption key")
+        self.client = client
+        self.__fernet = MultiFernet([Fernet(key) for key in encryption_keys])
+        self.__LOCK_MS = lock_ms
+        self.__LOCK_WAIT_MS = lock_wait_ms
+        self.__release = client.register_script(_RELEASE_SCRIPT)
+        self.__task: Optional[asyncio.Task] = None
+
+    async def load(self) -> Optional[dict]:
+        raw = await self.client.get(self.KEY)
+        if raw is None:
+            return None
+        if raw.startswith("{"):
+            # 암호화 이전 평문 키링, 다음 저장(회전) 때 암호화됨
+            logger.warning("JWT keyring in Redis is stored unencrypted")
+            return json.loads(raw)
+        try:
+            return json.loads(self.__fernet.decrypt(raw.encode()))
+        except InvalidToken as e:
+            raise RedisKeyStore.DecryptionError("JWT keyring decryption failed") from e
+
+    async def save(self, data: dict) -> None:
+        token = self.__fernet.encrypt(json.dumps(data, separators=(",", ":")).encode())
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(self.KEY, token.decode())
+            pipe.publish(self.CHANNEL, data.get("generation", 0))
+            await pipe.execute()
+
+    @asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        token = uuid4().hex
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.__LOCK_WAIT_MS / 1000
+        delay = 0.05
+        while not await self.client.set(self.LOCK_KEY, token, px=self.__LOCK_MS, nx=True):
+            if loop.time() >= deadline:
+                raise RedisKeyStore.LockTimeoutError("JWT keyring lock wait timed out")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        try:
+            yield
+        finally:
+            try:
+                await self.__release(keys=[self.LOCK_KEY], args=[token])
+            except Exception as e:
+                logger.warning(f"JWT keyring lock release failed (expires in {self.__LOCK_MS}ms): {e}")
+
+    # ------------------------- 변경 알림 -------------------------
+
+    async def _listen(self, on_change: Callable[[], Awaitable[None]], ready: asyncio.Event) -> None:
+        while True:
+            try:
+                async with self.client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.CHANNEL)
+                    # 구독 후 다시 읽어야 그 사이 변경을 놓치지 않음
+                    await on_change()
+                    ready.set()
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if message and message.get("type") == "message":
+                            await on_change()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"JWT keyring sync failed, retrying: {e}")
+                await asyncio.sleep(1)
+
+    async def watch(self, on_change: Callable[[], Awaitable[None]]) -> None:
+        """구독 시작, 첫 동기화가 끝날 때까지 대기"""
+        ready = asyncio.Event()
+        self.__task = asyncio.create_task(self._listen(on_change, ready))
+        await ready.wait()
+
+    async def close(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+
+
+class SharedMemoryKeyStore(JWTKeyStore):
+    """
+    호스트 내 공유 메모리 키링 (uvicorn 워커 여러 개, 단일 노드)
+
+    파일: <path>         키링 JSON (소유 프로세스만 기록, 재시작 후에도 유지)
+          <path>.shm     게시용 mmap (헤더 + 키링 JSON)
+          <path>.owner   소유 프로세스 선출용 flock (프로세스가 죽으면 커널이 해제)
+
+    mmap 헤더: magic(8) | seq(u64) | length(u32)
+        기록: seq를 홀수로 올림 -> 본문 기록 -> seq를 짝수로 올림
+        읽기: seq가 짝수이고 본문을 읽은 뒤에도 같을 때만 사용 (seqlock)
+    나머지 워커는 poll_interval마다 seq(메모리 8바이트)만 확인하고,
+    바뀌었을 때만 본문을 다시 읽음. 요청 처리 중에는 파일 I/O 없음.
+    소유 프로세스가 종료되면 다음 확인 때 다른 워커가 소유권을 넘겨받음.
+    """
+    MAGIC = b"JWTKRING"
+    HEADER = struct.Struct("<8sQI")
+    SIZE = 64 * 1024
+    READ_RETRIES = 1000
+
+    class KeyringTooLargeError(Exception):
+        """키링이 mmap 크기를 넘음"""
+        pass
+
+    def __init__(self, key_path: str, poll_interval: float = 1.0):
+        self.__file = FileKeyStore(key_path)
+        self.__POLL_INTERVAL = poll_interval
+        self.__owner_fd: Optional[int] = None
+        self.__seen_seq = 0
+        self.__task: Optional[asyncio.Task] = None
+
+        fd = os.open(f"{self.__file.path}.shm", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size < self.SIZE:
+                os.ftruncate(fd, self.SIZE)
+            self.__map = mmap.mmap(fd, self.SIZE, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+
+    # ------------------------- 소유권 -------------------------
+
+    def claim_writer(self) -> bool:
+        """소유 flock을 잡았거나 잡을 수 있으면 True (대기하지 않음)"""
+        if self.__owner_fd is not None:
+            return True
+        fd = os.open(f"{self.__file.path}.owner", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self.__owner_fd = fd
+        logger.info(f"JWT keyring owner: pid {os.getpid()}")
+        return True
+
+    # ------------------------- seqlock -------------------------
+
+    def _read_published(self) -> tuple[int, Optional[bytes]]:
+        """
+        (seq, 게시된 키링 JSON), 게시 전이면 (0, None)
+
+        기록 중인 상태가 계속되면 (기록하던 소유 프로세스가 죽은 경우) None,
+        다음 소유 프로세스가 다시 게시할 때까지 기존 키링을 그대로 사용
+        """
+        for _ in range(self.READ_RETRIES):
+            magic, seq, length = self.HEADER.unpack_from(self.__map, 0)
+            if magic != self.MAGIC:
+                return 0, None
+            if seq % 2:
+                continue
+            payload = self.__map[self.HEADER.size:self.HEADER.size + length]
+            if self.HEADER.unpack_from(self.__map, 0)[1] == seq:
+                return seq, payload
+        return self.__seen_seq, None
+
+    def _publish(self, payload: bytes) -> None:
+        if self.HEADER.size + len(payload) > self.SIZE:
+            raise SharedMemoryKeyStore.KeyringTooLargeError(f"JWT keyring is {len(payload)} bytes")
+        magic, seq, _ = self.HEADER.unpack_from(self.__map, 0)
+        if magic != self.MAGIC:
+            seq = 0
+        # 이전 소유 프로세스가 기록 중에 죽어 홀수로 남았으면 짝수로 맞춤
+        # (그대로 +1 / +2 하면 계속 홀수라 나머지 워커가 갱신하지 못함)
+        seq += seq & 1
+        self.HEADER.pack_into(self.__map, 0, self.MAGIC, seq + 1, 0)
+        self.__map[self.HEADER.size:self.HEADER.size + len(payload)] = payload
+        self.HEADER.pack_into(self.__map, 0, self.MAGIC, seq + 2, len(payload))
+        self.__seen_seq = seq + 2
+
+    # ------------------------- 저장소 -------------------------
+
+    async def load(self) -> Optional[dict]:
+        # 소유 프로세스는 원본 파일, 나머지는 게시된 mmap에서 읽음
+        if self.__owner_fd is not None:
+            data = await self.__file.load()
+            if data is not None:
+                # 게시본이 없거나 다르면 (첫 실행, 소유권 이전) 원본으로 게시
+                payload = json.dumps(data, separators=(",", ":")).encode()
+                if self._read_published()[1] != payload:
+                    self._publish(payload)
+            return data
+        seq, payload = self._read_published()
+        self.__seen_seq = seq
+        return json.loads(payload) if payload is not None else None
+
+    async def save(self, data: dict) -> None:
+        await self.__file.save(data)
+        self._publish(json.dumps(data, separators=(",", ":")).encode())
+
+    def lock(self) -> AbstractAsyncContextManager[None]:
+        return self.__file.lock()
+
+    # ------------------------- 변경 확인 -------------------------
+
+    async def _poll(self, on_change: Callable[[], Awaitable[None]]) -> None:
+        while True:
+            await asyncio.sleep(self.__POLL_INTERVAL)
+            try:
+                if self.claim_writer():
+                    continue
+                seq = self.HEADER.unpack_from(self.__map, 0)[1]
+                if seq != self.__seen_seq and seq % 2 == 0:
+                    await on_change()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"JWT keyring sync failed: {e}")
+
+    async def watch(self, on_change: Callable[[], Awaitable[None]]) -> None:
+        """게시 순번 확인 시작"""
+        self.__task = asyncio.create_task(self._poll(on_change))
+
+    async def close(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+        if self.__owner_fd is not None:
+            fcntl.flock(self.__owner_fd, fcntl.LOCK_UN)
+            os.close(self.__owner_fd)
+            self.__owner_fd = None
+        self.__map.close()
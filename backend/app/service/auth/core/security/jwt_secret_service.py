@@ -1,102 +1,393 @@
-import os
 import secrets
 import json
 import asyncio
+from typing import Any, NamedTuple, Optional
 from loguru import logger
 
+import jwt
+from jwt.algorithms import get_default_algorithms
 from datetime import datetime, timezone
 from pydantic import Field, BaseModel
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from .jwt_key_store import JWTKeyStore, FileKeyStore
 
 
 class JWTSecretService:
     """
-    로컬 JWT 비밀 키 관리 유틸
+    JWT 비밀 키링 관리 유틸
 
+    키링 저장 위치는 JWTKeyStore로 교체 가능 (기본: 로컬 파일 FileKeyStore).
+    RedisKeyStore를 쓰면 여러 노드가 같은 키링을 공유하고,
+    회전 시 변경 알림을 받아 재시작 없이 메모리 키링을 다시 읽음.
     차후 AWS로 관리하는 로직도 가져오겠음.
 
     Lifespan에 추가하면 바로 사용 가능.
 
+    키링 구성:
+        active: 현재 토큰 서명에 사용하는 키
+        next: 다음 회전 때 active가 될 키 (활성화 전에 미리 게시)
+        retiring: 직전 active 키, 이미 발급된 토큰 검증용으로만 다음 회전까지 유지
+
+    토큰 헤더의 kid로 검증 키를 O(1) 조회하므로,
+    회전 시점에 발급된 토큰이 일제히 무효화되지 않습니다.
+
+    서명 알고리즘:
+        HS256 (대칭키, 기본값) / EdDSA (Ed25519) / ES256 (P-256) / RS256 (RSA 2048)
+        비대칭 알고리즘이면 공개키를 JWKS(jwks_json)로 게시하여
+        다른 서비스가 auth 호출 없이 로컬에서 토큰을 검증할 수 있음.
+        설정된 알고리즘이 바뀌면 next 키부터 새 알고리즘으로 생성되어 다음 회전 때 전환됨.
+
     예제:
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        app.state.jwt_manager = JWTSecretService()
+        app.state.jwt_manager = JWTSecretService(store=RedisKeyStore(app.state.redis_client, [fernet_key]))
+        await app.state.jwt_manager.init()
     """
     class JWTSecret(BaseModel):
-        secret_key: str = Field(..., description="JWT 비밀 키")
+        kid: str = Field(default_factory=lambda: secrets.token_hex(8), description="JWT 키 식별자")
+        algorithm: str = Field("HS256", description="JWT 서명 알고리즘")
+        secret_key: str = Field(..., description="JWT 비밀 키 (비대칭 알고리즘이면 PEM 개인키)")
+        public_key: Optional[str] = Field(None, description="PEM 공개키 (비대칭 알고리즘 전용)")
         created_at: int = Field(..., description="JWT 비밀 키 생성 시간")
-        expired_at: int = Field(..., description="JWT 비밀 키 만료 시간")
+        expired_at: int = Field(..., description="JWT 비밀 키 만료 시간 (active로서의 만료 시점)")
+
+    class KeyMaterial(NamedTuple):
+        """PyJWT에 바로 넘길 수 있도록 파싱해 둔 키 (요청마다 PEM 파싱 방지)"""
+        kid: str
+        algorithm: str
+        signing_key: Any
+        verification_key: Any
+
+    class JWTKeyring(BaseModel):
+        generation: int = Field(0, description="키링 변경 세대 (회전마다 1 증가)")
+        active: "JWTSecret" = Field(..., description="서명용 키")
+        next: "JWTSecret" = Field(..., description="다음 회전 때 활성화될 키")
+        retiring: Optional["JWTSecret"] = Field(None, description="검증 전용 직전 키")
+
+        def keys(self) -> list["JWTSecret"]:
+            keys = [self.active, self.next]
+            if self.retiring is not None:
+                keys.append(self.retiring)
+            return keys
 
     class setting(BaseModel):
         SECRET_KEY_PATH: str = Field("./jwt_secret_key.json", description="JWT 비밀 키 파일 경로")
         SECRET_KEY_ROTATION_DAYS: int = Field(30, description="JWT 비밀 키 회전 주기(일)")
 
+    class KeyNotFoundError(Exception):
+        """kid에 해당하는 키 미발견 예외"""
+        pass
+
+    class NotSupportedAlgorithmError(Exception):
+        """지원하지 않는 알고리즘 예외"""
+        pass
 
-    def __init__(self, key_path: str = None, rotation_days: int = None, rsa_mode: bool = False):
+    ALLOW_ALGORITHMS = ["HS256", "EdDSA", "ES256", "RS256"]
+    ROTATION_RETRY_SECONDS = 60
+    KEYRING_WAIT_SECONDS = 30
+
+
+    def __init__(
+            self,
+            key_path: str = None,
+            rotation_days: int = None,
+            rsa_mode: bool = False,
+            algorithm: str = "HS256",
+            store: Optional[JWTKeyStore] = None
+        ):
         # 무거운 작업은 init()으로 옮김: 생성자는 빠르게 반환
+        if rsa_mode:
+            algorithm = "RS256"
+        if algorithm not in self.ALLOW_ALGORITHMS:
+            raise JWTSecretService.NotSupportedAlgorithmError(f"지원하지 않는 알고리즘입니다. 지원 알고리즘: {self.ALLOW_ALGORITHMS}")
+
         self.scheduler = AsyncIOScheduler()
-        self.current_secret = None
-        self.__KEY_PATH = key_path
+        self.keyring: Optional[JWTSecretService.JWTKeyring] = None
+        self.__keys: dict[str, JWTSecretService.JWTSecret] = {}
+        self.__materials: dict[str, JWTSecretService.KeyMaterial] = {}
+        self.jwks_json: bytes = b'{"keys":[]}'
+        self.jwks_etag: str = '"0"'
+        self.store = store or FileKeyStore(key_path)
         self.__ROTATION_DAYS = rotation_days
-        self.__RSA_MODE = rsa_mode
-
-        if not self.__KEY_PATH.startswith('/'):
-            self.__KEY_PATH = os.path.join(os.getcwd(), self.__KEY_PATH)
+        self.__ALGORITHM = algorithm
 
     async def init(self) -> None:
         """
-        비동기 초기화: 파일 I/O 같은 블로킹 작업은 스레드로 실행.
+        비동기 초기화: 키 생성 같은 블로킹 작업은 스레드로 실행.
         lifespan에서 반드시 await manager.init() 호출할 것.
         """
-        # _load_or_create_key 는 현재 동기 함수이므로 to_thread로 실행
-        self.current_secret = await asyncio.to_thread(self._load_or_create_key)
+        # 여러 워커가 동시에 떠도 키링 생성 / 따라잡기 회전은 한 곳에서만
+        if self.store.claim_writer():
+            async with self.store.lock():
+                keyring = await self._load_or_create_key()
+        else:
+            keyring = await self._wait_for_keyring()
+        self._set_keyring(keyring)
+        # 다른 워커 / 노드의 회전 알림 구독 (지원하는 저장소만)
+        await self.store.watch(self.reload)
         # 스케줄 등록/시작은 이벤트루프 친화적으로 수행
-        self._schedule_next_rotation() 
+        self._schedule_next_rotation()
+
+    async def close(self) -> None:
+        """저장소 구독 종료 (스케줄러 종료는 별도)"""
+        await self.store.close()
+
+    # ------------------------- 키 조회 -------------------------
+
+    @property
+    def current_secret(self) -> Optional[JWTSecret]:
+        """현재 서명용(active) 키"""
+        return self.keyring.active if self.keyring else None
+
+    @property
+    def generation(self) -> int:
+        return self.keyring.generation if self.keyring else 0
+
+    def get_key(self, kid: str) -> Optional[JWTSecret]:
+        """kid로 키 조회 (active / next / retiring)"""
+        return self.__keys.get(kid)
+
+    def resolve_key(self, token: str) -> JWTSecret:
+        """
+        토큰 헤더의 kid로 검증 키 선택
+
+        kid가 없는 토큰(키링 도입 이전 발급)은 active 키로 검증
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            return self.current_secret
+        key = self.__keys.get(kid)
+        if key is None:
+            raise JWTSecretService.KeyNotFoundError(f"알 수 없는 키 식별자입니다: {kid}")
+        return key
+
+    def signing_material(self) -> KeyMaterial:
+        """active 키의 서명용 키 재료"""
+        return self.__materials[self.keyring.active.kid]
+
+    def verification_material(self, token: str) -> KeyMaterial:
+        """토큰 헤더의 kid에 해당하는 검증용 키 재료"""
+        return self.__materials[self.resolve_key(token).kid]
+
+    def _set_keyring(self, keyring: JWTKeyring) -> None:
+        self.keyring = keyring
+        self.__keys = {key.kid: key for key in keyring.keys()}
+        self.__materials = {key.kid: self._prepare_key(key) for key in keyring.keys()}
+        self._publish_jwks(keyring)
+
+    @staticmethod
+    def _prepare_key(key: JWTSecret) -> KeyMaterial:
+        algorithm = get_default_algorithms()[key.algorithm]
+        signing_key = algorithm.prepare_key(key.secret_key)
+        verification_key = algorithm.prepare_key(key.public_key) if key.public_key else signing_key
+        return JWTSecretService.KeyMaterial(key.kid, key.algorithm, signing_key, verification_key)
+
+    # ------------------------- JWKS -------------------------
+
+    def _publish_jwks(self, keyring: JWTKeyring) -> None:
+        """
+        공개키를 JWKS 문서로 직렬화해 둠 (키링이 바뀔 때만 재계산)
+
+        next 키도 포함하여, 활성화 전에 다운스트림 캐시에 미리 반영되도록 함.
+        대칭키(HS256)는 게시하지 않음.
+        """
+        keys = []
+        for key in keyring.keys():
+            if not key.public_key:
+                continue
+            material = self.__materials[key.kid]
+            jwk = get_default_algorithms()[key.algorithm].to_jwk(material.verification_key, as_dict=True)
+            jwk.update({"kid": key.kid, "alg": key.algorithm, "use": "sig"})
+            keys.append(jwk)
+        self.jwks_json = json.dumps({"keys": keys}, separators=(",", ":")).encode("utf-8")
+        self.jwks_etag = f'"{keyring.generation}-{keyring.next.kid}"'
+
+    # ------------------------- 키 생성 / 저장 -------------------------
 
     def _now_ts(self) -> int:
         return int(datetime.now(tz=timezone.utc).timestamp())
 
-    def _generate_new_key(self) -> JWTSecret:
+    def _generate_new_key(self, expired_at: int = None) -> JWTSecret:
         now = self._now_ts()
-        if self.__RSA_MODE:
-            # RSA 키 쌍 생성 로직 추가 예정
-            pass
+        secret_key, public_key = self._generate_key_pair(self.__ALGORITHM)
         return self.JWTSecret(
-            secret_key=secrets.token_hex(32),
+            algorithm=self.__ALGORITHM,
+            secret_key=secret_key,
+            public_key=public_key,
             created_at=now,
-            expired_at=now + self.__ROTATION_DAYS * 86400
+            expired_at=expired_at or now + self.__ROTATION_DAYS * 86400
         )
 
-    def _key_file_exists(self) -> bool:
-        return os.path.exists(self.__KEY_PATH)
-
-    def _save_key(self, jwt_secret: JWTSecret):
-        with open(self.__KEY_PATH, 'w') as f:
-            json.dump(jwt_secret.model_dump(), f)
-
-    def _load_or_create_key(self) -> JWTSecret:
-        if not self._key_file_exists():
-            key = self._generate_new_key()
-            self._save_key(key)
-            return key
-
-        with open(self.__KEY_PATH) as f:
-            data = json.load(f)
-            key = self.JWTSecret.model_validate(data)
-            if self._now_ts() >= key.expired_at:
-                key = self._generate_new_key()
-                self._save_key(key)
-        return key
+    @staticmethod
+    def _generate_key_pair(algorithm: str) -> tuple[str, Optional[str]]:
+        """(비밀 키 또는 PEM 개인키, PEM 공개키) 생성"""
+        if algorithm == "HS256":
+            return secrets.token_hex(32), None
+
+        if algorithm == "EdDSA":
+            private_key = ed25519.Ed25519PrivateKey.generate()
+        elif algorithm == "ES256":
+            private_key = ec.generate_private_key(ec.SECP256R1())
+        else:
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+        private_pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        public_pem = private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        return private_pem.decode("utf-8"), public_pem.decode("utf-8")
+
+    def _generate_keyring(self) -> JWTKeyring:
+        active = self._generate_new_key()
+        return self.JWTKeyring(
+            active=active,
+            next=self._generate_new_key(active.expired_at + self.__ROTATION_DAYS * 86400)
+        )
+
+    def _read_keyring(self, data: dict) -> JWTKeyring:
+        """저장된 키링 파싱, 단일 키 형식(이전 버전)은 active 키로 이전"""
+        if "active" in data:
+            return self.JWTKeyring.model_validate(data)
 
-    def rotate_key(self) -> None:
-        if self.current_secret.expired_at < self._now_ts():
-            key = self._generate_new_key()
-            self._save_key(key)
-            self.current_secret = key
+        legacy = self.JWTSecret.model_validate(data)
+        return self.JWTKeyring(
+            active=legacy,
+            next=self._generate_new_key(legacy.expired_at + self.__ROTATION_DAYS * 86400)
+        )
+
+    async def _load_or_create_key(self) -> JWTKeyring:
+        """
+        저장된 키링을 읽어 필요하면 생성 / 회전 / 알고리즘 전환 후 저장
+
+        store.lock() 안에서 호출할 것
+        """
+        data = await self.store.load()
+        # 키 생성(RSA 등)은 CPU 작업이므로 스레드로 실행
+        keyring, changed = await asyncio.to_thread(self._reconcile, data)
+        if changed:
+            await self.store.save(keyring.model_dump())
+        return keyring
+
+    async def _wait_for_keyring(self) -> JWTKeyring:
+        """
+        키링을 쓸 수 없는 프로세스: 소유 프로세스가 게시할 때까지 대기
 
-    def _schedule_next_rotation(self):
-        run_date = datetime.fromtimestamp(self.current_secret.expired_at, tz=timezone.utc)
-        self.scheduler.add_job(self.rotate_key, "date", run_date=run_date)
+        기다리는 동안 소유 프로세스가 종료되면 소유권을 넘겨받아 직접 생성
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.KEYRING_WAIT_SECONDS
+        while True:
+            if self.store.claim_writer():
+                async with self.store.lock():
+                    return await self._load_or_create_key()
+            data = await self.store.load()
+            if data is not None:
+                return self._read_keyring(data)
+            if loop.time() >= deadline:
+                raise TimeoutError("JWT keyring was not published in time")
+            await asyncio.sleep(0.1)
+
+    def _reconcile(self, data: Optional[dict]) -> tuple[JWTKeyring, bool]:
+        """(최신 키링, 저장 필요 여부)"""
+        if data is None:
+            return self._generate_keyring(), True
+
+        migrated = "active" not in data
+        keyring = self._read_keyring(data)
+
+        # 서비스 중단 기간 동안 지난 회전을 따라잡음
+        rotated = self._now_ts() >= keyring.active.expired_at
+        if rotated:
+            keyring = self._rotated(keyring)
+            if self._now_ts() >= keyring.active.expired_at:
+                # next 키까지 만료된 경우: 새 키링 발급, 직전 키만 검증용으로 유지
+                fresh = self._generate_keyring()
+                keyring = self.JWTKeyring(
+                    generation=keyring.generation,
+                    active=fresh.active,
+                    next=fresh.next,
+                    retiring=keyring.retiring
+                )
+
+        # 설정된 알고리즘이 바뀌었으면 next 키만 새 알고리즘으로 교체 (다음 회전 때 전환)
+        if keyring.next.algorithm != self.__ALGORITHM:
+            keyring = keyring.model_copy(update={
+                "generation": keyring.generation + 1,
+                "next": self._generate_new_key(keyring.next.expired_at),
+            })
+            migrated = True
+
+        return keyring, rotated or migrated
+
+    # ------------------------- 회전 -------------------------
+
+    def _rotated(self, keyring: JWTKeyring) -> JWTKeyring:
+        """active -> retiring, next -> active, 새 next 생성"""
+        new_active = keyring.next
+        return self.JWTKeyring(
+            generation=keyring.generation + 1,
+            active=new_active,
+            next=self._generate_new_key(new_active.expired_at + self.__ROTATION_DAYS * 86400),
+            retiring=keyring.active
+        )
+
+    async def rotate_key(self) -> None:
+        """
+        active 만료 시 회전
+
+        잠금 안에서 저장된 키링을 다시 읽으므로, 다른 워커 / 노드가 먼저 회전했으면
+        그 결과를 그대로 사용 (회전은 키링당 한 번).
+        키링을 쓸 수 없는 프로세스는 게시된 키링만 다시 읽음
+        """
+        if not self.store.claim_writer():
+            await self.reload()
+            # 소유 프로세스가 아직 회전 전이면 잠시 후 다시 확인 (게시되면 reload가 재예약)
+            self._schedule_next_rotation(retry=self.keyring.active.expired_at <= self._now_ts())
+            return
+        try:
+            async with self.store.lock():
+                keyring = await self._load_or_create_key()
+            if keyring != self.keyring:
+                self._set_keyring(keyring)
+                logger.info(f"JWT 키 회전 완료: active={keyring.active.kid}, next={keyring.next.kid}")
+        except Exception as e:
+            logger.error(f"JWT 키 회전 실패, {self.ROTATION_RETRY_SECONDS}초 후 재시도: {e}")
+            self._schedule_next_rotation(retry=True)
+            return
+        self._schedule_next_rotation()
+
+    async def reload(self) -> None:
+        """저장소의 키링이 바뀌었으면 메모리 키링 교체 (변경 알림 수신 시)"""
+        data = await self.store.load()
+        if data is None:
+            return
+        keyring = self._read_keyring(data)
+        if keyring == self.keyring:
+            return
+        self._set_keyring(keyring)
+        self._schedule_next_rotation()
+        logger.info(f"JWT 키링 갱신: generation={keyring.generation}, active={keyring.active.kid}")
+
+    def _schedule_next_rotation(self, retry: bool = False):
+        run_ts = self.keyring.active.expired_at
+        if retry:
+            run_ts = self._now_ts() + self.ROTATION_RETRY_SECONDS
+        run_date = datetime.fromtimestamp(run_ts, tz=timezone.utc)
+        self.scheduler.add_job(
+            self.rotate_key,
+            "date",
+            run_date=run_date,
+            id="jwt_key_rotation",
+            replace_existing=True
+        )
         if not self.scheduler.running:
             self.scheduler.start()
-        logger.info(f"다음 키 회전 예약: {run_date}")
\ No newline at end of file
+        logger.info(f"다음 키 회전 예약: {run_date}")
@@ -1,5 +1,23 @@
 import re
+import time
+import asyncio
 import bcrypt
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from pydantic import BaseModel, Field
+
+
+# 프로세스 풀에서도 pickle 가능하도록 모듈 최상위 함수로 정의
+def _checkpw(plain_password: bytes, hashed_password: bytes) -> tuple[bool, float]:
+    started = time.perf_counter()
+    result = bcrypt.checkpw(plain_password, hashed_password)
+    return result, time.perf_counter() - started
+
+
+def _hashpw(plain_password: bytes, rounds: int) -> tuple[bytes, float]:
+    started = time.perf_counter()
+    hashed = bcrypt.hashpw(plain_password, bcrypt.gensalt(rounds=rounds))
+    return hashed, time.perf_counter() - started
+
 
 class PasswordHasher:
     """
@@ -10,11 +28,44 @@ class PasswordHasher:
 
     기본값:
         bcrypt_rounds: bcrypt 해싱 라운드 수 (기본값: 16)
+        executor_mode: 비동기 해싱 실행기 종류 ("thread" | "process", 기본값: "thread")
+        max_workers: 실행기 워커 수 (기본값: 2)
+        max_pending: 실행 중 + 대기 중 작업 상한, 초과 요청은 이벤트 루프에서 대기 (기본값: 64)
+
+    비동기 핸들러에서는 verify_password_async / hash_password_async 를 사용할 것.
+    bcrypt 연산이 전용 실행기에서 수행되어 이벤트 루프를 막지 않습니다.
+
+    calibrate_async()로 호스트 성능을 측정해 목표 검증 지연에 맞는 라운드 수를 정할 수 있고,
+    needs_rehash()로 저장된 해시의 cost가 현재 라운드 수보다 낮은지 확인할 수 있습니다.
     """
-    def __init__(self, bcrypt_rounds: int = 16):
+    def __init__(
+            self,
+            bcrypt_rounds: int = 16,
+            executor_mode: str = "thread",
+            max_workers: int = 2,
+            max_pending: int = 64
+        ):
+        allow_executor_modes = ["thread", "process"]
+        if executor_mode not in allow_executor_modes:
+            raise PasswordHasher.NotSupportedExecutorError(f"지원하지 않는 실행기입니다. 지원 실행기: {allow_executor_modes}")
+
         self.__BCRYPT_ROUNDS: int = bcrypt_rounds
         self.__password_regex: str = r"^(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*])[A-Za-z\d!@#$%^&*]{8,16}$"
-    
+
+        self.__EXECUTOR_MODE: str = executor_mode
+        self.__MAX_WORKERS: int = max_workers
+        self.__MAX_PENDING: int = max(max_pending, max_workers)
+        self.__executor: Executor | None = None
+        self.__semaphore: asyncio.Semaphore | None = None
+
+        # 실행기 지표
+        self.__waiting: int = 0
+        self.__running: int = 0
+        self.__completed: int = 0
+        self.__total_wait: float = 0.0
+        self.__max_wait: float = 0.0
+        self.__last_wait: float = 0.0
+
 
     class passwordValidationError(Exception):
         """비밀번호 정규식 실패 예외"""
@@ -24,6 +75,54 @@ class PasswordHasher:
         """비밀번호 검증 실패 예외"""
         pass
 
+    class InvalidRoundsError(Exception):
+        """잘못된 bcrypt 라운드 범위 예외"""
+        pass
+
+    class NotSupportedExecutorError(Exception):
+        """지원하지 않는 실행기 예외"""
+        pass
+
+    class ExecutorStats(BaseModel):
+        mode: str = Field(..., description="실행기 종류")
+        max_workers: int = Field(..., description="실행기 워커 수")
+        max_pending: int = Field(..., description="실행 중 + 대기 중 작업 상한")
+        queue_depth: int = Field(..., description="실행 중 + 대기 중 작업 수")
+        waiting: int = Field(..., description="슬롯을 기다리는 작업 수")
+        completed: int = Field(..., description="완료된 작업 수")
+        last_wait_ms: float = Field(..., description="마지막 작업의 대기 시간(ms)")
+        avg_wait_ms: float = Field(..., description="평균 대기 시간(ms)")
+        max_wait_ms: float = Field(..., description="최대 대기 시간(ms)")
+
+
+    @property
+    def rounds(self) -> int:
+        """현재 해싱에 사용하는 bcrypt 라운드 수"""
+        return self.__BCRYPT_ROUNDS
+
+    @staticmethod
+    def get_rounds(hashed_password: str) -> int | None:
+        """bcrypt 해시($2b$12$...)에 저장된 cost 추출, 형식이 다르면 None"""
+        parts = hashed_password.split("$")
+        if len(parts) < 4 or not parts[2].isdigit():
+            return None
+        return int(parts[2])
+
+    def set_rounds(self, rounds: int) -> None:
+        """해싱에 사용할 bcrypt 라운드 수 지정 (다른 워커가 보정한 값 적용)"""
+        if not 4 <= rounds <= 31:
+            raise PasswordHasher.InvalidRoundsError("bcrypt 라운드 범위가 올바르지 않습니다. (4 <= rounds <= 31)")
+        self.__BCRYPT_ROUNDS = rounds
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        저장된 해시의 cost가 현재 라운드 수보다 낮으면 True
+
+        높은 cost는 그대로 둠: 워커 / 호스트마다 라운드 수가 달라도
+        같은 비밀번호가 번갈아 재해싱되거나 cost가 낮아지지 않도록 상향만 허용
+        """
+        rounds = self.get_rounds(hashed_password)
+        return rounds is None or rounds < self.__BCRYPT_ROUNDS
 
     def validate_password(self, plain_password: str) -> None:
         """비밀번호 정책(정규식) 검증"""
@@ -42,4 +141,124 @@ class PasswordHasher:
         salt = bcrypt.gensalt(rounds=self.__BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(plain_password.encode('utf-8'), salt)
         encode_hashed = hashed.decode('utf-8')
-        return encode_hashed
\ No newline at end of file
+        return encode_hashed
+
+    # ------------------------- 비동기 (전용 실행기) -------------------------
+
+    def _get_executor(self) -> Executor:
+        if self.__executor is None:
+            if self.__EXECUTOR_MODE == "process":
+                self.__executor = ProcessPoolExecutor(max_workers=self.__MAX_WORKERS)
+            else:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.__MAX_WORKERS,
+                    thread_name_prefix="bcrypt"
+                )
+            self.__semaphore = asyncio.Semaphore(self.__MAX_PENDING)
+        return self.__executor
+
+    async def _run(self, func, *args):
+        """
+        전용 실행기에서 bcrypt 연산 실행
+
+        대기 시간 = 전체 소요 시간 - 워커에서의 실제 연산 시간
+        (프로세스 풀에서도 동일하게 측정 가능)
+        """
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+
+        self.__waiting += 1
+        try:
+            await self.__semaphore.acquire()
+        finally:
+            self.__waiting -= 1
+
+        self.__running += 1
+        try:
+            result, elapsed = await loop.run_in_executor(executor, func, *args)
+        finally:
+            self.__running -= 1
+            self.__semaphore.release()
+
+        wait = max(time.perf_counter() - submitted - elapsed, 0.0)
+        self.__completed += 1
+        self.__total_wait += wait
+        self.__last_wait = wait
+        self.__max_wait = max(self.__max_wait, wait)
+        return result
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> None:
+        """verify_password 비동기 버전 (전용 실행기에서 bcrypt 수행)"""
+        matched = await self._run(
+            _checkpw,
+            plain_password.encode('utf-8'),
+            hashed_password.encode('utf-8')
+        )
+        if not matched:
+            raise PasswordHasher.passwordVerificationError("비밀번호가 일치하지 않습니다.")
+
+    async def hash_password_async(self, plain_password: str) -> str:
+        """hash_password 비동기 버전 (전용 실행기에서 bcrypt 수행)"""
+        hashed = await self._run(
+            _hashpw,
+            plain_password.encode('utf-8'),
+            self.__BCRYPT_ROUNDS
+        )
+        return hashed.decode('utf-8')
+
+    async def calibrate_async(
+            self,
+            target_ms: float,
+            min_rounds: int = 10,
+            max_rounds: int = 16,
+            samples: int = 3
+        ) -> int:
+        """
+        호스트 벤치마크로 목표 검증 지연(target_ms)을 넘지 않는 최대 라운드 수를 선택
+
+        Description:
+            min_rounds에서 samples회 해싱한 중앙값을 기준으로,
+            라운드가 1 늘 때마다 비용이 2배가 되는 bcrypt 특성으로 각 라운드의 지연을 추정.
+            선택된 라운드 수는 이후 해싱에 바로 적용됨.
+        """
+        if not 4 <= min_rounds <= max_rounds <= 31:
+            raise PasswordHasher.InvalidRoundsError("bcrypt 라운드 범위가 올바르지 않습니다. (4 <= min <= max <= 31)")
+
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        probe = b"calibration-probe"
+        timings = []
+        for _ in range(max(samples, 1)):
+            # 실행기 안에서 측정한 순수 연산 시간을 사용
+            _, elapsed = await loop.run_in_executor(executor, _hashpw, probe, min_rounds)
+            timings.append(elapsed)
+        base_ms = sorted(timings)[len(timings) // 2] * 1000
+
+        rounds = min_rounds
+        while rounds < max_rounds and base_ms * 2 ** (rounds + 1 - min_rounds) <= target_ms:
+            rounds += 1
+
+        self.__BCRYPT_ROUNDS = rounds
+        return rounds
+
+    def stats(self) -> ExecutorStats:
+        completed = self.__completed
+        return PasswordHasher.ExecutorStats(
+            mode=self.__EXECUTOR_MODE,
+            max_workers=self.__MAX_WORKERS,
+            max_pending=self.__MAX_PENDING,
+            queue_depth=self.__running + self.__waiting,
+            waiting=self.__waiting,
+            completed=completed,
+            last_wait_ms=round(self.__last_wait * 1000, 3),
+            avg_wait_ms=round(self.__total_wait / completed * 1000, 3) if completed else 0.0,
+            max_wait_ms=round(self.__max_wait * 1000, 3),
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """실행기 종료 (lifespan 종료 시 호출)"""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=wait)
+            self.__executor = None
+            self.__semaphore = None
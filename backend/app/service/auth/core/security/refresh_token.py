@@ -1,4 +1,5 @@
 # core/security/refresh_token.py
+import hmac
 import secrets
 import hashlib
 from datetime import datetime, timezone
@@ -8,22 +9,28 @@ class RefreshTokenService:
     """
     리프래시 토큰 관리 유틸리티
 
-    토큰 형식 -> CSPRNG 기반 32바이트 랜덤 문자열
+    토큰 형식 -> CSPRNG 기반 32바이트 랜덤 문자열 (클라이언트: urlsafe base64)
+    저장 형식 -> 토큰의 SHA-256 digest 32바이트 (DB BYTEA / Redis 키)
+
+    클라이언트에 주는 토큰과 저장하는 값이 다르므로 저장소가 유출되어도 토큰을 쓸 수 없음.
 
     사용법:
-        refresh_token_service = RefreshTokenService(byte_length=32, store_hashed=True, expire_days=30)
+        refresh_token_service = RefreshTokenService(byte_length=32, expire_days=30)
+        token = refresh_token_service.create_token(user_uuid)   # token.token -> 쿠키, token.digest -> 저장
+        digest = RefreshTokenService.digest(cookie_value)        # 조회 키
     기본값:
         byte_length: 리프래시 토큰 바이트 길이 (기본값: 32)
-        store_hashed: 토큰 저장 시 해싱 여부 (기본값: True)
         expire_days: 토큰 만료 기간 (기본값: 30일)
     """
-    def __init__(self, byte_length: int = 32, store_hashed: bool = True, expire_days: int = 30):
+    DIGEST_SIZE = 32
+
+    def __init__(self, byte_length: int = 32, expire_days: int = 30):
         self.__REFRESH_TOKEN_BYTE_LENGTH = byte_length
-        self.__REFRESH_TOKEN_STORE_HASHED = store_hashed
         self.__REFRESH_TOKEN_EXPIRE_DAYS = expire_days
     
     class TokenResponse(BaseModel):
-        token: str = Field(..., description="리프래시 토큰")
+        token: str = Field(..., description="리프래시 토큰 (클라이언트 전달용)")
+        digest: bytes = Field(..., exclude=True, description="저장 / 조회용 SHA-256 digest")
         created_at: int = Field(..., description="토큰 생성 시간(Unix timestamp)")
         expires_in: int = Field(..., description="토큰 만료까지 남은 시간(초)")
         expires_at: int = Field(..., description="토큰 만료 시간(Unix timestamp)")
@@ -39,19 +46,20 @@ class RefreshTokenService:
         """CSPRNG 기반 리프래시 토큰 생성"""
         create_at, expires_at, expires_in = self.get_expiration_datetime()
         token = secrets.token_urlsafe(self.__REFRESH_TOKEN_BYTE_LENGTH)
-        if self.__REFRESH_TOKEN_STORE_HASHED:
-            token = hashlib.sha256(token.encode('utf-8')).hexdigest()
         return RefreshTokenService.TokenResponse(
             token=token,
+            digest=self.digest(token),
             created_at=create_at,
             expires_in=expires_in,
             expires_at=expires_at,
             user_uuid=user_uuid
         )
 
-    def verify_token(self, token: str, stored_token: str) -> bool:
+    @staticmethod
+    def digest(token: str) -> bytes:
+        """클라이언트 토큰 -> 저장 / 조회용 32바이트 digest"""
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+    def verify_token(self, token: str, stored_digest: bytes) -> bool:
         """리프래시 토큰 검증"""
-        if self.__REFRESH_TOKEN_STORE_HASHED:
-            hash_token = hashlib.sha256(token.encode('utf-8')).hexdigest()
-            return hash_token == stored_token
-        return token == stored_token
\ No newline at end of file
+        return hmac.compare_digest(self.digest(token), stored_digest)
\ No newline at end of file
@@ -3,12 +3,14 @@
 
 from .database import *
 from .redis import *
+from .redis_codec import *
 from .settings import *
 from .async_mail_client import * 
 
 __all__ = [
     "database",
     "redis",
+    "redis_codec",
     "settings",
     "async_mail_client",
 ]
\ No newline at end of file
@@ -1,14 +1,25 @@
 # backend/auth/app/database.py
 import os
+import time
+import functools
+from pathlib import Path
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import AsyncGenerator, Optional
 from fastapi import FastAPI, Request
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import exc as sa_exc
 from sqlalchemy import text
+from alembic.config import Config as AlembicConfig
+from alembic.script import ScriptDirectory
 from pydantic import BaseModel, Field
 from loguru import logger
 from urllib.parse import quote_plus
 
+from .query_stats import instrument_engine
+
 
 # 데이터베이스 init 할 때 필요 config
 class DatabaseSettings(BaseModel):
@@ -17,54 +28,295 @@ class DatabaseSettings(BaseModel):
     user: str = Field(..., description="데이터베이스 사용자 이름")
     password: str = Field(..., description="데이터베이스 비밀번호")
     name: str = Field(..., description="데이터베이스 이름")
+    pool_size: int = Field(10, description="워커당 유지 커넥션 수")
+    max_overflow: int = Field(10, description="pool_size 초과 허용 커넥션 수")
+    pool_recycle: int = Field(1800, description="커넥션 재생성 주기(초), -1이면 사용 안 함")
+    pool_timeout: float = Field(30.0, description="커넥션 대기 최대 시간(초)")
+    pool_pre_ping: bool = Field(True, description="체크아웃 시 커넥션 생존 확인")
+    statement_cache_size: int = Field(100, description="asyncpg prepared statement 캐시 크기 (pgbouncer transaction 모드는 0)")
+    command_timeout: Optional[float] = Field(60.0, description="asyncpg 쿼리 타임아웃(초)")
+    replica_host: Optional[str] = Field(None, description="읽기 전용 replica 호스트 (없으면 primary만 사용)")
+    replica_port: Optional[int] = Field(None, description="replica 포트 (없으면 port와 동일)")
+    create_all: bool = Field(False, description="시작 시 create_all로 스키마 생성 (개발 환경 전용)")
+    query_stats_headers: bool = Field(True, description="응답에 X-DB-* 쿼리 집계 헤더 추가")
+    query_warn_statements: int = Field(20, description="요청당 SQL 문장 수 경고 임계값 (0이면 사용 안 함)")
 
 
-def get_database_url(setting: DatabaseSettings) -> str:
+def get_database_url(setting: DatabaseSettings, replica: bool = False) -> str:
     # 사용자/비밀번호에 특수문자가 포함될 수 있으므로 인코딩
     user = quote_plus(setting.user)
     password = quote_plus(setting.password)
-    return f"postgresql+asyncpg://{user}:{password}@{setting.host}:{setting.port}/{setting.name}"
+    host = setting.host
+    port = setting.port
+    if replica:
+        host = setting.replica_host
+        port = setting.replica_port or setting.port
+    return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{setting.name}"
 
 Base = declarative_base()
 
 
-async def init_db(app: FastAPI, setting: DatabaseSettings) -> None:
+class PoolStats(BaseModel):
+    pool_size: int = Field(..., description="설정된 pool 크기")
+    max_overflow: int = Field(..., description="설정된 overflow 한도")
+    checked_out: int = Field(..., description="현재 사용 중인 커넥션 수")
+    checked_in: int = Field(..., description="현재 pool에서 대기 중인 커넥션 수")
+    overflow: int = Field(..., description="현재 overflow 커넥션 수 (음수면 아직 생성되지 않은 pool 슬롯)")
+    checkouts: int = Field(..., description="누적 체크아웃 횟수")
+    slow_checkouts: int = Field(..., description="대기 시간이 임계값을 넘은 체크아웃 횟수")
+    timeouts: int = Field(..., description="pool_timeout 초과로 실패한 체크아웃 횟수")
+    wait_ms_avg: float = Field(..., description="평균 체크아웃 대기 시간(ms)")
+    wait_ms_max: float = Field(..., description="최대 체크아웃 대기 시간(ms)")
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
     """
-    Lifespan에서 호출: 엔진/세션메이커를 1회 생성하여 app.state에 저장
+    체크아웃 대기 시간을 측정하는 AsyncAdaptedQueuePool
+
+    pool이 가득 차 커넥션을 기다린 시간과 pool_timeout 초과(pool 고갈)를 집계하고,
+    대기가 길어지면 경고 로그를 남김 (WARN_INTERVAL_SECONDS 간격으로 제한)
+    """
+    SLOW_CHECKOUT_SECONDS = 0.1
+    WARN_INTERVAL_SECONDS = 10.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.__last_warning = 0.0
+
+    def _warn(self, message: str) -> None:
+        now = time.monotonic()
+        if now - self.__last_warning >= self.WARN_INTERVAL_SECONDS:
+            self.__last_warning = now
+            logger.warning(f"{message} ({self.status()})")
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except sa_exc.TimeoutError:
+            self.timeouts += 1
+            self._warn("DB pool exhausted: checkout timed out")
+            raise
+        waited = time.perf_counter() - started
+
+        self.checkouts += 1
+        self.wait_total += waited
+        if waited > self.wait_max:
+            self.wait_max = waited
+        if waited >= self.SLOW_CHECKOUT_SECONDS:
+            self.slow_checkouts += 1
+            self._warn(f"DB pool checkout waited {waited * 1000:.1f}ms")
+        return connection
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            pool_size=self.size(),
+            max_overflow=self._max_overflow,
+            checked_out=self.checkedout(),
+            checked_in=self.checkedin(),
+            overflow=self.overflow(),
+            checkouts=self.checkouts,
+            slow_checkouts=self.slow_checkouts,
+            timeouts=self.timeouts,
+            wait_ms_avg=round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            wait_ms_max=round(self.wait_max * 1000, 3),
+        )
+
+
+# ------------------------- Replica Routing -------------------------
+
+_replica_safe: ContextVar[bool] = ContextVar("db_replica_safe", default=False)
+
+
+def replica_safe(func):
+    """
+    replica에서 읽어도 되는 CRUD 함수 표시
+
+    get_read_db 세션으로 호출된 경우에만 replica로 라우팅되며,
+    get_db 세션이거나 요청이 이미 쓰기를 한 경우에는 primary를 사용.
+    복제 지연(stale read)을 허용할 수 없는 조회에는 사용하지 말 것.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = _replica_safe.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _replica_safe.reset(token)
+    return wrapper
+
+
+class RoutingSession(Session):
+    """
+    primary / replica 라우팅 세션 (AsyncSession의 sync_session_class)
+
+    info:
+        primary: primary 동기 엔진
+        replica: replica 동기 엔진 (읽기 세션에만 존재)
+        route: 요청 단위 라우팅 상태 {"pinned": bool}
+
+    - flush 및 INSERT/UPDATE/DELETE는 primary, 요청을 primary에 고정 (read-your-writes)
+    - replica_safe 함수 안의 읽기는 고정되지 않은 경우에만 replica
+    - 그 외는 primary
     """
-    engine: AsyncEngine = create_async_engine(
-        get_database_url(setting),
-        pool_pre_ping=True,  # 끊어진 커넥션 자동 감지
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primary = self.info.get("primary")
+        if primary is None:
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        route = self.info.get("route")
+        if self._flushing or getattr(clause, "is_dml", False):
+            if route is not None:
+                route["pinned"] = True
+            return primary
+
+        replica = self.info.get("replica")
+        if replica is not None and _replica_safe.get() and not (route or {}).get("pinned"):
+            return replica
+        return primary
+
+
+# ------------------------- Schema Version -------------------------
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
+
+
+class SchemaVersionError(RuntimeError):
+    """DB 스키마가 코드가 기대하는 마이그레이션 버전이 아님"""
+    pass
+
+
+@functools.lru_cache
+def get_schema_head() -> tuple[str, frozenset[str]]:
+    """(head 리비전, 이 빌드가 아는 전체 리비전) - 마이그레이션 파일에서 읽음"""
+    script = ScriptDirectory.from_config(AlembicConfig(str(ALEMBIC_INI)))
+    revisions = frozenset(rev.revision for rev in script.walk_revisions())
+    return script.get_current_head(), revisions
+
+
+async def check_schema_version(engine: AsyncEngine) -> None:
+    """
+    alembic_version 1회 조회로 스키마 버전 확인
+
+    - head와 같으면 통과
+    - 이 빌드가 아는 이전 리비전이면 예외 (alembic upgrade head 필요)
+    - 모르는 리비전이면 경고만 (DB가 더 최신인 롤링 배포 중)
+    """
+    head, revisions = get_schema_head()
+    try:
+        async with engine.connect() as conn:
+            current = (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalar()
+    except sa_exc.DBAPIError as e:
+        raise SchemaVersionError(
+            "alembic_version 테이블이 없습니다. 'alembic upgrade head'를 먼저 실행하세요. "
+            "(이전 버전의 create_all로 만든 DB는 0001이 기존 테이블을 그대로 사용하며, "
+            "수동으로 맞추려면 'alembic stamp 0001' 후 'alembic upgrade head')"
+        ) from e
+
+    if current == head:
+        return
+    if current in revisions:
+        raise SchemaVersionError(
+            f"DB 스키마가 최신이 아닙니다 (현재 {current}, 필요 {head}). 'alembic upgrade head'를 실행하세요."
+        )
+    logger.warning(f"DB schema revision {current} is unknown to this build (head {head}); continuing")
+
+
+def _create_engine(setting: DatabaseSettings, replica: bool = False) -> AsyncEngine:
+    engine = create_async_engine(
+        get_database_url(setting, replica=replica),
+        poolclass=InstrumentedAsyncPool,
+        pool_size=setting.pool_size,
+        max_overflow=setting.max_overflow,
+        pool_recycle=setting.pool_recycle,
+        pool_timeout=setting.pool_timeout,
+        pool_pre_ping=setting.pool_pre_ping,  # 끊어진 커넥션 자동 감지
+        connect_args={
+            "statement_cache_size": setting.statement_cache_size,
+            "command_timeout": setting.command_timeout,
+        },
         future=True,
     )
+    instrument_engine(engine)
+    return engine
+
+
+async def init_db(app: FastAPI, setting: DatabaseSettings) -> None:
+    """
+    Lifespan에서 호출: 엔진/세션메이커를 1회 생성하여 app.state에 저장
+
+    replica_host가 설정되면 replica 엔진과 읽기 전용 세션메이커(get_read_db)도 생성
+    """
+    engine: AsyncEngine = _create_engine(setting)
     SessionLocal = sessionmaker(
         bind=engine,
         expire_on_commit=False,
         class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        info={"primary": engine.sync_engine},
     )
 
     app.state.db_engine = engine
     app.state.async_session_maker = SessionLocal
+    app.state.db_replica_engine = None
+    app.state.async_read_session_maker = SessionLocal
 
-    # 스키마 자동 생성(개발 환경에서만 사용 권장)
-    try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-    except Exception:
-        logger.exception("DB schema create_all 실패")
+    if setting.replica_host:
+        replica_engine: AsyncEngine = _create_engine(setting, replica=True)
+        app.state.db_replica_engine = replica_engine
+        app.state.async_read_session_maker = sessionmaker(
+            bind=engine,
+            expire_on_commit=False,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            info={"primary": engine.sync_engine, "replica": replica_engine.sync_engine},
+        )
+        logger.info(f"DB replica configured : {setting.replica_host}")
 
-    logger.info(f"DB Successfully connected : {setting.host}")
+    if setting.create_all:
+        # 스키마 자동 생성(개발 환경 전용, 마이그레이션 이력은 남지 않음)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+        except Exception:
+            logger.exception("DB schema create_all 실패")
+    else:
+        await check_schema_version(engine)
+
+    logger.info(
+        f"DB Successfully connected : {setting.host} "
+        f"(pool_size={setting.pool_size}, max_overflow={setting.max_overflow})"
+    )
 
 
 async def close_db(app: FastAPI) -> None:
     """
     Lifespan 종료 시 호출: 엔진 정리
     """
+    replica_engine: Optional[AsyncEngine] = getattr(app.state, "db_replica_engine", None)
+    if replica_engine is not None:
+        await replica_engine.dispose()
+
     engine: Optional[AsyncEngine] = getattr(app.state, "db_engine", None)
     if engine is not None:
         logger.info(f"DB Successfully disconnected")
         await engine.dispose()
 
+
+def _get_route(request: Request) -> dict:
+    """요청 단위 라우팅 상태 (get_db / get_read_db 세션이 공유)"""
+    route = getattr(request.state, "db_route", None)
+    if route is None:
+        route = {"pinned": False}
+        request.state.db_route = route
+    return route
+
+
 async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     요청 단위 의존성: 세션을 열고, 요청 처리 후 자동 닫기
@@ -72,10 +324,129 @@ async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     SessionLocal = getattr(request.app.state, "async_session_maker", None)
     if SessionLocal is None:
         raise RuntimeError("Async session maker is not initialized on app.state")
-    async with SessionLocal() as session:
+    async with SessionLocal(info={"route": _get_route(request)}) as session:
         yield session
 
 
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    요청 단위 읽기 의존성: replica_safe 함수의 조회를 replica로 보내는 세션
+
+    같은 요청에서 쓰기가 일어난 뒤에는 primary로 고정되며,
+    replica가 설정되지 않았으면 get_db와 동일하게 동작
+    """
+    SessionLocal = (
+        getattr(request.app.state, "async_read_session_maker", None)
+        or getattr(request.app.state, "async_session_maker", None)
+    )
+    if SessionLocal is None:
+        raise RuntimeError("Async session maker is not initialized on app.state")
+    async with SessionLocal(info={"route": _get_route(request)}) as session:
+        yield session
+
+
+@asynccontextmanager
+async def primary_session(request: Request, db: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+    """
+    replica_safe 함수라도 primary에서 읽어야 하는 조회용 세션 (캐시 채우기 등)
+
+    db가 replica로 라우팅될 수 없는 세션(get_db, replica 미설정)이면 그대로 사용하고,
+    아니면 같은 요청 라우팅 상태를 공유하는 primary 세션을 새로 엶
+    """
+    if db.info.get("replica") is None:
+        yield db
+        return
+    async with request.app.state.async_session_maker(info={"route": _get_route(request)}) as session:
+        yield session
+
+
+def get_pool_stats(app: FastAPI, replica: bool = False) -> Optional[PoolStats]:
+    """워커 프로세스의 DB 커넥션 pool 지표, 계측 pool이 아니면 None"""
+    engine: Optional[AsyncEngine] = getattr(app.state, "db_replica_engine" if replica else "db_engine", None)
+    if engine is None:
+        return None
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedAsyncPool):
+        return None
+    return pool.stats()
+
+
+# ------------------------- Unit of Work -------------------------
+
+@asynccontextmanager
+async def unit_of_work(db: AsyncSession) -> AsyncGenerator[AsyncSession, None]:
+    """
+    여러 CRUD 호출을 하나의 트랜잭션으로 묶음
+
+    블록 안에서 commit_or_flush를 쓰는 CRUD 함수는 flush만 하고,
+    블록이 끝나면 1회 commit, 예외가 나면 전체 rollback.
+    중첩 사용 시 가장 바깥 블록만 commit 합니다.
+
+    사용법:
+        async with unit_of_work(db):
+            user = await create_user(db, ...)
+            await create_profile(db, user.user_uuid, ...)
+    """
+    if db.info.get("unit_of_work"):
+        yield db
+        return
+
+    db.info["unit_of_work"] = True
+    try:
+        yield db
+        await db.commit()
+    except BaseException:
+        await db.rollback()
+        db.info.pop("after_commit", None)
+        await _run_callbacks(db.info.pop("after_rollback", []))
+        raise
+    finally:
+        db.info.pop("unit_of_work", None)
+
+    db.info.pop("after_rollback", None)
+    await _run_callbacks(db.info.pop("after_commit", []))
+
+
+async def _run_callbacks(callbacks: list) -> None:
+    """트랜잭션 종료 후 등록된 작업 실행 (실패해도 요청 결과는 바꾸지 않고 로그만 남김)"""
+    for callback, args in callbacks:
+        try:
+            await callback(*args)
+        except Exception as e:
+            logger.error(f"Transaction callback {getattr(callback, '__qualname__', callback)} failed: {e}")
+
+
+async def commit_or_flush(db: AsyncSession) -> None:
+    """unit_of_work 안에서는 flush, 밖에서는 commit"""
+    if db.info.get("unit_of_work"):
+        await db.flush()
+    else:
+        await db.commit()
+
+
+async def after_commit(db: AsyncSession, callback, *args) -> None:
+    """
+    commit 이후 실행할 작업 등록 (캐시 무효화 등)
+
+    unit_of_work 안에서는 가장 바깥 블록이 commit 한 뒤 실행하고 rollback 되면 버림.
+    밖에서는 호출 전에 이미 commit 되었다고 보고 즉시 실행.
+    """
+    if db.info.get("unit_of_work"):
+        db.info.setdefault("after_commit", []).append((callback, args))
+    else:
+        await callback(*args)
+
+
+async def after_rollback(db: AsyncSession, callback, *args) -> None:
+    """
+    rollback 이후 실행할 보상 작업 등록 (Redis 등 트랜잭션 밖 상태 되돌리기)
+
+    unit_of_work 안에서만 의미가 있으며, 밖에서는 이미 commit 된 것으로 보고 등록하지 않음
+    """
+    if db.info.get("unit_of_work"):
+        db.info.setdefault("after_rollback", []).append((callback, args))
+
+
 # 간단한 DB 헬스체크 쿼리 예시 유틸
 async def db_healthcheck(session: AsyncSession) -> bool:
     result = await session.execute(text("SELECT 1"))
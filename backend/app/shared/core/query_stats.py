@@ -0,0 +1,181 @@
+# shared/core/query_stats.py
+"""
+요청 단위 SQL 계측
+
+SQLAlchemy 엔진 이벤트로 실행된 문장 수, DB 왕복 횟수, DB 시간을 집계하여
+응답 헤더(X-DB-*)와 로그 필드로 노출.
+
+    - statements: 커서 실행 횟수 (executemany는 1회)
+    - round_trips: statements + BEGIN / COMMIT / ROLLBACK
+    - db_time_ms: 커서 실행에 걸린 시간 합계
+
+테스트에서는 query_budget으로 엔드포인트별 쿼리 예산을 검사할 수 있음:
+    with query_budget(statements=3):
+        response = await client.get("/accounts/me")
+"""
+
+# Standard library imports
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Third-party imports
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryStats:
+    """요청 하나(또는 query_budget 블록 하나)의 SQL 집계"""
+    __slots__ = ("statements", "round_trips", "db_time")
+
+    def __init__(self):
+        self.statements = 0
+        self.round_trips = 0
+        self.db_time = 0.0
+
+    @property
+    def db_time_ms(self) -> float:
+        return round(self.db_time * 1000, 3)
+
+    def as_dict(self) -> dict:
+        return {
+            "db_statements": self.statements,
+            "db_round_trips": self.round_trips,
+            "db_time_ms": self.db_time_ms,
+        }
+
+
+# 중첩된 집계 블록(미들웨어 안의 query_budget 등)이 모두 같은 쿼리를 세도록 튜플로 보관
+_active_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar("db_query_stats", default=())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """블록 안에서 실행된 SQL 집계"""
+    stats = QueryStats()
+    token = _active_stats.set(_active_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 요청의 집계, 집계 중이 아니면 None"""
+    active = _active_stats.get()
+    return active[-1] if active else None
+
+
+# ------------------------- Engine Events -------------------------
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    active = _active_stats.get()
+    if not active:
+        return
+    elapsed = time.perf_counter() - started
+    for stats in active:
+        stats.statements += 1
+        stats.round_trips += 1
+        stats.db_time += elapsed
+
+
+def _handle_error(exception_context):
+    # 실패한 문장도 왕복 1회로 집계
+    conn = exception_context.connection
+    if conn is None or not conn.info.get("query_started"):
+        return
+    started = conn.info["query_started"].pop()
+    elapsed = time.perf_counter() - started
+    for stats in _active_stats.get():
+        stats.statements += 1
+        stats.round_trips += 1
+        stats.db_time += elapsed
+
+
+def _transaction_round_trip(conn, *args):
+    for stats in _active_stats.get():
+        stats.round_trips += 1
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """엔진에 계측 이벤트 등록 (엔진 생성 직후 1회)"""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+    for name in ("begin", "commit", "rollback"):
+        event.listen(sync_engine, name, _transaction_round_trip)
+
+
+# ------------------------- Middleware -------------------------
+
+class QueryStatsMiddleware:
+    """
+    요청마다 SQL을 집계하여 응답 헤더와 로그로 출력하는 ASGI 미들웨어
+
+    헤더는 응답 시작 시점의 값이므로, 응답 전송 후 정리되는 세션의
+    ROLLBACK 등은 로그에만 반영됨.
+    warn_statements 이상 실행한 요청은 WARNING, 나머지는 DEBUG로 기록.
+    """
+    def __init__(self, app, headers: bool = True, warn_statements: int = 20):
+        self.app = app
+        self.headers = headers
+        self.warn_statements = warn_statements
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_headers(message):
+                if message["type"] == "http.response.start" and self.headers:
+                    headers = list(message.get("headers", []))
+                    headers.extend([
+                        (b"x-db-statements", str(stats.statements).encode()),
+                        (b"x-db-round-trips", str(stats.round_trips).encode()),
+                        (b"x-db-time-ms", f"{stats.db_time_ms:.3f}".encode()),
+                    ])
+                    message["headers"] = headers
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                level = "WARNING" if self.warn_statements and stats.statements >= self.warn_statements else "DEBUG"
+                logger.bind(**stats.as_dict()).log(
+                    level,
+                    f"{scope['method']} {scope['path']} - {stats.statements} statements, "
+                    f"{stats.round_trips} round trips, {stats.db_time_ms:.1f}ms DB"
+                )
+
+
+# ------------------------- Test Helper -------------------------
+
+class QueryBudgetExceeded(AssertionError):
+    """쿼리 예산 초과"""
+    pass
+
+
+@contextmanager
+def query_budget(statements: int, round_trips: Optional[int] = None) -> Iterator[QueryStats]:
+    """
+    블록 안의 SQL이 예산을 넘으면 QueryBudgetExceeded
+
+    ASGI transport로 앱을 프로세스 안에서 호출하는 테스트에서 사용 (N+1 회귀 방지)
+        with query_budget(statements=2):
+            await client.post("/auth/token", data=...)
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.statements > statements:
+        raise QueryBudgetExceeded(f"SQL statements {stats.statements} > budget {statements}")
+    if round_trips is not None and stats.round_trips > round_trips:
+        raise QueryBudgetExceeded(f"DB round trips {stats.round_trips} > budget {round_trips}")
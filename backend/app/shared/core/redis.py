@@ -1,9 +1,19 @@
 # backend/auth/app/redis.py
-from typing import Optional
+import time
+import asyncio
+from typing import Any, Optional
 from fastapi import FastAPI, Request
 from pydantic import BaseModel, Field
 from loguru import logger
+from cachetools import TTLCache
 import redis.asyncio as redis
+from redis.asyncio.connection import BlockingConnectionPool
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.client import NEVER_DECODE
+from redis.exceptions import ConnectionError, TimeoutError, ResponseError
+
+from .redis_codec import RedisCodec, TextCodec
 
 
 class RedisSettings(BaseModel):
@@ -12,21 +22,276 @@ class RedisSettings(BaseModel):
     db: int = Field(..., description="Redis DB 번호")
     user: Optional[str] = Field(None, description="Redis 사용자명")
     password: Optional[str] = Field(None, description="Redis 비밀번호")
+    max_connections: int = Field(50, description="워커당 최대 커넥션 수")
+    pool_timeout: float = Field(5.0, description="커넥션이 모두 사용 중일 때 대기 최대 시간(초)")
+    socket_timeout: Optional[float] = Field(2.0, description="명령 응답 대기 시간(초)")
+    socket_connect_timeout: Optional[float] = Field(2.0, description="연결 대기 시간(초)")
+    socket_keepalive: bool = Field(True, description="TCP keepalive 사용")
+    retry_attempts: int = Field(3, description="연결 오류 / 타임아웃 시 재시도 횟수 (0이면 재시도 안 함)")
+    retry_backoff_base: float = Field(0.05, description="재시도 지수 백오프 시작 값(초)")
+    retry_backoff_cap: float = Field(1.0, description="재시도 지수 백오프 최대 값(초)")
+    health_check_interval: int = Field(30, description="유휴 커넥션 재사용 전 PING 주기(초), 0이면 사용 안 함")
+    client_cache_enabled: bool = Field(False, description="CLIENT TRACKING 기반 로컬 캐시 사용")
+    client_cache_prefixes: list[str] = Field(default_factory=lambda: ["accounts:me:"], description="로컬 캐시 대상 키 prefix")
+    client_cache_size: int = Field(10000, description="로컬 캐시 최대 키 수")
+    client_cache_ttl: float = Field(60.0, description="로컬 캐시 최대 보관 시간(초), 무효화 누락 대비")
+
+
+# ------------------------- Connection Pool -------------------------
+
+class RedisPoolStats(BaseModel):
+    max_connections: int = Field(..., description="설정된 최대 커넥션 수")
+    in_use: int = Field(..., description="현재 사용 중인 커넥션 수")
+    idle: int = Field(..., description="현재 pool에서 대기 중인 커넥션 수")
+    checkouts: int = Field(..., description="누적 체크아웃 횟수")
+    slow_checkouts: int = Field(..., description="대기 시간이 임계값을 넘은 체크아웃 횟수")
+    timeouts: int = Field(..., description="pool_timeout 초과로 실패한 체크아웃 횟수")
+    wait_ms_avg: float = Field(..., description="평균 체크아웃 대기 시간(ms)")
+    wait_ms_max: float = Field(..., description="최대 체크아웃 대기 시간(ms)")
+
+
+class InstrumentedBlockingConnectionPool(BlockingConnectionPool):
+    """
+    체크아웃 대기 시간을 측정하는 BlockingConnectionPool
+
+    커넥션이 모두 사용 중이면 pool_timeout까지 기다리고 (기본 ConnectionPool은 즉시 실패),
+    대기 시간과 timeout(pool 고갈)을 집계. 경고 로그는 WARN_INTERVAL_SECONDS 간격으로 제한
+    """
+    SLOW_CHECKOUT_SECONDS = 0.05
+    WARN_INTERVAL_SECONDS = 10.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.__last_warning = 0.0
+
+    def _warn(self, message: str) -> None:
+        now = time.monotonic()
+        if now - self.__last_warning >= self.WARN_INTERVAL_SECONDS:
+            self.__last_warning = now
+            logger.warning(
+                f"{message} (in_use={len(self._in_use_connections)}, max={self.max_connections})"
+            )
+
+    async def get_connection(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except ConnectionError as e:
+            if isinstance(e.__cause__, asyncio.TimeoutError):
+                self.timeouts += 1
+                self._warn("Redis pool exhausted: checkout timed out")
+            raise
+        waited = time.perf_counter() - started
+
+        self.checkouts += 1
+        self.wait_total += waited
+        if waited > self.wait_max:
+            self.wait_max = waited
+        if waited >= self.SLOW_CHECKOUT_SECONDS:
+            self.slow_checkouts += 1
+            self._warn(f"Redis pool checkout waited {waited * 1000:.1f}ms")
+        return connection
+
+    def stats(self) -> RedisPoolStats:
+        return RedisPoolStats(
+            max_connections=self.max_connections,
+            in_use=len(self._in_use_connections),
+            idle=len(self._available_connections),
+            checkouts=self.checkouts,
+            slow_checkouts=self.slow_checkouts,
+            timeouts=self.timeouts,
+            wait_ms_avg=round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            wait_ms_max=round(self.wait_max * 1000, 3),
+        )
+
+
+# ------------------------- Client-side Cache -------------------------
+
+class ClientSideCache:
+    """
+    CLIENT TRACKING(BCAST) 기반 워커 로컬 캐시
+
+    자주 읽는 키(prefixes)를 메모리에 보관하고, 서버가 해당 prefix의 키 변경을
+    __redis__:invalidate 채널로 알려주면 즉시 제거.
+        - 구독 커넥션과 추적(CLIENT TRACKING ... REDIRECT) 커넥션을 pool 밖에 따로 유지
+        - 두 커넥션 중 하나라도 끊기면 캐시를 비우고 재연결될 때까지 사용하지 않음
+        - 조회 도중 무효화가 들어오면 그 값은 저장하지 않음 (epoch 비교)
+    """
+    INVALIDATE_CHANNEL = "__redis__:invalidate"
+    PING_INTERVAL_SECONDS = 1.0
+
+    class Stats(BaseModel):
+        ready: bool = Field(..., description="무효화 수신 중 여부 (False면 캐시 미사용)")
+        entries: int = Field(..., description="보관 중인 키 수")
+        hits: int = Field(..., description="로컬 적중 수")
+        misses: int = Field(..., description="로컬 미스 수")
+        invalidations: int = Field(..., description="서버 무효화로 제거한 키 수")
+        flushes: int = Field(..., description="전체 비우기 횟수 (FLUSHDB, 연결 끊김 등)")
+
+    def __init__(
+            self,
+            pool: redis.ConnectionPool,
+            prefixes: list[str],
+            max_size: int = 10000,
+            ttl: float = 60.0
+        ):
+        self.__pool = pool
+        self.__PREFIXES = tuple(prefixes)
+        self.__cache: TTLCache = TTLCache(maxsize=max_size, ttl=ttl)
+        self.__epoch = 0
+        self.__ready = False
+        self.__started = asyncio.Event()
+        self.__task: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.flushes = 0
+
+    def get(self, key: str) -> Optional[str | bytes]:
+        """로컬 캐시 조회 (없거나 사용 불가면 None)"""
+        if not self.__ready:
+            return None
+        value = self.__cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def epoch(self) -> int:
+        """Redis 조회 직전에 받아 두었다가 set에 전달"""
+        return self.__epoch
 
+    def set(self, key: str, value: Optional[str | bytes], epoch: int) -> None:
+        """epoch 이후 무효화가 없었을 때만 저장"""
+        if value is None or not self.__ready or epoch != self.__epoch:
+            return
+        if key.startswith(self.__PREFIXES):
+            self.__cache[key] = value
+
+    def _invalidate(self, keys: Optional[list]) -> None:
+        self.__epoch += 1
+        if keys is None:
+            self._flush()
+            return
+        for key in keys:
+            if self.__cache.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def _flush(self) -> None:
+        self.__epoch += 1
+        self.__cache.clear()
+        self.flushes += 1
+
+    async def _listen(self) -> None:
+        while True:
+            subscriber = self.__pool.make_connection()
+            tracker = self.__pool.make_connection()
+            try:
+                await subscriber.connect()
+                await tracker.connect()
+                await subscriber.send_command("CLIENT", "ID")
+                subscriber_id = await subscriber.read_response()
+                await subscriber.send_command("SUBSCRIBE", self.INVALIDATE_CHANNEL)
+                await subscriber.read_response()
+
+                prefixes = [arg for prefix in self.__PREFIXES for arg in ("PREFIX", prefix)]
+                await tracker.send_command("CLIENT", "TRACKING", "ON", "REDIRECT", subscriber_id, "BCAST", *prefixes)
+                await tracker.read_response()
+
+                self.__ready = True
+                self.__started.set()
+                logger.info(f"Redis client-side cache tracking {list(self.__PREFIXES)}")
+                while True:
+                    message = await subscriber.read_response(timeout=self.PING_INTERVAL_SECONDS)
+                    if message is None:
+                        # 추적 커넥션이 끊기면 무효화가 오지 않으므로 주기적으로 확인
+                        await tracker.send_command("PING")
+                        await tracker.read_response()
+                    elif message[0] == "message":
+                        self._invalidate(message[2])
+            except asyncio.CancelledError:
+                raise
+            except ResponseError as e:
+                # CLIENT TRACKING 미지원 서버 (Redis 6 미만 등): 캐시 없이 동작
+                logger.warning(f"Redis client-side cache disabled: {e}")
+                self.__started.set()
+                return
+            except Exception as e:
+                logger.error(f"Redis client-side cache invalidation stream lost, retrying: {e}")
+                await asyncio.sleep(1)
+            finally:
+                self.__ready = False
+                self._flush()
+                await subscriber.disconnect(nowait=True)
+                await tracker.disconnect(nowait=True)
+
+    async def start(self) -> None:
+        """무효화 수신 시작, 첫 연결 시도가 끝날 때까지 대기"""
+        self.__task = asyncio.create_task(self._listen())
+        try:
+            await asyncio.wait_for(self.__started.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            logger.warning("Redis client-side cache not ready yet; continuing without it")
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+
+    def stats(self) -> Stats:
+        return ClientSideCache.Stats(
+            ready=self.__ready,
+            entries=len(self.__cache),
+            hits=self.hits,
+            misses=self.misses,
+            invalidations=self.invalidations,
+            flushes=self.flushes,
+        )
+
+
+# ------------------------- Lifespan -------------------------
 
 async def init_redis(app: FastAPI, setting: RedisSettings) -> None:
     """Redis 클라이언트 초기화"""
-    redis_client = redis.Redis(
+    retry = None
+    if setting.retry_attempts > 0:
+        retry = Retry(
+            ExponentialBackoff(cap=setting.retry_backoff_cap, base=setting.retry_backoff_base),
+            setting.retry_attempts,
+            # OSError / asyncio.TimeoutError: 소켓 연결 단계에서 나는 오류 (연결 거부, 연결 타임아웃)
+            supported_errors=(ConnectionError, TimeoutError, OSError, asyncio.TimeoutError),
+        )
+    pool = InstrumentedBlockingConnectionPool(
+        max_connections=setting.max_connections,
+        timeout=setting.pool_timeout,
         host=setting.host,
         port=setting.port,
         db=setting.db,
         username=setting.user,
         password=setting.password,
+        socket_timeout=setting.socket_timeout,
+        socket_connect_timeout=setting.socket_connect_timeout,
+        socket_keepalive=setting.socket_keepalive,
+        retry=retry,
+        health_check_interval=setting.health_check_interval,
         decode_responses=True
     )
-    
+    redis_client = redis.Redis.from_pool(pool)
+
     app.state.redis_client = redis_client
-    
+    app.state.redis_client_cache = None
+
     # 연결 테스트
     try:
         await redis_client.ping()
@@ -35,12 +300,26 @@ async def init_redis(app: FastAPI, setting: RedisSettings) -> None:
         logger.error(f"Redis connection failed: {e}")
         raise
 
+    if setting.client_cache_enabled:
+        client_cache = ClientSideCache(
+            pool,
+            setting.client_cache_prefixes,
+            max_size=setting.client_cache_size,
+            ttl=setting.client_cache_ttl,
+        )
+        await client_cache.start()
+        app.state.redis_client_cache = client_cache
+
 
 async def close_redis(app: FastAPI) -> None:
     """Redis 클라이언트 종료"""
+    client_cache: Optional[ClientSideCache] = getattr(app.state, "redis_client_cache", None)
+    if client_cache is not None:
+        await client_cache.stop()
+
     redis_client: Optional[redis.Redis] = getattr(app.state, "redis_client", None)
     if redis_client is not None:
-        await redis_client.close()
+        await redis_client.aclose()
         logger.info("Redis Successfully disconnected")
 
 
@@ -52,18 +331,48 @@ async def get_redis(request: Request) -> redis.Redis:
     return redis_client
 
 
+def get_redis_pool_stats(app: FastAPI) -> Optional[RedisPoolStats]:
+    """Redis 커넥션 pool 지표 (계측 pool이 아니면 None)"""
+    redis_client: Optional[redis.Redis] = getattr(app.state, "redis_client", None)
+    if redis_client is None:
+        return None
+    pool = redis_client.connection_pool
+    if not isinstance(pool, InstrumentedBlockingConnectionPool):
+        return None
+    return pool.stats()
+
+
 # Redis 유틸리티 클래스
 class Redis:
-    def __init__(self, client: redis.Redis):
+    """
+    Redis 유틸리티 (키-값 + TTL)
+
+    codec으로 저장 형태를 선택 (기본 TextCodec: 문자열 그대로).
+    값 codec은 SET / GET, HashCodec은 HSET / HGETALL 사용
+    """
+    def __init__(self, client: redis.Redis, codec: Optional[RedisCodec] = None):
         self.client = client
+        self.codec = codec or TextCodec()
     
-    async def set_with_ttl(self, key: str, value: str, ttl: int) -> bool:
+    async def set_with_ttl(self, key: str, value: Any, ttl: int) -> bool:
         """키-값 쌍을 TTL과 함께 저장"""
-        return await self.client.setex(key, ttl, value)
+        if self.codec.is_hash:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping=self.codec.encode(value))
+                pipe.expire(key, ttl)
+                await pipe.execute()
+            return True
+        return await self.client.setex(key, ttl, self.codec.encode(value))
     
-    async def get(self, key: str) -> Optional[str]:
+    async def get(self, key: str) -> Optional[Any]:
         """키로 값 조회"""
-        return await self.client.get(key)
+        if self.codec.is_hash:
+            raw = await self.client.hgetall(key)
+            return self.codec.decode(raw) if raw else None
+        # decode_responses 설정과 관계없이 bytes로 읽음 (바이너리 codec)
+        raw = await self.client.execute_command("GET", key, **{NEVER_DECODE: True})
+        return self.codec.decode(raw) if raw is not None else None
     
     async def delete(self, key: str) -> bool:
         """키 삭제"""
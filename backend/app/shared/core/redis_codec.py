@@ -0,0 +1,158 @@
+# shared/core/redis_codec.py
+"""
+Redis 값 직렬화 (codec)
+
+shared.core.redis.Redis 래퍼가 값을 어떤 형태로 저장할지 결정.
+    - TextCodec     문자열 그대로 (기존 동작, 기본값)
+    - JsonCodec     compact JSON
+    - MsgpackCodec  MessagePack 바이너리 (JSON보다 작고 파싱이 빠름)
+    - HashCodec     평탄한 dict를 Redis hash 필드로 저장
+                    (작은 hash는 Redis가 listpack으로 압축 저장, 필드 단위 HGET/HSET 가능)
+    - CompressedCodec  다른 값 codec을 감싸 threshold 이상일 때만 zlib 압축
+
+값 codec은 bytes로 읽음 (decode_responses=True 클라이언트에서도 NEVER_DECODE로 바이너리 조회).
+model을 주면 pydantic 모델을 그대로 저장 / 복원.
+make_codec으로 이름(benchmarks.bench_codecs 결과 키와 동일)에서 값 codec을 만들 수 있음.
+"""
+
+# Standard library imports
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+# Third-party imports
+import msgpack
+from pydantic import BaseModel
+
+
+class RedisCodec(ABC):
+    """값 <-> Redis 저장 형태 변환"""
+    name: str = ""
+    is_hash: bool = False   # True면 HSET / HGETALL, False면 SET / GET (bytes)
+
+    def __init__(self, model: Optional[type[BaseModel]] = None):
+        self.model = model
+
+    def _dump(self, value: Any) -> Any:
+        return value.model_dump(mode="json") if isinstance(value, BaseModel) else value
+
+    def _load(self, obj: Any) -> Any:
+        return self.model.model_validate(obj) if self.model is not None else obj
+
+    @abstractmethod
+    def encode(self, value: Any) -> Any:
+        ...
+
+    @abstractmethod
+    def decode(self, raw: Any) -> Any:
+        ...
+
+
+class TextCodec(RedisCodec):
+    """문자열 그대로 저장 (기존 Redis 래퍼 동작)"""
+    name = "text"
+
+    def encode(self, value: str) -> str:
+        return value
+
+    def decode(self, raw: bytes) -> str:
+        return raw.decode()
+
+
+class JsonCodec(RedisCodec):
+    """공백 없는 JSON"""
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, BaseModel):
+            return value.model_dump_json().encode()
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def decode(self, raw: bytes) -> Any:
+        if self.model is not None:
+            return self.model.model_validate_json(raw)
+        return json.loads(raw)
+
+
+class MsgpackCodec(RedisCodec):
+    """MessagePack 바이너리"""
+    name = "msgpack"
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(self._dump(value), use_bin_type=True)
+
+    def decode(self, raw: bytes) -> Any:
+        return self._load(msgpack.unpackb(raw, raw=False))
+
+
+class HashCodec(RedisCodec):
+    """
+    평탄한 dict -> Redis hash
+
+    값은 문자열로 저장 (bool은 "1"/"0", None 필드는 저장하지 않음).
+    list / dict 같은 중첩 값은 지원하지 않음 (TypeError). 복원 시 타입은 model로 되살림
+    """
+    name = "hash"
+    is_hash = True
+
+    def encode(self, value: Any) -> dict[str, str]:
+        mapping: dict[str, str] = {}
+        for field, item in self._dump(value).items():
+            if item is None:
+                continue
+            if isinstance(item, bool):
+                mapping[field] = "1" if item else "0"
+            elif isinstance(item, (str, int, float)):
+                mapping[field] = str(item)
+            else:
+                raise TypeError(f"HashCodec supports flat values only: {field}={type(item).__name__}")
+        return mapping
+
+    def decode(self, raw: dict[str, str]) -> Any:
+        return self._load(raw)
+
+
+class CompressedCodec(RedisCodec):
+    """
+    값 codec + threshold 이상일 때 zlib 압축
+
+    첫 바이트로 압축 여부 표시 (0x00 원본, 0x01 zlib)
+    """
+    RAW = b"\x00"
+    ZLIB = b"\x01"
+
+    def __init__(self, inner: RedisCodec, threshold: int = 1024, level: int = 6):
+        if inner.is_hash:
+            raise TypeError("CompressedCodec cannot wrap a hash codec")
+        super().__init__(inner.model)
+        self.inner = inner
+        self.threshold = threshold
+        self.level = level
+        self.name = f"{inner.name}+zlib"
+
+    def encode(self, value: Any) -> bytes:
+        data = self.inner.encode(value)
+        if isinstance(data, str):
+            data = data.encode()
+        if len(data) >= self.threshold:
+            compressed = zlib.compress(data, self.level)
+            if len(compressed) < len(data):
+                return self.ZLIB + compressed
+        return self.RAW + data
+
+    def decode(self, raw: bytes) -> Any:
+        flag, data = raw[:1], raw[1:]
+        if flag == self.ZLIB:
+            data = zlib.decompress(data)
+        return self.inner.decode(data)
+
+
+def make_codec(name: str, model: Optional[type[BaseModel]] = None, compress_threshold: int = 1024) -> RedisCodec:
+    """이름으로 값 codec 생성 ("json", "msgpack", "json+zlib", "msgpack+zlib")"""
+    codecs = {JsonCodec.name: JsonCodec, MsgpackCodec.name: MsgpackCodec}
+    base, _, compression = name.partition("+")
+    if base not in codecs or compression not in ("", "zlib"):
+        raise ValueError(f"Unknown Redis value codec: {name}")
+    codec = codecs[base](model)
+    return CompressedCodec(codec, threshold=compress_threshold) if compression else codec
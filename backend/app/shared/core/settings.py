@@ -26,6 +26,9 @@ ENV_FILE = SETTINGS_DIR / ".env.dev"
 class AppSettings(BaseSettings):
     NAME: str = Field(default="HiLi FastAPI MSA-Ready Boilerplate")
     VERSION: str = Field(default="0.0.1")
+    # /metrics 노출 여부 (기본 비활성). 토큰을 설정하면 "Authorization: Bearer <토큰>" 필요
+    METRICS_ENABLED: bool = Field(default=False)
+    METRICS_TOKEN: str = Field(default="")
 
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE),
@@ -69,13 +72,55 @@ class LoggingSettings(BaseSettings):
 
 class AuthSettings(BaseSettings):
     BCRYPT_ROUNDS: int = Field(default=12)
+    BCRYPT_EXECUTOR: str = Field(default="thread")  # "thread" | "process"
+    BCRYPT_MAX_WORKERS: int = Field(default=2)
+    BCRYPT_MAX_PENDING: int = Field(default=64)
+    BCRYPT_CALIBRATE: bool = Field(default=False)
+    BCRYPT_TARGET_VERIFY_MS: int = Field(default=250)
+    BCRYPT_MIN_ROUNDS: int = Field(default=10)
+    BCRYPT_MAX_ROUNDS: int = Field(default=16)
     SECRET_KEY_PATH: str = Field(default="./app/api/v1/auth/tools/jwt_secret.key")
     SECRET_KEY_ROTATION_DAYS: int = Field(default=30)
+    SECRET_KEY_STORE: str = Field(default="file")  # "file" | "shm" (호스트 내 워커 공유) | "redis" (여러 노드 공유)
+    # redis 키링 암호화용 Fernet 키 (쉼표 구분, 첫 번째로 암호화). redis 저장소 사용 시 필수
+    SECRET_KEY_STORE_ENCRYPTION_KEYS: str = Field(default="")
+    JWT_ALGORITHM: str = Field(default="HS256")  # "HS256" | "EdDSA" | "ES256" | "RS256"
+    JWKS_MAX_AGE_SECONDS: int = Field(default=3600)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=15)
+    ACCESS_TOKEN_CACHE_SIZE: int = Field(default=10000)
 
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7)
-    REFRESH_TOKEN_STORE_HASHED: bool = Field(default=False)
     REFRESH_TOKEN_BYTE_LENGTH: int = Field(default=32)
+    REFRESH_TOKEN_STORE: str = Field(default="database")  # "database" | "redis"
+    REFRESH_TOKEN_AUDIT: bool = Field(default=True)  # redis 저장소 사용 시 DB 감사 기록 여부
+
+    REVOCATION_BLOOM_CAPACITY: int = Field(default=100000)
+    REVOCATION_BLOOM_ERROR_RATE: float = Field(default=0.001)
+    REVOCATION_REBUILD_SECONDS: int = Field(default=600)
+
+    RATE_LIMIT_ENABLED: bool = Field(default=True)
+    # "허용 횟수/윈도(초)" 형식, sliding window
+    RATE_LIMIT_LOGIN_PER_IP: str = Field(default="20/60")
+    RATE_LIMIT_LOGIN_PER_USERNAME: str = Field(default="10/300")
+    RATE_LIMIT_EMAIL_PER_IP: str = Field(default="10/600")
+    RATE_LIMIT_EMAIL_PER_ADDRESS: str = Field(default="3/600")
+    # X-Forwarded-For를 신뢰할 프록시 IP / CIDR (쉼표 구분). 비어 있으면 헤더 무시, 접속 주소 사용
+    TRUSTED_PROXIES: str = Field(default="")
+
+    RETENTION_ENABLED: bool = Field(default=True)
+    RETENTION_INTERVAL_SECONDS: int = Field(default=3600)
+    RETENTION_BATCH_SIZE: int = Field(default=1000)
+    RETENTION_MAX_BATCHES: int = Field(default=100)  # 1회 실행당 테이블별 최대 배치 수
+    REFRESH_TOKEN_INACTIVE_RETENTION_HOURS: int = Field(default=24)
+    EMAIL_VERIFICATION_RETENTION_HOURS: int = Field(default=24)
+
+    @property
+    def secret_key_store_encryption_keys_list(self) -> list[str]:
+        return [key.strip() for key in self.SECRET_KEY_STORE_ENCRYPTION_KEYS.split(",") if key.strip()]
+
+    @property
+    def trusted_proxies_list(self) -> list[str]:
+        return [proxy.strip() for proxy in self.TRUSTED_PROXIES.split(",") if proxy.strip()]
 
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE),
@@ -87,6 +132,23 @@ class AuthSettings(BaseSettings):
     )
 
 
+class AccountSettings(BaseSettings):
+    CACHE_ENABLED: bool = Field(default=True)  # /accounts/me Redis read-through 캐시
+    CACHE_TTL_SECONDS: int = Field(default=300)
+    CACHE_LOCK_MS: int = Field(default=2000)  # 캐시 미스 시 DB 조회 잠금 유지 시간
+    CACHE_LOCK_WAIT_MS: int = Field(default=200)  # 다른 워커의 조회 결과를 기다리는 최대 시간
+    # 캐시 값 형식 "json" | "msgpack" | "json+zlib" | "msgpack+zlib" (benchmarks.bench_codecs 참고)
+    CACHE_CODEC: str = Field(default="json")
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE),
+        env_file_encoding="utf-8",
+        env_prefix="ACCOUNT_",
+        case_sensitive=True,
+        extra="ignore",
+    )
+
+
 class CookieSettings(BaseSettings):
     SECURE: bool = Field(default=True)
     SAMESITE: str = Field(default="none")
@@ -104,6 +166,12 @@ class CookieSettings(BaseSettings):
 class EmailVerifySettings(BaseSettings):
     VERIFY_TOKEN_EXPIRE_MINUTES: int = Field(default=10)
     VERIFY_CODE_LENGTH: int = Field(default=16)
+    VERIFY_MAX_ATTEMPTS: int = Field(default=5)  # 코드 입력 실패 허용 횟수, 초과 시 토큰 폐기
+    VERIFIED_TOKEN_EXPIRE_MINUTES: int = Field(default=60)  # 인증 완료 후 가입까지 허용 시간
+    STREAM_MAXLEN: int = Field(default=100000)  # DB 기록 대기 이벤트 스트림 최대 길이 (근사)
+    DRAIN_BATCH_SIZE: int = Field(default=500)
+    DRAIN_BLOCK_MS: int = Field(default=1000)  # REDIS_SOCKET_TIMEOUT보다 짧아야 함
+    DRAIN_CLAIM_IDLE_SECONDS: int = Field(default=60)  # 종료된 워커가 남긴 이벤트를 가져오기까지 대기 시간
 
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE),
@@ -135,6 +203,22 @@ class DatabaseSettings(BaseSettings):
     HOST: str = Field(default="localhost")
     PORT: int = Field(default=5432)
 
+    POOL_SIZE: int = Field(default=10)
+    MAX_OVERFLOW: int = Field(default=10)
+    POOL_RECYCLE: int = Field(default=1800)
+    POOL_TIMEOUT: float = Field(default=30.0)
+    POOL_PRE_PING: bool = Field(default=True)
+    STATEMENT_CACHE_SIZE: int = Field(default=100)  # pgbouncer transaction 모드에서는 0
+    COMMAND_TIMEOUT: Optional[float] = Field(default=60.0)
+
+    REPLICA_HOST: Optional[str] = Field(default=None)  # 설정 시 get_read_db 조회를 replica로 분산
+    REPLICA_PORT: Optional[int] = Field(default=None)
+
+    CREATE_ALL: bool = Field(default=False)  # 개발 환경 전용, 운영은 alembic upgrade head
+
+    QUERY_STATS_HEADERS: bool = Field(default=True)
+    QUERY_WARN_STATEMENTS: int = Field(default=20)
+
     @property
     def database_url(self) -> str:
         return f"postgresql://{self.USER}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.NAME}"
@@ -157,6 +241,26 @@ class RedisSettings(BaseSettings):
     DB: int = Field(default=0)
     USER: str = Field(default="default")
     PASSWORD: Optional[str] = Field(None)
+
+    MAX_CONNECTIONS: int = Field(default=50)
+    POOL_TIMEOUT: float = Field(default=5.0)
+    SOCKET_TIMEOUT: Optional[float] = Field(default=2.0)
+    SOCKET_CONNECT_TIMEOUT: Optional[float] = Field(default=2.0)
+    SOCKET_KEEPALIVE: bool = Field(default=True)
+    RETRY_ATTEMPTS: int = Field(default=3)
+    RETRY_BACKOFF_BASE: float = Field(default=0.05)
+    RETRY_BACKOFF_CAP: float = Field(default=1.0)
+    HEALTH_CHECK_INTERVAL: int = Field(default=30)
+
+    CLIENT_CACHE_ENABLED: bool = Field(default=False)  # CLIENT TRACKING 로컬 캐시 (Redis 6+)
+    CLIENT_CACHE_PREFIXES: str = Field(default="accounts:me:")
+    CLIENT_CACHE_SIZE: int = Field(default=10000)
+    CLIENT_CACHE_TTL_SECONDS: float = Field(default=60.0)
+
+    @property
+    def client_cache_prefixes_list(self) -> list[str]:
+        return [prefix.strip() for prefix in self.CLIENT_CACHE_PREFIXES.split(",") if prefix.strip()]
+
     @property
     def redis_url(self) -> str:
         if self.PASSWORD:
@@ -209,6 +313,11 @@ def get_logging_settings() -> LoggingSettings:
 def get_auth_settings() -> AuthSettings:
     return AuthSettings()
 
+@lru_cache
+def get_account_settings() -> AccountSettings:
+    return AccountSettings()
+
+
 @lru_cache
 def get_cookie_settings() -> CookieSettings:
     return CookieSettings()
@@ -247,6 +356,18 @@ def get_database_runtime() -> DatabaseRuntime:
         name=s.NAME,
         host=s.HOST,
         port=s.PORT,
+        pool_size=s.POOL_SIZE,
+        max_overflow=s.MAX_OVERFLOW,
+        pool_recycle=s.POOL_RECYCLE,
+        pool_timeout=s.POOL_TIMEOUT,
+        pool_pre_ping=s.POOL_PRE_PING,
+        statement_cache_size=s.STATEMENT_CACHE_SIZE,
+        command_timeout=s.COMMAND_TIMEOUT,
+        replica_host=s.REPLICA_HOST,
+        replica_port=s.REPLICA_PORT,
+        create_all=s.CREATE_ALL,
+        query_stats_headers=s.QUERY_STATS_HEADERS,
+        query_warn_statements=s.QUERY_WARN_STATEMENTS,
     )
 
 
@@ -272,6 +393,19 @@ def get_redis_runtime() -> RedisRuntime:
         db=s.DB,
         user=s.USER,
         password=s.PASSWORD,
+        max_connections=s.MAX_CONNECTIONS,
+        pool_timeout=s.POOL_TIMEOUT,
+        socket_timeout=s.SOCKET_TIMEOUT,
+        socket_connect_timeout=s.SOCKET_CONNECT_TIMEOUT,
+        socket_keepalive=s.SOCKET_KEEPALIVE,
+        retry_attempts=s.RETRY_ATTEMPTS,
+        retry_backoff_base=s.RETRY_BACKOFF_BASE,
+        retry_backoff_cap=s.RETRY_BACKOFF_CAP,
+        health_check_interval=s.HEALTH_CHECK_INTERVAL,
+        client_cache_enabled=s.CLIENT_CACHE_ENABLED,
+        client_cache_prefixes=s.client_cache_prefixes_list,
+        client_cache_size=s.CLIENT_CACHE_SIZE,
+        client_cache_ttl=s.CLIENT_CACHE_TTL_SECONDS,
     )
 
 
@@ -280,6 +414,7 @@ __all__ = [
     "get_cors_settings",
     "get_logging_settings",
     "get_auth_settings",
+    "get_account_settings",
     "get_cookie_settings",
     "get_email_verify_settings",
     "get_google_oauth_settings",
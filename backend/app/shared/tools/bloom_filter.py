@@ -0,0 +1,51 @@
+# shared/tools/bloom_filter.py
+import math
+import hashlib
+
+
+class BloomFilter:
+    """
+    메모리 내 Bloom filter
+
+    - 음성 응답("없음")은 항상 정확, 양성 응답은 error_rate 확률로 거짓 양성
+    - 삭제를 지원하지 않으므로, 만료된 항목을 정리하려면 새로 만들어 교체할 것
+
+    사용법:
+        bloom = BloomFilter(capacity=100000, error_rate=0.001)
+        bloom.add("jti")
+        "jti" in bloom  # True
+    """
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.__BIT_SIZE: int = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.__HASH_COUNT: int = max(int(round(self.__BIT_SIZE / capacity * math.log(2))), 1)
+        self.__bits = bytearray((self.__BIT_SIZE + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # double hashing: 128비트 digest 하나로 k개 위치 계산
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.__HASH_COUNT):
+            yield (h1 + i * h2) % self.__BIT_SIZE
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.__bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.__bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def bit_size(self) -> int:
+        return self.__BIT_SIZE
+
+    @property
+    def hash_count(self) -> int:
+        return self.__HASH_COUNT
@@ -1,23 +1,29 @@
 import jwt
+from typing import Optional
 from pydantic import BaseModel, Field
 from fastapi import Depends
 from fastapi.requests import Request
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.settings import get_cookie_settings
+from ..core.settings import get_cookie_settings, get_auth_settings
 from ..core.cookie_handler import AuthCookieHandler
 from ..core.database import get_db
+from .token_cache import AccessTokenCache
 # Auth Service (차후 gRPC로 분리 예정)
 from app.service.auth.app.service import rotate_tokens, IssueTokenResponse
 
 cookie_settings = get_cookie_settings()
+auth_settings = get_auth_settings()
 auth_cookie_handler = AuthCookieHandler(
     secure=cookie_settings.SECURE,
     path=cookie_settings.PATH,
     samesite=cookie_settings.SAMESITE,
 )
 
+# 검증 완료된 액세스 토큰 payload 캐시 (워커 단위)
+access_token_cache = AccessTokenCache(auth_settings.ACCESS_TOKEN_CACHE_SIZE)
+
 class ExpiredTokenError(Exception):
     """토큰 만료 예외"""
     pass
@@ -37,30 +43,44 @@ class AccessTokenPayload(BaseModel):
     sub: str = Field(..., description="사용자 UUID")
     iat: int = Field(..., description="발급 시간 (timestamp)")
     exp: int = Field(..., description="만료 시간 (timestamp)")
+    jti: Optional[str] = Field(None, description="토큰 식별자 (폐기 확인용)")
 
 def get_secret_key(request: Request) -> str:
     return request.app.state.jwt_manager.current_secret.secret_key
 
+def get_keyring_generation(request: Request) -> int:
+    return request.app.state.jwt_manager.generation
+
 def decode_token(request: Request, token: str, options: dict = None) -> dict:
     """
     JWT 디코딩. options에 verify_signature=False 가 명시되면 secret_key는 필수가 아님.
+
+    검증 키와 알고리즘은 토큰 헤더의 kid로 키링에서 선택
     """
     opts = options or {}
     verify_signature = opts.get("verify_signature", True)
-    secret_key = get_secret_key(request)
-
-    if verify_signature and not secret_key:
-        raise SecretKeyNotFoundError("비밀 키가 제공되지 않았습니다.")
 
     try:
+        verification_key = None
+        algorithms = None
+        if verify_signature:
+            material = request.app.state.jwt_manager.verification_material(token)
+            verification_key = material.verification_key
+            algorithms = [material.algorithm]
+            if not verification_key:
+                raise SecretKeyNotFoundError("비밀 키가 제공되지 않았습니다.")
+
         payload = jwt.decode(
             token,
-            key=(secret_key if verify_signature else None),
-            algorithms=["HS256"],
+            key=verification_key,
+            algorithms=algorithms,
             options=opts
         )
         return payload
 
+    except SecretKeyNotFoundError:
+        raise
+
     except Exception as e:
         # PyJWT의 ExpiredSignatureError가 있으면 별도 처리
         ExpiredErr = getattr(jwt, "ExpiredSignatureError", None)
@@ -86,6 +106,13 @@ def decode_token_without_validation(request: Request, token: str) -> dict:
     return decode_token(request, token, options)
 
 
+async def _ensure_not_revoked(request: Request, token_payload: AccessTokenPayload) -> None:
+    """폐기된 토큰이면 예외 (대부분 워커 메모리의 Bloom filter에서 판정)"""
+    revocation_list = getattr(request.app.state, "revocation_list", None)
+    if revocation_list is not None and await revocation_list.is_revoked(token_payload.jti):
+        raise InvalidTokenError("폐기된 토큰입니다.")
+
+
 # ------------------------- Depends ------------------------
 async def get_token(
         request: Request,
@@ -93,6 +120,14 @@ async def get_token(
         db: AsyncSession = Depends(get_db)
         ) -> str:
     access_token = request.cookies.get("access_token")
+    generation = get_keyring_generation(request)
+
+    # 같은 키링 세대에서 이미 검증된 토큰이면 디코딩 생략
+    cached_payload = access_token_cache.get(access_token, generation)
+    if cached_payload is not None:
+        await _ensure_not_revoked(request, cached_payload)
+        return cached_payload
+
     try:
         decoded_token = decode_token(request, access_token)
     except ExpiredTokenError as e:
@@ -102,8 +137,11 @@ async def get_token(
             access_token=new_tokens.access_token,
             refresh_token=new_tokens.refresh_token
         )
-        decoded_token = decode_token(request, new_tokens.access_token.token)
+        access_token = new_tokens.access_token.token
+        decoded_token = decode_token(request, access_token)
 
     token_payload: AccessTokenPayload = AccessTokenPayload(**decoded_token)
-    
+    access_token_cache.put(access_token, token_payload, token_payload.exp, generation)
+    await _ensure_not_revoked(request, token_payload)
+
     return token_payload
\ No newline at end of file
@@ -0,0 +1,121 @@
+# shared/tools/token_cache.py
+import time
+import hashlib
+from typing import Any, Optional
+
+from cachetools import TLRUCache
+from pydantic import BaseModel, Field
+
+
+class _CountingTLRUCache(TLRUCache):
+    """용량 초과 제거(eviction)와 만료 제거(expiration) 횟수를 세는 TLRUCache"""
+    def __init__(self, maxsize: int, ttu, timer=time.time):
+        super().__init__(maxsize, ttu, timer=timer)
+        self.evictions = 0
+        self.expirations = 0
+
+    def popitem(self):
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        self.expirations += len(expired)
+        return expired
+
+    def clear(self):
+        # MutableMapping.clear()는 popitem()을 반복 호출하므로 eviction 집계에서 제외
+        evictions = self.evictions
+        super().clear()
+        self.evictions = evictions
+
+
+class AccessTokenCache:
+    """
+    검증 완료된 액세스 토큰 payload 캐시 (워커 프로세스 단위)
+
+    - 키: 토큰 원문의 SHA-256 digest (토큰 원문은 메모리에 보관하지 않음)
+    - 만료: 각 항목은 토큰의 exp 시각에 자동 만료
+    - 무효화: 키 버전(서명 키 / 키링 세대)이 바뀌면 캐시 전체를 비움
+
+    사용법:
+        cache = AccessTokenCache(maxsize=10000)
+        payload = cache.get(token, key_version)
+        if payload is None:
+            payload = ...  # 전체 검증
+            cache.put(token, payload, payload.exp, key_version)
+
+    maxsize가 0이면 캐시를 사용하지 않습니다.
+    """
+    class Stats(BaseModel):
+        size: int = Field(..., description="현재 캐시 항목 수")
+        maxsize: int = Field(..., description="최대 캐시 항목 수")
+        hits: int = Field(..., description="캐시 적중 횟수")
+        misses: int = Field(..., description="캐시 미스 횟수")
+        evictions: int = Field(..., description="용량 초과로 제거된 항목 수")
+        expirations: int = Field(..., description="exp 도달로 제거된 항목 수")
+        flushes: int = Field(..., description="키 버전 변경으로 인한 전체 비움 횟수")
+
+    def __init__(self, maxsize: int = 10000):
+        self.__MAXSIZE = maxsize
+        self.__cache = _CountingTLRUCache(max(maxsize, 1), ttu=self._ttu)
+        self.__key_version: Any = None
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+
+    @staticmethod
+    def _ttu(_key: bytes, value: tuple[Any, int], _now: float) -> float:
+        """항목별 만료 시각 = 토큰 exp"""
+        return value[1]
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def _check_key_version(self, key_version: Any) -> None:
+        """키 버전이 바뀌었으면 캐시 전체 비움"""
+        if key_version is self.__key_version or key_version == self.__key_version:
+            return
+        if len(self.__cache):
+            self.__cache.clear()
+            self.flushes += 1
+        self.__key_version = key_version
+
+    def get(self, token: Optional[str], key_version: Any) -> Optional[Any]:
+        """캐시된 검증 payload 반환, 없거나 만료되었으면 None"""
+        if not token or self.__MAXSIZE <= 0:
+            return None
+        self._check_key_version(key_version)
+        entry = self.__cache.get(self._digest(token))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def put(self, token: str, payload: Any, expires_at: int, key_version: Any) -> None:
+        """검증이 끝난 payload를 exp까지 저장"""
+        if not token or self.__MAXSIZE <= 0:
+            return
+        self._check_key_version(key_version)
+        self.__cache[self._digest(token)] = (payload, expires_at)
+
+    def invalidate(self, token: str) -> None:
+        """특정 토큰 항목 제거"""
+        self.__cache.pop(self._digest(token), None)
+
+    def clear(self) -> None:
+        self.__cache.clear()
+
+    def stats(self) -> Stats:
+        return AccessTokenCache.Stats(
+            size=len(self.__cache) if self.__MAXSIZE > 0 else 0,
+            maxsize=self.__MAXSIZE,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.__cache.evictions,
+            expirations=self.__cache.expirations,
+            flushes=self.flushes,
+        )
@@ -0,0 +1,157 @@
+# benchmarks/bench_codecs.py
+"""
+Redis codec 벤치마크
+
+이메일 인증 / 계정 캐시 값으로 codec별 encode / decode 시간(µs)과
+키당 저장 크기(bytes)를 비교해 JSON으로 출력.
+    - payload_bytes: Redis에 보내는 값 크기 (hash는 필드 이름 + 값 합계)
+    - memory_bytes:  --redis-url을 주면 실제 서버의 MEMORY USAGE (키 이름 / 메타데이터 포함)
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.bench_codecs --iterations 20000
+    python -m benchmarks.bench_codecs --redis-url redis://localhost:6379/15 --output codecs.json
+
+HashCodec은 평탄한 값만 지원하므로 linked_providers 목록이 있는 계정 캐시 값에서는 제외.
+"""
+
+# Standard library imports
+import json
+import time
+import asyncio
+import argparse
+import platform
+from pathlib import Path
+from typing import Any, Optional
+from uuid import uuid4
+
+# App imports
+from app.service.accounts.app.schemas import AccountResponse
+from app.shared.core.redis import Redis
+from app.shared.core.redis_codec import (
+    RedisCodec,
+    JsonCodec,
+    MsgpackCodec,
+    HashCodec,
+    CompressedCodec,
+)
+
+
+def _payloads() -> dict[str, tuple[Any, Optional[type]]]:
+    """벤치마크 값: (값, 복원할 모델)"""
+    now = int(time.time())
+    verification = {
+        "email": "bench.user@example.com",
+        "code": "483920",
+        "expires_at": now + 300,
+        "created_at": now,
+        "state": "pending",
+    }
+    account = AccountResponse(
+        user_uuid=uuid4(),
+        user_name="Bench User",
+        phone_number="010-1234-5678",
+        email="bench.user@example.com",
+        linked_providers=["google"],
+        is_admin=False,
+        is_active=True,
+    )
+    return {
+        "email_verification": (verification, None),
+        "account_cache": (account, AccountResponse),
+    }
+
+
+def _codecs(model: Optional[type], threshold: int) -> list[RedisCodec]:
+    return [
+        JsonCodec(model),
+        MsgpackCodec(model),
+        HashCodec(model),
+        CompressedCodec(JsonCodec(model), threshold=threshold),
+        CompressedCodec(MsgpackCodec(model), threshold=threshold),
+    ]
+
+
+def _payload_bytes(encoded: Any) -> int:
+    if isinstance(encoded, dict):
+        return sum(len(k.encode()) + len(v.encode()) for k, v in encoded.items())
+    return len(encoded)
+
+
+def _time_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return round((time.perf_counter() - start) / iterations * 1_000_000, 3)
+
+
+def measure(codec: RedisCodec, value: Any, iterations: int) -> dict:
+    """encode / decode 평균 시간(µs)과 값 크기"""
+    encoded = codec.encode(value)
+    assert codec.decode(encoded) is not None
+    return {
+        "encode_us": _time_us(lambda: codec.encode(value), iterations),
+        "decode_us": _time_us(lambda: codec.decode(encoded), iterations),
+        "payload_bytes": _payload_bytes(encoded),
+    }
+
+
+async def measure_memory(redis_url: str, codec: RedisCodec, value: Any) -> int:
+    """실제 Redis에 저장 후 MEMORY USAGE (round-trip 확인 포함)"""
+    import redis.asyncio as redis
+
+    client = redis.Redis.from_url(redis_url, decode_responses=True)
+    store = Redis(client, codec)
+    key = f"bench:codec:{codec.name}:{uuid4().hex}"
+    try:
+        await store.set_with_ttl(key, value, 60)
+        assert await store.get(key) == codec.decode(codec.encode(value))
+        return await client.memory_usage(key, samples=0)
+    finally:
+        await client.delete(key)
+        await client.aclose()
+
+
+async def main(args: argparse.Namespace) -> dict:
+    results: dict[str, dict] = {}
+    for payload_name, (value, model) in _payloads().items():
+        rows: dict[str, dict] = {}
+        for codec in _codecs(model, args.compress_threshold):
+            try:
+                row = measure(codec, value, args.iterations)
+            except TypeError as e:
+                rows[codec.name] = {"skipped": str(e)}
+                continue
+            if args.redis_url:
+                row["memory_bytes"] = await measure_memory(args.redis_url, codec, value)
+            rows[codec.name] = row
+        results[payload_name] = rows
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "compress_threshold": args.compress_threshold,
+            "redis_url": bool(args.redis_url),
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Redis codec encode/decode and size benchmark")
+    parser.add_argument("--iterations", type=int, default=20000, help="codec별 반복 횟수")
+    parser.add_argument("--compress-threshold", type=int, default=256, help="CompressedCodec 압축 기준(bytes)")
+    parser.add_argument("--redis-url", type=str, default=None, help="MEMORY USAGE를 측정할 Redis URL (선택)")
+    parser.add_argument("--output", type=str, default=None, help="결과 JSON 파일 경로 (기본: stdout)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
@@ -0,0 +1,313 @@
+# benchmarks/bench_endpoints.py
+"""
+엔드포인트 벤치마크
+
+실제 app.main:app을 ASGI transport로 프로세스 안에서 호출하여
+엔드포인트별 처리량(req/s)과 p50/p95/p99 지연 시간을 JSON으로 출력.
+
+외부 의존성은 로컬 대체물로 교체:
+    - PostgreSQL -> sqlite + aiosqlite (임시 파일)
+    - Redis      -> fakeredis
+    - SMTP       -> 메일을 보내지 않고 건수만 세는 클라이언트
+
+사용법 (backend 디렉터리에서):
+    pip install -r benchmarks/requirements.txt
+    python -m benchmarks.bench_endpoints --requests 500 --concurrency 16 --output result.json
+
+빌드 간 비교 시 같은 --requests/--concurrency/--bcrypt-rounds 값을 사용할 것.
+"""
+
+# Standard library imports
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from pathlib import Path
+from contextlib import ExitStack
+from unittest import mock
+from uuid import uuid4
+
+# 앱 모듈을 import 하기 전에 설정 환경 변수를 채워야 함 (설정 객체가 import 시점에 생성됨)
+_TMP_DIR = tempfile.TemporaryDirectory(prefix="bench-")
+_BENCH_ENV = {
+    "REDIS_HOST": "localhost",
+    "SMTP_USER": "bench",
+    "SMTP_PASSWORD": "bench",
+    "GOOGLE_OAUTH_CLIENT_ID": "bench",
+    "GOOGLE_OAUTH_CLIENT_SECRET": "bench",
+    "AUTH_SECRET_KEY_PATH": str(Path(_TMP_DIR.name) / "secret_key.json"),
+    # 같은 IP / 아이디로 반복 요청하므로 요청 제한은 끔
+    "AUTH_RATE_LIMIT_ENABLED": "false",
+}
+for _key, _value in _BENCH_ENV.items():
+    os.environ.setdefault(_key, _value)
+
+# Third-party imports
+import httpx
+from fakeredis import aioredis as fake_aioredis
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+
+BENCH_PASSWORD = "bench-password-1234"
+
+
+# ------------------------- Local Stand-ins -------------------------
+
+class NullEmailClient:
+    """SMTP 대체: 메일을 보내지 않고 건수만 기록"""
+    def __init__(self, *args, **kwargs):
+        self.sent = 0
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        pass
+
+    async def send_email(self, to: str, subject: str, body: str, subtype="plain"):
+        self.sent += 1
+
+
+async def init_sqlite_db(app, setting) -> None:
+    """init_db 대체: 임시 sqlite 파일에 스키마 생성"""
+    from app.shared.core.database import Base
+    from app.shared.core.query_stats import instrument_engine
+
+    db_path = Path(_TMP_DIR.name) / "bench.sqlite3"
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        connect_args={"timeout": 30},  # 동시 쓰기 시 잠금 대기
+    )
+    instrument_engine(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    app.state.db_engine = engine
+    app.state.async_session_maker = sessionmaker(
+        bind=engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+
+async def init_fake_redis(app, setting) -> None:
+    """init_redis 대체: 프로세스 내 fakeredis"""
+    app.state.redis_client = fake_aioredis.FakeRedis(decode_responses=True)
+
+
+# ------------------------- Measurement -------------------------
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(percent / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float, db_statements: list[int] = ()) -> dict:
+    """지연 시간 목록(초)을 ms 단위 통계로 변환"""
+    values = sorted(latencies)
+    to_ms = lambda v: round(v * 1000, 3)
+    return {
+        "requests": len(values) + errors,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(values) / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": to_ms(statistics.fmean(values)) if values else 0.0,
+        "p50_ms": to_ms(_percentile(values, 50)),
+        "p95_ms": to_ms(_percentile(values, 95)),
+        "p99_ms": to_ms(_percentile(values, 99)),
+        "max_ms": to_ms(values[-1]) if values else 0.0,
+        # 응답 헤더 X-DB-Statements 기준 요청당 SQL 문장 수
+        "db_statements_avg": round(statistics.fmean(db_statements), 2) if db_statements else None,
+        "db_statements_max": max(db_statements) if db_statements else None,
+    }
+
+
+async def run_scenario(clients: list[httpx.AsyncClient], total: int, send) -> dict:
+    """
+    clients 수만큼 동시에 send(client, i)를 호출하여 total 건 측정
+
+    클라이언트마다 쿠키 저장소가 따로 있으므로 리프래시 토큰 회전처럼
+    순서가 중요한 요청도 클라이언트 안에서는 순차적으로 처리됨
+    """
+    latencies: list[float] = []
+    db_statements: list[int] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            try:
+                response = await send(client, i)
+                ok = response.status_code < 400
+            except Exception as e:
+                logger.debug(f"Benchmark request failed: {e}")
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - started)
+                if "x-db-statements" in response.headers:
+                    db_statements.append(int(response.headers["x-db-statements"]))
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(client) for client in clients))
+    return summarize(latencies, errors, time.perf_counter() - started, db_statements)
+
+
+# ------------------------- Scenarios -------------------------
+
+async def seed_users(app, count: int) -> list[str]:
+    """로그인 가능한 사용자와 계정 생성, user_id 목록 반환"""
+    from app.service.auth.app.models import AuthUser
+    from app.service.accounts.app.models import Account
+    from app.service.auth import service as auth_service
+
+    hashed = await auth_service.password_hasher.hash_password_async(BENCH_PASSWORD)
+    user_ids = []
+    async with app.state.async_session_maker() as session:
+        for i in range(count):
+            user_uuid = uuid4()
+            user_id = f"bench_user_{i}"
+            session.add(AuthUser(
+                user_uuid=user_uuid,
+                user_id=user_id,
+                password=hashed,
+                email=f"{user_id}@example.com",
+                is_active=True,
+            ))
+            session.add(Account(
+                user_uuid=user_uuid,
+                user_name=user_id,
+                email=f"{user_id}@example.com",
+            ))
+            user_ids.append(user_id)
+        await session.commit()
+    return user_ids
+
+
+async def login(client: httpx.AsyncClient, user_id: str) -> httpx.Response:
+    response = await client.post(
+        "/auth/token",
+        data={"username": user_id, "password": BENCH_PASSWORD},
+    )
+    response.raise_for_status()
+    return response
+
+
+async def run_benchmarks(app, total: int, login_total: int, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 50000))
+    # 쿠키가 secure이므로 https 기준 URL 사용
+    clients = [
+        httpx.AsyncClient(transport=transport, base_url="https://bench.local")
+        for _ in range(concurrency)
+    ]
+    try:
+        user_ids = await seed_users(app, concurrency)
+        for client, user_id in zip(clients, user_ids):
+            await login(client, user_id)
+
+        results = {}
+
+        # 워밍업 (지연 로딩, 첫 커넥션 생성 등 제외)
+        await run_scenario(clients, concurrency * 2, lambda c, i: c.get("/health"))
+
+        results["GET /health"] = await run_scenario(
+            clients, total, lambda c, i: c.get("/health")
+        )
+        results["GET /accounts/me"] = await run_scenario(
+            clients, total, lambda c, i: c.get("/accounts/me")
+        )
+        results["POST /auth/token/refresh"] = await run_scenario(
+            clients, total, lambda c, i: c.post("/auth/token/refresh")
+        )
+        results["POST /auth/email"] = await run_scenario(
+            clients, total, lambda c, i: c.post("/auth/email", json={"email": f"bench_{i}@example.com"})
+        )
+        # 로그인은 bcrypt 검증 비용이 커서 건수를 따로 지정
+        results["POST /auth/token"] = await run_scenario(
+            clients, login_total,
+            lambda c, i: c.post(
+                "/auth/token",
+                data={"username": user_ids[i % len(user_ids)], "password": BENCH_PASSWORD},
+            )
+        )
+        return results
+    finally:
+        for client in clients:
+            await client.aclose()
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except Exception:
+        return None
+
+
+async def main(args: argparse.Namespace) -> dict:
+    import app.main as app_main
+
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(app_main, "init_db", init_sqlite_db))
+        stack.enter_context(mock.patch.object(app_main, "init_redis", init_fake_redis))
+        stack.enter_context(mock.patch.object(app_main, "AsyncEmailClient", NullEmailClient))
+
+        app = app_main.app
+        async with app.router.lifespan_context(app):
+            results = await run_benchmarks(app, args.requests, args.login_requests, args.concurrency)
+
+    return {
+        "meta": {
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests": args.requests,
+            "login_requests": args.login_requests,
+            "concurrency": args.concurrency,
+            "bcrypt_rounds": int(os.environ["AUTH_BCRYPT_ROUNDS"]),
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Endpoint benchmark against local stand-ins")
+    parser.add_argument("--requests", type=int, default=500, help="엔드포인트별 요청 수")
+    parser.add_argument("--login-requests", type=int, default=50, help="POST /auth/token 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 클라이언트 수")
+    parser.add_argument("--bcrypt-rounds", type=int, default=10, help="벤치마크용 bcrypt cost")
+    parser.add_argument("--output", type=str, default=None, help="결과 JSON 파일 경로 (기본: stdout)")
+    parser.add_argument("--verbose", action="store_true", help="앱 로그 출력")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    os.environ["AUTH_BCRYPT_ROUNDS"] = str(args.bcrypt_rounds)
+    os.environ["AUTH_BCRYPT_CALIBRATE"] = "false"
+    if not args.verbose:
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+
+    report = asyncio.run(main(args))
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
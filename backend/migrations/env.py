@@ -0,0 +1,75 @@
+# migrations/env.py
+"""
+Alembic 실행 환경
+
+접속 URL 우선순위: -x url=... > alembic.ini sqlalchemy.url > app 설정(DB_*)
+"""
+
+# Standard library imports
+import asyncio
+from logging.config import fileConfig
+
+# Third-party imports
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import async_engine_from_config
+
+# Shared imports
+from app.shared.core.database import Base, get_database_url
+from app.shared.core.settings import get_database_runtime
+
+# 모델 등록 (autogenerate 대상 테이블)
+from app.service.auth.app import models as auth_models  # noqa: F401
+from app.service.accounts.app import models as accounts_models  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def get_url() -> str:
+    url = context.get_x_argument(as_dictionary=True).get("url")
+    return url or config.get_main_option("sqlalchemy.url") or get_database_url(get_database_runtime())
+
+
+def run_migrations_offline() -> None:
+    """SQL 스크립트만 출력 (alembic upgrade head --sql)"""
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    connectable = async_engine_from_config(
+        {"sqlalchemy.url": get_url()},
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,120 @@
+"""initial schema: auth_* and account tables
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 이전 버전(create_all)이 만든 테이블
+_TABLES = ("auth_user", "auth_refresh_token", "auth_oauth_account", "auth_email_verification", "account")
+
+
+def upgrade() -> None:
+    # create_all로 이미 만들어진 DB(alembic_version 없음)는 이 리비전을 기록만 하고 다음 리비전부터 적용
+    existing = set() if context.is_offline_mode() else set(sa.inspect(op.get_bind()).get_table_names())
+    if existing.issuperset(_TABLES):
+        return
+    if existing.intersection(_TABLES):
+        raise RuntimeError(
+            f"Partial schema found ({sorted(existing.intersection(_TABLES))}); "
+            "fix the tables manually, then run 'alembic stamp 0001' and 'alembic upgrade head'"
+        )
+
+    op.create_table(
+        "auth_user",
+        sa.Column("user_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("password", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("user_uuid"),
+        sa.UniqueConstraint("user_uuid"),
+    )
+    op.create_index("ix_auth_user_user_id", "auth_user", ["user_id"], unique=True)
+    op.create_index("ix_auth_user_email", "auth_user", ["email"], unique=True)
+
+    op.create_table(
+        "auth_refresh_token",
+        sa.Column("refresh_token", sa.String(), nullable=False),
+        sa.Column("user_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("user_agent", sa.String(), nullable=True),
+        sa.Column("ip_address", sa.String(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("refresh_token"),
+        sa.UniqueConstraint("refresh_token"),
+    )
+    op.create_index("ix_auth_refresh_token_user_uuid", "auth_refresh_token", ["user_uuid"])
+
+    op.create_table(
+        "auth_oauth_account",
+        sa.Column("oauth_id", sa.String(), nullable=False),
+        sa.Column("user_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("provider", sa.String(), nullable=False),
+        sa.Column("provider_id", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("last_login", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("oauth_id"),
+        sa.UniqueConstraint("oauth_id"),
+        sa.UniqueConstraint("provider", "provider_id", name="uq_provider_provider_id"),
+    )
+    op.create_index("ix_auth_oauth_account_user_uuid", "auth_oauth_account", ["user_uuid"])
+
+    op.create_table(
+        "auth_email_verification",
+        sa.Column("token", sa.String(), nullable=False),
+        sa.Column("code", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("is_verified", sa.Boolean(), nullable=True),
+        sa.Column("is_used", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("token"),
+    )
+    op.create_index("ix_auth_email_verification_code", "auth_email_verification", ["code"])
+    op.create_index("ix_auth_email_verification_email", "auth_email_verification", ["email"])
+
+    op.create_table(
+        "account",
+        sa.Column("user_uuid", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_name", sa.String(), nullable=False),
+        sa.Column("phone_number", sa.String(), nullable=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("is_admin", sa.Boolean(), nullable=True),
+        sa.Column("link_provider", sa.String(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("user_uuid"),
+        sa.UniqueConstraint("user_uuid"),
+    )
+    op.create_index("ix_account_email", "account", ["email"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_account_email", table_name="account")
+    op.drop_table("account")
+    op.drop_index("ix_auth_email_verification_email", table_name="auth_email_verification")
+    op.drop_index("ix_auth_email_verification_code", table_name="auth_email_verification")
+    op.drop_table("auth_email_verification")
+    op.drop_index("ix_auth_oauth_account_user_uuid", table_name="auth_oauth_account")
+    op.drop_table("auth_oauth_account")
+    op.drop_index("ix_auth_refresh_token_user_uuid", table_name="auth_refresh_token")
+    op.drop_table("auth_refresh_token")
+    op.drop_index("ix_auth_user_email", table_name="auth_user")
+    op.drop_index("ix_auth_user_user_id", table_name="auth_user")
+    op.drop_table("auth_user")
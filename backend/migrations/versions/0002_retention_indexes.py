@@ -0,0 +1,27 @@
+"""index expires_at for retention purges
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_auth_refresh_token_expires_at", "auth_refresh_token", ["expires_at"])
+    op.create_index("ix_auth_email_verification_expires_at", "auth_email_verification", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_auth_email_verification_expires_at", table_name="auth_email_verification")
+    op.drop_index("ix_auth_refresh_token_expires_at", table_name="auth_refresh_token")
@@ -0,0 +1,64 @@
+"""store refresh tokens as 32-byte SHA-256 digests
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+
+기존 행은 클라이언트가 가진 쿠키 값의 SHA-256으로 변환하므로 발급된 토큰은 그대로 유효.
+(REFRESH_TOKEN_STORE_HASHED 사용 여부와 관계없이 DB 값 = 쿠키 값이었음)
+
+PK와 중복되던 UNIQUE 제약(auth_refresh_token_refresh_token_key)도 제거.
+
+downgrade는 digest를 hex 문자열로 되돌릴 뿐 원래 토큰을 복원할 수 없으므로
+downgrade 이후에는 기존 리프래시 토큰이 모두 무효화됨.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_constraint("auth_refresh_token_refresh_token_key", "auth_refresh_token", type_="unique")
+        op.execute(
+            "ALTER TABLE auth_refresh_token "
+            "ALTER COLUMN refresh_token TYPE bytea "
+            "USING sha256(convert_to(refresh_token, 'UTF8'))"
+        )
+        op.create_check_constraint(
+            "ck_auth_refresh_token_digest_size",
+            "auth_refresh_token",
+            "length(refresh_token) = 32",
+        )
+        return
+
+    # PostgreSQL 외(개발용 sqlite 등)는 SHA-256 함수가 없으므로 기존 토큰을 비우고 재생성
+    op.execute("DELETE FROM auth_refresh_token")
+    with op.batch_alter_table("auth_refresh_token", recreate="always") as batch:
+        batch.alter_column("refresh_token", type_=sa.LargeBinary(32), existing_nullable=False)
+        batch.create_check_constraint("ck_auth_refresh_token_digest_size", "length(refresh_token) = 32")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_constraint("ck_auth_refresh_token_digest_size", "auth_refresh_token", type_="check")
+        op.execute(
+            "ALTER TABLE auth_refresh_token "
+            "ALTER COLUMN refresh_token TYPE varchar "
+            "USING encode(refresh_token, 'hex')"
+        )
+        op.create_unique_constraint("auth_refresh_token_refresh_token_key", "auth_refresh_token", ["refresh_token"])
+        return
+
+    op.execute("DELETE FROM auth_refresh_token")
+    with op.batch_alter_table("auth_refresh_token", recreate="always") as batch:
+        batch.drop_constraint("ck_auth_refresh_token_digest_size", type_="check")
+        batch.alter_column("refresh_token", type_=sa.String(), existing_nullable=False)
@@ -0,0 +1,53 @@
+"""replace account.link_provider with a linked_providers array
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.add_column(
+            "account",
+            sa.Column("linked_providers", postgresql.ARRAY(sa.String()), server_default="{}", nullable=False),
+        )
+        # 기존 값(단일 또는 콤마 구분 문자열) 이전
+        op.execute(
+            "UPDATE account SET linked_providers = string_to_array(link_provider, ',') "
+            "WHERE link_provider IS NOT NULL AND link_provider <> ''"
+        )
+        op.drop_column("account", "link_provider")
+        return
+
+    # 개발용 sqlite: JSON 배열
+    with op.batch_alter_table("account", recreate="always") as batch:
+        batch.add_column(sa.Column("linked_providers", sa.JSON(), server_default="[]", nullable=False))
+    op.execute(
+        "UPDATE account SET linked_providers = json_array(link_provider) "
+        "WHERE link_provider IS NOT NULL AND link_provider <> ''"
+    )
+    with op.batch_alter_table("account", recreate="always") as batch:
+        batch.drop_column("link_provider")
+
+
+def downgrade() -> None:
+    op.add_column("account", sa.Column("link_provider", sa.String(), nullable=True))
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("UPDATE account SET link_provider = NULLIF(array_to_string(linked_providers, ','), '')")
+    else:
+        op.execute("UPDATE account SET link_provider = json_extract(linked_providers, '$[0]')")
+    with op.batch_alter_table("account") as batch:
+        batch.drop_column("linked_providers")
@@ -0,0 +1,45 @@
+"""record when a refresh token was deactivated
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00
+
+보존 정리가 비활성 토큰을 발급 시각(created_at)이 아니라 비활성화 시각 기준으로 삭제하도록
+deactivated_at 컬럼 추가. 기존 비활성 행은 마이그레이션 시각으로 채워 유예 기간을 보장.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "auth_refresh_token",
+        sa.Column("deactivated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_auth_refresh_token_deactivated_at", "auth_refresh_token", ["deactivated_at"])
+
+    refresh_token = sa.table(
+        "auth_refresh_token",
+        sa.column("is_active", sa.Boolean()),
+        sa.column("deactivated_at", sa.DateTime(timezone=True)),
+    )
+    op.execute(
+        refresh_token.update()
+        .where(refresh_token.c.is_active == sa.false())
+        .values(deactivated_at=sa.func.current_timestamp())
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_auth_refresh_token_deactivated_at", table_name="auth_refresh_token")
+    with op.batch_alter_table("auth_refresh_token") as batch:
+        batch.drop_column("deactivated_at")
@@ -1 +1 @@
-uvicorn app.main:app --reload
\ No newline at end of file
+alembic upgrade head && uvicorn app.main:app --reload
\ No newline at end of file
@@ -0,0 +1,45 @@
+# tests/conftest.py
+"""
+테스트 공통 fixture
+
+벤치마크와 같은 로컬 대체물(sqlite, fakeredis, 메일 미발송)로 app.main:app의 lifespan을
+실행하고 ASGI transport 클라이언트를 제공.
+"""
+
+# Standard library imports
+import os
+from contextlib import ExitStack
+from unittest import mock
+
+# 설정 객체가 import 시점에 생성되므로 앱 import 전에 채움
+os.environ.setdefault("AUTH_BCRYPT_ROUNDS", "4")
+os.environ.setdefault("AUTH_BCRYPT_CALIBRATE", "false")
+os.environ.setdefault("APP_METRICS_ENABLED", "true")
+os.environ.setdefault("APP_METRICS_TOKEN", "test-metrics-token")
+os.environ.setdefault("AUTH_RATE_LIMIT_ENABLED", "true")  # 벤치마크 기본값(false) 대신 실제 동작 확인
+
+# Third-party imports
+import httpx
+import pytest_asyncio
+
+# App imports
+from benchmarks.bench_endpoints import NullEmailClient, init_fake_redis, init_sqlite_db
+
+
+@pytest_asyncio.fixture
+async def app():
+    import app.main as app_main
+
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(app_main, "init_db", init_sqlite_db))
+        stack.enter_context(mock.patch.object(app_main, "init_redis", init_fake_redis))
+        stack.enter_context(mock.patch.object(app_main, "AsyncEmailClient", NullEmailClient))
+        async with app_main.app.router.lifespan_context(app_main.app):
+            yield app_main.app
+
+
+@pytest_asyncio.fixture
+async def client(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="https://test.local") as client:
+        yield client
@@ -0,0 +1,56 @@
+# tests/test_client_ip.py
+"""
+_get_client_ip: 신뢰 프록시 설정에 따른 클라이언트 IP 추출 (rate limit 키)
+"""
+
+# Standard library imports
+import ipaddress
+
+# Third-party imports
+import pytest
+from fastapi.requests import Request
+
+# App imports
+from app.service.auth.app import service
+
+
+def _request(peer: str, headers: dict[str, str]) -> Request:
+    return Request({
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+        "client": (peer, 12345),
+    })
+
+
+@pytest.fixture
+def trusted(monkeypatch):
+    monkeypatch.setattr(service, "_trusted_proxies", [ipaddress.ip_network("10.0.0.0/8")])
+
+
+def test_headers_ignored_without_trusted_proxy(monkeypatch):
+    monkeypatch.setattr(service, "_trusted_proxies", [])
+    request = _request("203.0.113.7", {"x-forwarded-for": "1.2.3.4", "x-real-ip": "5.6.7.8"})
+    assert service._get_client_ip(request) == "203.0.113.7"
+
+
+def test_headers_ignored_from_untrusted_peer(trusted):
+    request = _request("203.0.113.7", {"x-forwarded-for": "1.2.3.4"})
+    assert service._get_client_ip(request) == "203.0.113.7"
+
+
+def test_rightmost_untrusted_hop(trusted):
+    # 클라이언트가 보낸 1.2.3.4는 무시, 프록시가 덧붙인 실제 주소 사용
+    request = _request("10.0.0.2", {"x-forwarded-for": "1.2.3.4, 198.51.100.9, 10.0.0.1"})
+    assert service._get_client_ip(request) == "198.51.100.9"
+
+
+def test_invalid_hop_stops_walk(trusted):
+    request = _request("10.0.0.2", {"x-forwarded-for": "198.51.100.9, garbage, 10.0.0.1"})
+    assert service._get_client_ip(request) == "10.0.0.1"
+
+
+def test_real_ip_from_trusted_peer(trusted):
+    request = _request("10.0.0.2", {"x-real-ip": "198.51.100.9"})
+    assert service._get_client_ip(request) == "198.51.100.9"
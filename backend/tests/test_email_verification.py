@@ -0,0 +1,69 @@
+# tests/test_email_verification.py
+"""이메일 인증 코드 확인 스크립트 (실패 횟수, 폐기, 동시 제출)"""
+
+# Standard library imports
+import asyncio
+
+# Third-party imports
+import pytest
+from fakeredis import aioredis
+
+# App imports
+from app.service.auth.app.email_verification import EmailVerificationStore
+from app.service.auth.core.security.email_token import EmailTokenManager
+
+
+@pytest.fixture
+def store():
+    store = EmailVerificationStore(max_attempts=3)
+    store.bind(aioredis.FakeRedis(decode_responses=True))
+    return store
+
+
+async def _create(store: EmailVerificationStore) -> EmailTokenManager.EmailVerifyResponse:
+    verify = EmailTokenManager().create_token("user@example.com")
+    await store.create(verify)
+    return verify
+
+
+def _wrong_code(code: str) -> str:
+    return "000000" if code != "000000" else "111111"
+
+
+@pytest.mark.asyncio
+async def test_mismatch_counts_attempts(store):
+    verify = await _create(store)
+    key = store._key(verify.token)
+
+    assert await store.verify(verify.token, _wrong_code(verify.code)) == store.CODE_MISMATCH
+    assert await store.verify(verify.token, _wrong_code(verify.code)) == store.CODE_MISMATCH
+    assert await store.client.hget(key, "attempts") == "2"
+
+    # 한도 전에는 올바른 코드로 인증 가능
+    assert await store.verify(verify.token, verify.code) == store.VERIFIED
+
+
+@pytest.mark.asyncio
+async def test_token_deleted_after_max_attempts(store):
+    verify = await _create(store)
+
+    for _ in range(2):
+        assert await store.verify(verify.token, _wrong_code(verify.code)) == store.CODE_MISMATCH
+    assert await store.verify(verify.token, _wrong_code(verify.code)) == store.TOO_MANY_ATTEMPTS
+
+    assert not await store.client.exists(store._key(verify.token))
+    assert await store.verify(verify.token, verify.code) == store.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_concurrent_correct_submits_verify_once(store):
+    verify = await _create(store)
+
+    results = await asyncio.gather(*(store.verify(verify.token, verify.code) for _ in range(10)))
+    assert results.count(store.VERIFIED) == 1
+    assert results.count(store.NOT_FOUND) == 9
+
+    # verified 이벤트도 한 번만 기록
+    events = await store.client.xrange(store.STREAM)
+    states = [fields["state"] for _, fields in events if fields["token"] == verify.token]
+    assert states == ["pending", "verified"]
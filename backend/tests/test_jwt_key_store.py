@@ -0,0 +1,67 @@
+# tests/test_jwt_key_store.py
+"""
+JWT 키링 저장소
+"""
+
+# Standard library imports
+import mmap
+
+# Third-party imports
+import pytest
+from cryptography.fernet import Fernet
+from fakeredis import aioredis
+
+# App imports
+from app.service.auth.core.security import RedisKeyStore, SharedMemoryKeyStore
+
+
+@pytest.mark.asyncio
+async def test_redis_key_store_encrypts_keyring():
+    client = aioredis.FakeRedis(decode_responses=True)
+    old_key, new_key = Fernet.generate_key().decode(), Fernet.generate_key().decode()
+    keyring = {"generation": 1, "active": {"secret_key": "hs-secret"}}
+
+    await RedisKeyStore(client, [old_key]).save(keyring)
+    assert "hs-secret" not in await client.get(RedisKeyStore.KEY)
+
+    # 암호화 키 교체: 새 키를 앞에 두면 옛 키로 저장된 키링도 읽힘
+    assert await RedisKeyStore(client, [new_key, old_key]).load() == keyring
+    with pytest.raises(RedisKeyStore.DecryptionError):
+        await RedisKeyStore(client, [new_key]).load()
+
+
+def test_redis_key_store_requires_encryption_key():
+    with pytest.raises(ValueError):
+        RedisKeyStore(aioredis.FakeRedis(decode_responses=True), [])
+
+
+@pytest.mark.asyncio
+async def test_shared_memory_key_store_recovers_from_crashed_writer(tmp_path):
+    key_path = str(tmp_path / "jwt_secret.key")
+    keyring = {"generation": 1, "active": {"secret_key": "hs-secret"}}
+
+    owner = SharedMemoryKeyStore(key_path)
+    assert owner.claim_writer()
+    await owner.save(keyring)
+    await owner.close()
+
+    # 소유 프로세스가 본문 기록 도중 죽은 상태: seq가 홀수로 남음
+    with open(f"{key_path}.shm", "r+b") as f, mmap.mmap(f.fileno(), SharedMemoryKeyStore.SIZE) as shm:
+        _, seq, _ = SharedMemoryKeyStore.HEADER.unpack_from(shm, 0)
+        SharedMemoryKeyStore.HEADER.pack_into(shm, 0, SharedMemoryKeyStore.MAGIC, seq + 1, 0)
+
+    follower = SharedMemoryKeyStore(key_path)
+    follower.READ_RETRIES = 1
+    assert await follower.load() is None
+
+    # 다음 소유 프로세스가 다시 게시하면 나머지 워커도 읽을 수 있어야 함
+    new_owner = SharedMemoryKeyStore(key_path)
+    assert new_owner.claim_writer()
+    assert await new_owner.load() == keyring
+    assert await follower.load() == keyring
+
+    with open(f"{key_path}.shm", "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as shm:
+        assert SharedMemoryKeyStore.HEADER.unpack_from(shm, 0)[1] % 2 == 0
+
+    await follower.close()
+    await new_owner.close()
@@ -0,0 +1,15 @@
+# tests/test_metrics.py
+"""/metrics 접근 제어"""
+
+# Third-party imports
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_metrics_requires_token(client):
+    assert (await client.get("/metrics")).status_code == 401
+    assert (await client.get("/metrics", headers={"Authorization": "Bearer wrong"})).status_code == 401
+
+    response = await client.get("/metrics", headers={"Authorization": "Bearer test-metrics-token"})
+    assert response.status_code == 200
+    assert "db_pool" in response.json()
@@ -0,0 +1,62 @@
+# tests/test_query_budget.py
+"""엔드포인트별 SQL 예산 (N+1 회귀 방지)"""
+
+# Standard library imports
+from unittest import mock
+from uuid import uuid4
+
+# Third-party imports
+import pytest
+
+# App imports
+from app.service.auth.app import service
+from app.service.auth.app.models import AuthOAuthAccount, AuthUser
+from app.shared.core.query_stats import QueryBudgetExceeded, query_budget
+
+
+async def _create_google_user(app) -> str:
+    provider_id = uuid4().hex
+    user_uuid = uuid4()
+    async with app.state.async_session_maker() as db:
+        db.add(AuthUser(
+            user_uuid=user_uuid,
+            user_id=f"g{provider_id[:12]}",
+            password="x",
+            email=f"{provider_id}@example.com",
+            is_active=True,
+        ))
+        db.add(AuthOAuthAccount(
+            oauth_id=f"google_{provider_id}",
+            user_uuid=user_uuid,
+            provider="google",
+            provider_id=provider_id,
+        ))
+        await db.commit()
+    return provider_id
+
+
+@pytest.mark.asyncio
+async def test_google_login_query_budget(app, client):
+    """사용자 조회(JOIN 1회) + 리프래시 토큰 INSERT / refresh 2회"""
+    provider_id = await _create_google_user(app)
+    code_to_token = mock.AsyncMock(return_value={"id": provider_id})
+
+    with mock.patch.object(service.google_oauth2_client, "code_to_token", code_to_token):
+        with query_budget(statements=3) as stats:
+            response = await client.post("/auth/google/login", json={"code": "test-code"})
+
+    assert response.status_code == 200, response.text
+    assert stats.statements == 3
+    assert response.headers["x-db-statements"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_query_budget_exceeded(app, client):
+    """예산보다 많은 SQL이 실행되면 QueryBudgetExceeded"""
+    provider_id = await _create_google_user(app)
+    code_to_token = mock.AsyncMock(return_value={"id": provider_id})
+
+    with mock.patch.object(service.google_oauth2_client, "code_to_token", code_to_token):
+        with pytest.raises(QueryBudgetExceeded):
+            with query_budget(statements=2):
+                await client.post("/auth/google/login", json={"code": "test-code"})
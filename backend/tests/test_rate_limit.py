@@ -0,0 +1,81 @@
+# tests/test_rate_limit.py
+"""sliding window 요청 제한"""
+
+# Standard library imports
+from unittest import mock
+from uuid import uuid4
+
+# Third-party imports
+import httpx
+import pytest
+from fakeredis import aioredis
+
+# App imports
+from app.service.auth.app.exceptions import RateLimitExceededException
+from app.service.auth.app.rate_limit import LOGIN_PER_USERNAME, RateLimitRule, SlidingWindowRateLimiter
+
+
+@pytest.fixture
+def limiter():
+    limiter = SlidingWindowRateLimiter()
+    limiter.bind(aioredis.FakeRedis(decode_responses=True))
+    return limiter
+
+
+@pytest.mark.asyncio
+async def test_limit_exceeded_sets_retry_after(limiter):
+    rule = RateLimitRule("test", limit=2, window_seconds=60)
+    await limiter.hit((rule, "1.2.3.4"))
+    await limiter.hit((rule, "1.2.3.4"))
+
+    with pytest.raises(RateLimitExceededException) as exc_info:
+        await limiter.hit((rule, "1.2.3.4"))
+    assert exc_info.value.status_code == 429
+    assert 1 <= int(exc_info.value.headers["Retry-After"]) <= 60
+
+    stats = limiter.stats()
+    assert stats.allowed == 2
+    assert stats.rejected == {"test": 1}
+
+
+@pytest.mark.asyncio
+async def test_rejected_requests_are_not_recorded(limiter):
+    per_ip = RateLimitRule("ip", limit=1, window_seconds=60)
+    per_user = RateLimitRule("user", limit=5, window_seconds=60)
+    await limiter.hit((per_ip, "1.2.3.4"), (per_user, "alice"))
+
+    for _ in range(3):
+        with pytest.raises(RateLimitExceededException):
+            await limiter.hit((per_ip, "1.2.3.4"), (per_user, "bob"))
+
+    # 거절된 요청은 어느 키에도 남지 않음
+    assert await limiter.client.zcard(limiter._key(per_ip, "1.2.3.4")) == 1
+    assert await limiter.client.zcard(limiter._key(per_user, "bob")) == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_error_fails_open():
+    client = mock.Mock()
+    client.register_script.return_value = mock.AsyncMock(side_effect=ConnectionError("redis down"))
+    limiter = SlidingWindowRateLimiter()
+    limiter.bind(client)
+
+    rule = RateLimitRule("test", limit=1, window_seconds=60)
+    for _ in range(3):
+        await limiter.hit((rule, "1.2.3.4"))
+    assert limiter.stats().errors == 3
+
+
+@pytest.mark.asyncio
+async def test_login_returns_429_with_retry_after(app):
+    # 없는 아이디의 로그인 실패 응답 코드와 무관하게 제한만 확인
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    form = {"username": f"nobody-{uuid4().hex[:8]}", "password": "wrong-password"}
+    async with httpx.AsyncClient(transport=transport, base_url="https://test.local") as client:
+        for _ in range(LOGIN_PER_USERNAME.limit):
+            response = await client.post("/auth/token", data=form)
+            assert response.status_code != 429
+
+        response = await client.post("/auth/token", data=form)
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) >= 1
@@ -0,0 +1,123 @@
+# tests/test_redis_codec.py
+"""Redis 값 codec 왕복 (encode -> decode)"""
+
+# Standard library imports
+import zlib
+from uuid import uuid4
+
+# Third-party imports
+import pytest
+from fakeredis import aioredis
+
+# App imports
+from app.service.accounts.app.cache import AccountCache
+from app.service.accounts.app.schemas import AccountResponse
+from app.shared.core.redis import Redis
+from app.shared.core.redis_codec import (
+    CompressedCodec,
+    HashCodec,
+    JsonCodec,
+    MsgpackCodec,
+    make_codec,
+)
+
+VERIFICATION = {"email": "user@example.com", "code": "483920", "expires_at": 1792208708, "state": "pending"}
+
+
+def _account() -> AccountResponse:
+    return AccountResponse(
+        user_uuid=uuid4(),
+        user_name="User",
+        phone_number=None,
+        email="user@example.com",
+        linked_providers=["google"],
+        is_admin=False,
+        is_active=True,
+    )
+
+
+@pytest.mark.parametrize("codec_class", [JsonCodec, MsgpackCodec])
+def test_value_codec_round_trip(codec_class):
+    assert codec_class().decode(codec_class().encode(VERIFICATION)) == VERIFICATION
+
+    account = _account()
+    codec = codec_class(AccountResponse)
+    assert codec.decode(codec.encode(account)) == account
+
+
+def test_hash_codec_round_trip():
+    codec = HashCodec()
+    encoded = codec.encode({**VERIFICATION, "verified": True, "claim": None})
+    assert encoded["verified"] == "1"
+    assert "claim" not in encoded  # None 필드는 저장하지 않음
+    assert codec.decode(encoded) == {**{k: str(v) for k, v in VERIFICATION.items()}, "verified": "1"}
+
+    with pytest.raises(TypeError):
+        codec.encode({"linked_providers": ["google"]})
+
+
+def test_compressed_codec_header_byte():
+    codec = CompressedCodec(JsonCodec(), threshold=64)
+
+    small = {"a": 1}
+    encoded = codec.encode(small)
+    assert encoded[:1] == CompressedCodec.RAW
+    assert codec.decode(encoded) == small
+
+    large = {"payload": "x" * 1000}
+    encoded = codec.encode(large)
+    assert encoded[:1] == CompressedCodec.ZLIB
+    assert zlib.decompress(encoded[1:]) == JsonCodec().encode(large)
+    assert codec.decode(encoded) == large
+
+
+def test_make_codec():
+    assert isinstance(make_codec("json"), JsonCodec)
+    assert isinstance(make_codec("msgpack"), MsgpackCodec)
+    assert make_codec("msgpack+zlib", compress_threshold=10).name == "msgpack+zlib"
+    with pytest.raises(ValueError):
+        make_codec("hash")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", ["json", "msgpack", "msgpack+zlib"])
+async def test_redis_wrapper_round_trip(name):
+    # decode_responses=True 클라이언트에서도 바이너리 값 왕복
+    store = Redis(aioredis.FakeRedis(decode_responses=True), make_codec(name, AccountResponse, compress_threshold=10))
+    account = _account()
+    await store.set_with_ttl("codec:test", account, 60)
+    assert await store.get("codec:test") == account
+
+
+@pytest.mark.asyncio
+async def test_account_cache_with_msgpack_codec():
+    cache = AccountCache(codec=make_codec("msgpack", AccountResponse))
+    cache.bind(aioredis.FakeRedis(decode_responses=True))
+    account = _account()
+
+    async def load():
+        return account
+
+    assert await cache.get_or_load(account.user_uuid, load) == account
+    assert await cache.get_or_load(account.user_uuid, load) == account
+    stats = cache.stats()
+    assert (stats.hits, stats.loads, stats.errors) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_account_cache_treats_unreadable_value_as_miss():
+    client = aioredis.FakeRedis(decode_responses=True)
+    account = _account()
+
+    async def load():
+        return account
+
+    json_cache = AccountCache(codec=make_codec("json", AccountResponse))
+    json_cache.bind(client)
+    await json_cache.get_or_load(account.user_uuid, load)
+
+    # codec 변경 직후: 이전 형식 값은 미스로 보고 다시 채움
+    msgpack_cache = AccountCache(codec=make_codec("msgpack", AccountResponse))
+    msgpack_cache.bind(client)
+    assert await msgpack_cache.get_or_load(account.user_uuid, load) == account
+    assert msgpack_cache.stats().loads == 1
@@ -0,0 +1,53 @@
+# tests/test_refresh_token_store.py
+"""리프래시 토큰 회전: 동시 회전은 한 요청만 성공, 소비된 토큰 재사용은 거부"""
+
+# Standard library imports
+import asyncio
+from uuid import uuid4
+
+# Third-party imports
+import pytest
+from fakeredis import aioredis
+
+# App imports
+from app.service.auth.app.refresh_token_store import DatabaseRefreshTokenStore, RedisRefreshTokenStore
+from app.service.auth.core.security.refresh_token import RefreshTokenService
+
+refresh_token_service = RefreshTokenService(byte_length=32, expire_days=7)
+
+
+@pytest.mark.asyncio
+async def test_database_store_concurrent_rotation(app):
+    user_uuid = str(uuid4())
+    old = refresh_token_service.create_token(user_uuid)
+    async with app.state.async_session_maker() as db:
+        await DatabaseRefreshTokenStore(db).issue(old)
+
+    async def rotate() -> bool:
+        # 요청마다 별도 세션 (동시 요청과 같은 조건)
+        async with app.state.async_session_maker() as db:
+            store = DatabaseRefreshTokenStore(db)
+            return await store.rotate(old.token, user_uuid, refresh_token_service.create_token(user_uuid))
+
+    results = await asyncio.gather(rotate(), rotate())
+    assert sorted(results) == [False, True]
+
+    # 이미 소비된 토큰 재사용
+    assert await rotate() is False
+
+
+@pytest.mark.asyncio
+async def test_redis_store_concurrent_rotation():
+    store = RedisRefreshTokenStore(aioredis.FakeRedis(decode_responses=True))
+    user_uuid = str(uuid4())
+    old = refresh_token_service.create_token(user_uuid)
+    await store.issue(old)
+
+    async def rotate() -> bool:
+        return await store.rotate(old.token, user_uuid, refresh_token_service.create_token(user_uuid))
+
+    results = await asyncio.gather(rotate(), rotate())
+    assert sorted(results) == [False, True]
+
+    assert await rotate() is False
+    assert await store.get_owner(old.token) is None
@@ -0,0 +1,88 @@
+# tests/test_replica_routing.py
+"""
+primary / replica 라우팅 (/accounts/me)
+
+primary와 replica를 서로 다른 sqlite 파일로 두고 같은 계정을 다른 이름으로 저장해
+어느 쪽에서 읽었는지 확인
+"""
+
+# Standard library imports
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+# Third-party imports
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+# App imports
+from app.service.accounts.app import service
+from app.service.accounts.app.cache import account_cache
+from app.service.accounts.app.models import Account
+from app.shared.core.database import Base, RoutingSession
+from app.shared.tools.security_tools import AccessTokenPayload
+
+
+@pytest_asyncio.fixture
+async def databases(tmp_path):
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.sqlite3'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.sqlite3'}")
+    user_uuid = uuid4()
+    for engine, name in ((primary, "primary"), (replica, "replica")):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as db:
+            db.add(Account(user_uuid=user_uuid, user_name=name, email="a@example.com", linked_providers=[]))
+            await db.commit()
+
+    options = dict(expire_on_commit=False, class_=AsyncSession, sync_session_class=RoutingSession)
+    primary_maker = sessionmaker(bind=primary, info={"primary": primary.sync_engine}, **options)
+    read_maker = sessionmaker(
+        bind=primary,
+        info={"primary": primary.sync_engine, "replica": replica.sync_engine},
+        **options
+    )
+    yield user_uuid, primary_maker, read_maker
+    await primary.dispose()
+    await replica.dispose()
+
+
+async def _get_me(user_uuid, primary_maker, read_maker, route: dict):
+    request = SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(async_session_maker=primary_maker)),
+        state=SimpleNamespace(db_route=route),
+    )
+    now = int(time.time())
+    token_payload = AccessTokenPayload(sub=str(user_uuid), iat=now, exp=now + 60)
+    async with read_maker(info={"route": route}) as db:
+        return await service.get_current_user(request, db, token_payload)
+
+
+@pytest.mark.asyncio
+async def test_uncached_read_uses_replica(databases):
+    account_cache.bind(None)
+    account = await _get_me(*databases, route={"pinned": False})
+    assert account.user_name == "replica"
+
+
+@pytest.mark.asyncio
+async def test_pinned_request_reads_primary(databases):
+    account_cache.bind(None)
+    account = await _get_me(*databases, route={"pinned": True})
+    assert account.user_name == "primary"
+
+
+@pytest.mark.asyncio
+async def test_cache_fill_reads_primary(databases):
+    account_cache.bind(aioredis.FakeRedis(decode_responses=True))
+    try:
+        account = await _get_me(*databases, route={"pinned": False})
+        assert account.user_name == "primary"
+        # 채워진 캐시도 primary 값
+        account = await _get_me(*databases, route={"pinned": False})
+        assert account.user_name == "primary"
+    finally:
+        account_cache.bind(None)
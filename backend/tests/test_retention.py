@@ -0,0 +1,52 @@
+# tests/test_retention.py
+"""보존 정리: 비활성 리프래시 토큰은 비활성화 시각 기준으로 유예 후 삭제"""
+
+# Standard library imports
+import os
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+# Third-party imports
+import pytest
+from sqlalchemy import select
+
+# App imports
+from app.service.auth.app.models import AuthRefreshToken
+from app.service.auth.app.retention import TokenRetention
+
+
+def _row(created_hours_ago: int, deactivated_hours_ago: int | None, expires_in_hours: int = 24 * 7) -> AuthRefreshToken:
+    now = datetime.now(timezone.utc)
+    return AuthRefreshToken(
+        refresh_token=os.urandom(32),
+        user_uuid=uuid4(),
+        created_at=now - timedelta(hours=created_hours_ago),
+        expires_at=now + timedelta(hours=expires_in_hours),
+        is_active=deactivated_hours_ago is None,
+        deactivated_at=None if deactivated_hours_ago is None else now - timedelta(hours=deactivated_hours_ago),
+    )
+
+
+@pytest.mark.asyncio
+async def test_inactive_tokens_kept_until_retention_after_deactivation(app):
+    rows = {
+        "recently_rotated": _row(created_hours_ago=48, deactivated_hours_ago=1),
+        "rotated_long_ago": _row(created_hours_ago=72, deactivated_hours_ago=48),
+        "active": _row(created_hours_ago=48, deactivated_hours_ago=None),
+        "expired": _row(created_hours_ago=24 * 8, deactivated_hours_ago=None, expires_in_hours=-1),
+    }
+    async with app.state.async_session_maker() as db:
+        db.add_all(rows.values())
+        await db.commit()
+
+    retention = TokenRetention(app.state.db_engine, inactive_retention=timedelta(hours=24))
+    await retention.run()
+    assert retention.stats().failures == 0
+
+    async with app.state.async_session_maker() as db:
+        remaining = set((await db.execute(
+            select(AuthRefreshToken.refresh_token).where(
+                AuthRefreshToken.refresh_token.in_([row.refresh_token for row in rows.values()])
+            )
+        )).scalars())
+    assert {name for name, row in rows.items() if row.refresh_token in remaining} == {"recently_rotated", "active"}
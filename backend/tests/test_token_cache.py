@@ -0,0 +1,63 @@
+# tests/test_token_cache.py
+"""검증된 액세스 토큰 payload 캐시 (get_token)"""
+
+# Standard library imports
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+# Third-party imports
+import pytest
+
+# App imports
+from app.shared.tools.security_tools import AccessTokenPayload, InvalidTokenError, get_token
+from app.shared.tools.token_cache import AccessTokenCache
+
+
+def _payload(exp: int) -> AccessTokenPayload:
+    now = int(time.time())
+    return AccessTokenPayload(sub="user", iat=now, exp=exp, jti="jti-1")
+
+
+def test_expired_entry_is_not_served():
+    cache = AccessTokenCache(maxsize=10)
+    cache.put("token", _payload(int(time.time()) - 1), int(time.time()) - 1, key_version=1)
+
+    assert cache.get("token", 1) is None
+    assert cache.stats().hits == 0
+
+
+def test_generation_change_flushes_cache():
+    cache = AccessTokenCache(maxsize=10)
+    exp = int(time.time()) + 60
+    cache.put("token", _payload(exp), exp, key_version=1)
+    assert cache.get("token", 1) is not None
+
+    assert cache.get("token", 2) is None
+    stats = cache.stats()
+    assert stats.flushes == 1
+    assert stats.size == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_still_checks_revocation():
+    exp = int(time.time()) + 60
+    cache = AccessTokenCache(maxsize=10)
+    cache.put("token", _payload(exp), exp, key_version=7)
+
+    revocation_list = SimpleNamespace(is_revoked=mock.AsyncMock(return_value=True))
+    request = SimpleNamespace(
+        cookies={"access_token": "token"},
+        app=SimpleNamespace(state=SimpleNamespace(
+            # 캐시 적중이면 서명 검증(verification_material)을 거치지 않음
+            jwt_manager=SimpleNamespace(generation=7),
+            revocation_list=revocation_list,
+        )),
+    )
+
+    with mock.patch("app.shared.tools.security_tools.access_token_cache", cache):
+        with pytest.raises(InvalidTokenError):
+            await get_token(request, response=None, db=None)
+
+    assert cache.stats().hits == 1
+    revocation_list.is_revoked.assert_awaited_once_with("jti-1")